@@ -0,0 +1,110 @@
+"""Measure the per-step cost of `apply_writes` against the number of state keys.
+
+Builds a graph with `--keys` int keys and one node writing a single key, and
+times `apply_writes` for a step of that node, as the Pregel loop calls it with
+the channels to notify precomputed by `get_reactive_channels`, and as before they
+were, notifying every channel of the empty step and of finish. Also reports the
+time of a full `invoke` of the graph, so that the fixed cost per step on small
+graphs is tracked too, not only the scaling on large ones.
+
+Usage: python bench/apply_writes.py [--keys N [N ...]] [--steps N] [--repeat N]
+"""
+
+import argparse
+import operator
+import time
+from typing import Annotated, Any
+
+from langgraph.graph import START, StateGraph
+from langgraph.pregel._algo import (
+    PregelTaskWrites,
+    ReactiveChannels,
+    apply_writes,
+    get_reactive_channels,
+    increment,
+)
+from langgraph.pregel._checkpoint import channels_from_checkpoint, empty_checkpoint
+from typing_extensions import TypedDict
+
+
+def build(keys: int) -> Any:
+    # half plain keys, half reduced ones, like typical state schemas
+    fields = {
+        f"k{i}": Annotated[int, operator.add] if i % 2 else int for i in range(keys)
+    }
+    State = TypedDict("State", fields)  # type: ignore[misc]
+    builder = StateGraph(State)
+    builder.add_node("node", lambda state: {"k0": state["k0"] + 1})
+    builder.add_edge(START, "node")
+    return builder.compile()
+
+
+def time_apply_writes(graph: Any, steps: int, repeat: int, notify_all: bool) -> float:
+    """Best time per step, in microseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        checkpoint = empty_checkpoint()
+        channels, _ = channels_from_checkpoint(graph.channels, checkpoint)
+        if notify_all:
+            reactive = ReactiveChannels(list(channels), list(channels))
+        else:
+            reactive = get_reactive_channels(channels)
+        tasks = [
+            PregelTaskWrites(
+                ("__pregel_pull", "node"), "node", [("k0", i)], ["branch:to:node"]
+            )
+            for i in range(steps)
+        ]
+        start = time.perf_counter()
+        for task in tasks:
+            apply_writes(
+                checkpoint,
+                channels,
+                [task],
+                increment,
+                graph.trigger_to_nodes,
+                reactive,
+            )
+        best = min(best, time.perf_counter() - start)
+    return best / steps * 1e6
+
+
+def time_invoke(graph: Any, keys: int, steps: int, repeat: int) -> float:
+    """Best time per invoke, in microseconds."""
+    state = {f"k{i}": 0 for i in range(keys)}
+    runs = max(steps // 10, 1)
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(runs):
+            graph.invoke(state)
+        best = min(best, time.perf_counter() - start)
+    return best / runs * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--keys", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--steps", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(
+        f"{'keys':>6} {'notify all us':>14} {'reactive us':>12} "
+        f"{'speedup':>8} {'invoke us':>10}"
+    )
+    for keys in args.keys:
+        graph = build(keys)
+        all_us = time_apply_writes(graph, args.steps, args.repeat, notify_all=True)
+        reactive_us = time_apply_writes(
+            graph, args.steps, args.repeat, notify_all=False
+        )
+        invoke_us = time_invoke(graph, keys, args.steps, args.repeat)
+        print(
+            f"{keys:>6} {all_us:>14.1f} {reactive_us:>12.1f} "
+            f"{all_us / reactive_us:>7.1f}x {invoke_us:>10.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
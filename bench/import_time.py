@@ -0,0 +1,100 @@
+"""Measure the import time of langgraph with `python -X importtime`, against a budget.
+
+Runs the import in fresh interpreters and reports the median total import time,
+the time spent in langgraph's own modules, and the slowest modules imported.
+Exits with status 1 if langgraph's own modules take longer than the budget, or
+if a module that should only be imported on first use is imported eagerly.
+
+Most of the total is the import of `langchain_core` (runnables and callbacks,
+which import `langsmith`), needed to compile and run any graph, so the budget
+only covers the modules of langgraph itself. Run it with bytecode caches enabled,
+i.e. without PYTHONDONTWRITEBYTECODE, or the budget covers compiling the modules.
+
+Usage: python bench/import_time.py [--stmt STMT] [--runs N] [--budget-ms MS] [--top N]
+"""
+
+import argparse
+import re
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+
+STMT = "from langgraph.graph import StateGraph"
+# milliseconds spent in langgraph modules, without the modules they import
+BUDGET_MS = 100.0
+# only imported when used, e.g. by get_graph() or stream_mode="messages"
+LAZY_MODULES = (
+    "langchain_core.runnables.graph",
+    "langgraph.graph.message",
+    "langgraph.pregel._batching",
+    "langgraph.pregel._draw",
+    "langgraph.pregel._messages",
+)
+
+LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def importtime(stmt: str) -> list[tuple[str, int, int, int]]:
+    """Import times of a run of `stmt`, as (module, self us, cumulative us, depth)."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", stmt],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    rows = []
+    for line in proc.stderr.splitlines():
+        if match := LINE.match(line):
+            self_us, cumulative_us, indent, module = match.groups()
+            rows.append((module, int(self_us), int(cumulative_us), len(indent)))
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--stmt", default=STMT)
+    parser.add_argument("--runs", type=int, default=9)
+    parser.add_argument("--budget-ms", type=float, default=BUDGET_MS)
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    if sys.flags.dont_write_bytecode:
+        print("warning: bytecode caches are disabled, timings include compiling")
+    # the first run writes the bytecode caches, if it can
+    importtime(args.stmt)
+    totals: list[float] = []
+    own: list[float] = []
+    cumulative: dict[str, list[int]] = defaultdict(list)
+    for _ in range(args.runs):
+        rows = importtime(args.stmt)
+        totals.append(sum(c for _, _, c, depth in rows if depth == 1) / 1000)
+        own.append(
+            sum(s for m, s, _, _ in rows if m.split(".")[0] == "langgraph") / 1000
+        )
+        for module, _, c, _ in rows:
+            cumulative[module].append(c)
+    eager = sorted(m for m in LAZY_MODULES if m in cumulative)
+
+    print(f"{args.stmt!r}, median of {args.runs} runs")
+    print(f"{'total':<40} {statistics.median(totals):>9.1f} ms")
+    print(f"{'langgraph modules':<40} {statistics.median(own):>9.1f} ms")
+    print(f"\n{'slowest modules (cumulative)':<40} {'ms':>9}")
+    slowest = sorted(
+        cumulative.items(), key=lambda item: statistics.median(item[1]), reverse=True
+    )
+    for module, times in slowest[: args.top]:
+        print(f"{module:<40} {statistics.median(times) / 1000:>9.1f}")
+
+    failed = False
+    if statistics.median(own) > args.budget_ms:
+        print(f"\nlanggraph modules over budget of {args.budget_ms:.1f} ms")
+        failed = True
+    if eager:
+        print(f"\nimported eagerly: {', '.join(eager)}")
+        failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
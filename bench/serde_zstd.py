@@ -0,0 +1,76 @@
+"""Compare checkpoint payload sizes and serialization time with and without zstd.
+
+Usage: python bench/serde_zstd.py [--turns N] [--repeat N]
+"""
+
+import argparse
+import random
+import time
+
+from langchain_core.messages import AIMessage, HumanMessage
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+from langgraph.checkpoint.serde.zstd import ZstdSerializer
+
+WORDS = (
+    "the essay argues that language models can evaluate writing quality but "
+    "scores depend on clarity depth of analysis and the structure of arguments "
+    "which a reviewer should weigh against grammar vocabulary and tone"
+).split()
+
+
+def conversation(turns: int, rng: random.Random) -> list:
+    messages = []
+    for i in range(turns):
+        messages.append(HumanMessage(" ".join(rng.choices(WORDS, k=30)), id=f"h{i}"))
+        messages.append(AIMessage(" ".join(rng.choices(WORDS, k=120)), id=f"a{i}"))
+    return messages
+
+
+def measure(serde, values: list, repeat: int) -> tuple[int, float, float]:
+    blobs = [serde.dumps_typed(v) for v in values]
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for v in values:
+            serde.dumps_typed(v)
+    dumps = (time.perf_counter() - start) / repeat
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for blob in blobs:
+            serde.loads_typed(blob)
+    loads = (time.perf_counter() - start) / repeat
+    return sum(len(blob[1]) for blob in blobs), dumps, loads
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--turns", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    # one value per turn, as the messages channel grows over a conversation
+    full = conversation(args.turns, rng)
+    values = [full[: 2 * (i + 1)] for i in range(args.turns)]
+    samples = [conversation(rng.randint(1, 4), rng) for _ in range(500)]
+    dictionary = ZstdSerializer.train_dictionary(samples, dict_size=32 * 1024)
+
+    serdes = {
+        "jsonplus": JsonPlusSerializer(),
+        "zstd-1": ZstdSerializer(level=1),
+        "zstd-3": ZstdSerializer(),
+        "zstd-9": ZstdSerializer(level=9),
+        "zstd-3+dict": ZstdSerializer(dictionaries=[dictionary]),
+    }
+    baseline = None
+    print(f"{'serde':<12} {'bytes':>10} {'ratio':>7} {'dumps ms':>9} {'loads ms':>9}")
+    for name, serde in serdes.items():
+        size, dumps, loads = measure(serde, values, args.repeat)
+        baseline = baseline or size
+        print(
+            f"{name:<12} {size:>10} {baseline / size:>6.1f}x "
+            f"{dumps * 1000:>9.2f} {loads * 1000:>9.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
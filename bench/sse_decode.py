@@ -0,0 +1,126 @@
+"""Compare the throughput of the SSE decoders of langgraph_sdk on a recorded stream.
+
+Decodes a stream with `BytesLineDecoder` and `SSEDecoder`, as the SDK client used
+to, and with `ChunkedSSEDecoder`, checks that they produce the same events, and
+reports events and megabytes per second for each. The stream is read from
+`--file`, e.g. the body of a `stream_mode="messages"` run saved with
+`curl -N ... > stream.txt`, or else recorded from a synthetic run of token
+messages. It is cut into chunks of `--chunk-size` bytes, or into one chunk per
+event with `--chunk-size 0`, as a server flushing each event sends it.
+
+Usage: python bench/sse_decode.py [--file PATH] [--events N] [--chunk-size N] [--repeat N]
+"""
+
+import argparse
+import random
+import time
+
+import orjson
+from langgraph_sdk.sse import BytesLineDecoder, ChunkedSSEDecoder, SSEDecoder
+
+WORDS = (
+    "the essay argues that language models can evaluate writing quality but "
+    "scores depend on clarity depth of analysis and the structure of arguments"
+).split()
+
+
+def record(events: int, rng: random.Random) -> bytes:
+    """A stream of `messages` events, one token per event, like a chat model run."""
+    out = bytearray()
+    run_id = "1ef8e2c4-7d7c-6d5e-8a1b-3a9f0c2d4e6f"
+    for i in range(events):
+        chunk = {
+            "content": f" {rng.choice(WORDS)}",
+            "additional_kwargs": {},
+            "response_metadata": {},
+            "type": "AIMessageChunk",
+            "name": None,
+            "id": f"run-{run_id}",
+            "tool_calls": [],
+            "tool_call_chunks": [],
+        }
+        metadata = {
+            "langgraph_step": 2,
+            "langgraph_node": "generate_content",
+            "langgraph_triggers": ["branch:to:generate_content"],
+            "langgraph_checkpoint_ns": f"generate_content:{run_id}",
+            "ls_provider": "openai",
+            "ls_model_name": "llama-3.3-70b-versatile",
+        }
+        out += b"event: messages\n"
+        out += b"data: " + orjson.dumps([chunk, metadata]) + b"\n"
+        out += f"id: {i}\n\n".encode()
+    return bytes(out)
+
+
+def split(stream: bytes, chunk_size: int) -> list[bytes]:
+    if chunk_size > 0:
+        return [
+            stream[i : i + chunk_size] for i in range(0, len(stream), chunk_size)
+        ]
+    events = stream.split(b"\n\n")
+    return [event + b"\n\n" for event in events[:-1]] + ([events[-1]] * bool(events[-1]))
+
+
+def decode_lines(chunks: list[bytes]) -> list:
+    lines = BytesLineDecoder()
+    decoder = SSEDecoder()
+    parts = []
+    for chunk in chunks:
+        for line in lines.decode(chunk):
+            if (part := decoder.decode(bytes(line).rstrip(b"\n"))) is not None:
+                parts.append(part)
+    for line in lines.flush():
+        if (part := decoder.decode(bytes(line).rstrip(b"\n"))) is not None:
+            parts.append(part)
+    if (part := decoder.decode(b"")) is not None:
+        parts.append(part)
+    return [part for part in parts if part.event or part.data is not None]
+
+
+def decode_chunks(chunks: list[bytes]) -> list:
+    decoder = ChunkedSSEDecoder()
+    parts = []
+    for chunk in chunks:
+        parts.extend(decoder.decode(chunk))
+    parts.extend(decoder.flush())
+    return [part for part in parts if part.event or part.data is not None]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--file")
+    parser.add_argument("--events", type=int, default=20_000)
+    parser.add_argument("--chunk-size", type=int, default=4096)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    if args.file:
+        with open(args.file, "rb") as f:
+            stream = f.read()
+    else:
+        stream = record(args.events, random.Random(0))
+    chunks = split(stream, args.chunk_size)
+    expected = decode_lines(chunks)
+    if decode_chunks(chunks) != expected:
+        raise SystemExit("the decoders produced different events")
+
+    print(f"{len(expected)} events, {len(stream) / 1e6:.1f} MB, {len(chunks)} chunks")
+    print(f"{'decoder':<36} {'events/s':>12} {'MB/s':>8}")
+    for name, decode in (
+        ("BytesLineDecoder + SSEDecoder", decode_lines),
+        ("ChunkedSSEDecoder", decode_chunks),
+    ):
+        best = float("inf")
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            decode(chunks)
+            best = min(best, time.perf_counter() - start)
+        print(
+            f"{name:<36} {len(expected) / best:>12,.0f} "
+            f"{len(stream) / 1e6 / best:>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,14 @@
 from typing import Literal, TypedDict
 from langgraph.graph import StateGraph, START, END 
+from langgraph.config import get_stream_writer
 from langchain_openai import ChatOpenAI 
 from dotenv import load_dotenv
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 from langchain_core.output_parsers import PydanticOutputParser
+from contextlib import closing
+import jiter
 import os
+import time
 
 load_dotenv()
 
@@ -34,12 +38,41 @@ class ReviewState(TypedDict):
     diagnosis: dict
     response:str
 
+def stream_field(prompt, parser, field):
+    """Stream the completion and return the value of `field` as soon as it validates.
+
+    The partial JSON is parsed with jiter after every chunk; incomplete strings
+    are left out, so a value is only seen once it has been fully generated. The
+    rest of the generation is cancelled by closing the stream.
+    """
+    field_type = TypeAdapter(parser.pydantic_object.model_fields[field].annotation)
+    text = ""
+    with closing(structured_model.stream(prompt)) as stream:
+        for chunk in stream:
+            text += chunk.content
+            # skip a ```json fence or any text before the object
+            if (start := text.find("{")) == -1:
+                continue
+            try:
+                partial = jiter.from_json(text[start:].encode(), partial_mode="on")
+            except ValueError:
+                continue
+            if field in partial:
+                try:
+                    return field_type.validate_python(partial[field])
+                except ValueError:
+                    pass
+    # the field never validated on its own, parse the full completion
+    return getattr(parser.parse(text), field)
+
 def find_sentiment(state: ReviewState)-> ReviewState:
     prompt = f"""What is the sentiment of the following review \n {state['review_text']}
     \n{parser.get_format_instructions()}"""
-    response = structured_model.invoke(prompt)
-    response = parser.parse(response.content)
-    return {'sentiment': response.sentiment}
+    start = time.perf_counter()
+    sentiment = stream_field(prompt, parser, "sentiment")
+    # reported with the run's custom stream events, it isn't part of the review
+    get_stream_writer()({'time_to_route': time.perf_counter() - start})
+    return {'sentiment': sentiment}
 
 def router(state: ReviewState) -> Literal["run_diagnosis", "positive_response"]:
     if state['sentiment'].lower() == "positive":
@@ -91,10 +124,16 @@ initial_state = {
     Customer care took too long to respond and offered no helpful solution.'''
 }
 
-final_state = workflow.invoke(initial_state)
+final_state, time_to_route = None, None
+for mode, chunk in workflow.stream(initial_state, stream_mode=["values", "custom"]):
+    if mode == "values":
+        final_state = chunk
+    elif "time_to_route" in chunk:
+        time_to_route = chunk["time_to_route"]
 
 if __name__ == "__main__":
     print("Review Sentiment:", final_state['sentiment'])
+    print(f"Time to route: {time_to_route:.2f}s")
     print("ChatSupport response:", final_state['response'])
     #print("Diagnosis information:", final_state['diagnosis'])
     print("Diagnosis information:", final_state.get('diagnosis', "No diagnosis needed"))
@@ -6,8 +6,10 @@ from pydantic import BaseModel, Field
 
 from langchain_core.output_parsers import PydanticOutputParser
 
+import asyncio
 import operator
 import os
+import sys
 
 load_dotenv()
 
@@ -36,44 +38,44 @@ class EssayState(TypedDict):
     individual_scores : Annotated[list[int], operator.add]
     avg_score : float
 
-def evaluate_language(state: EssayState) -> EssayState:
+async def evaluate_language(state: EssayState) -> EssayState:
     essay_text = state['essay_text']
     prompt = f"""Provide feedback on the language used in the following essay and provide a score out of 10:\n
     {essay_text}\n
     {parser.get_format_instructions()}"""
-    response = structured_model.invoke(prompt)
+    response = await structured_model.ainvoke(prompt)
     response = parser.parse(response.content)
     return {'language_feedback':response.feedback,
             'individual_scores':[response.score]} 
 
-def evaluate_analysis(state: EssayState) -> EssayState:
+async def evaluate_analysis(state: EssayState) -> EssayState:
     essay_text = state['essay_text']
     prompt = f"""Provide feedback on the analysis in the following essay and provide a score out of 10:\n
     {essay_text}\n
     {parser.get_format_instructions()}"""
-    response = structured_model.invoke(prompt)
+    response = await structured_model.ainvoke(prompt)
     response = parser.parse(response.content)
     return {'analysis_feedback':response.feedback,
             'individual_scores':[response.score]} 
 
-def evaluate_thought_clarity(state: EssayState) -> EssayState:
+async def evaluate_thought_clarity(state: EssayState) -> EssayState:
     essay_text = state['essay_text']
     prompt = f"""Provide feedback on the thought clarity in the following essay and provide a score out of 10:\n
     {essay_text}\n
     {parser.get_format_instructions()}"""
-    response = structured_model.invoke(prompt)
+    response = await structured_model.ainvoke(prompt)
     response = parser.parse(response.content)
     return {'thought_clarity_feedback':response.feedback,
             'individual_scores':[response.score]} 
 
-def final_evaluation(state: EssayState) -> EssayState:
+async def final_evaluation(state: EssayState) -> EssayState:
     combined = f"""
 Language Feedback - {state['language_feedback']}\n
 Analysis Feedback - {state['analysis_feedback']}\n
 Thought Clarity Feedback - {state['thought_clarity_feedback']}\n
 """
     prompt = f"Based on the following feedback create a summarised feedback:\n{combined}"
-    summary_feedback = model.invoke(prompt).content
+    summary_feedback = (await model.ainvoke(prompt)).content
     avg_score = sum(state['individual_scores']) / len(state['individual_scores'])
     return {"summary_feedback": summary_feedback, 
             "avg_score": avg_score}
@@ -101,7 +103,25 @@ graph.add_edge('join', 'final_evaluation')
 
 graph.add_edge('final_evaluation', END)
 
-workflow = graph.compile()
+# Each run evaluates language, analysis and clarity with three model calls
+# awaited together. max_concurrency=8 limits the nodes of one run, not the
+# number of essays evaluated at once, see evaluate_essays.
+workflow = graph.compile().with_config(max_concurrency=8)
+
+
+async def evaluate_essays(essays: list[str], max_in_flight: int = 100) -> list[EssayState]:
+    """Evaluate many essays concurrently from one event loop.
+
+    At most `max_in_flight` essays are evaluated at once, each run keeping the
+    node limit of `workflow`.
+    """
+    semaphore = asyncio.Semaphore(max_in_flight)
+
+    async def evaluate(essay_text: str) -> EssayState:
+        async with semaphore:
+            return await workflow.ainvoke({'essay_text': essay_text})
+
+    return await asyncio.gather(*(evaluate(essay_text) for essay_text in essays))
 
 essay = """**The Rise of Corruption in India**
 
@@ -148,8 +168,19 @@ initial_state = {
     'essay_text': essay
 }
 
-final_state = workflow.invoke(initial_state)
-
 if __name__ == "__main__":
+    # python essay_evaluator_parallel.py essays/*.txt also scores the given files,
+    # along with the sample essay, on the same event loop
+    paths = sys.argv[1:]
+    essays = []
+    for path in paths:
+        with open(path) as f:
+            essays.append(f.read())
+    final_state, *states = asyncio.run(
+        evaluate_essays([initial_state['essay_text'], *essays])
+    )
+
     print(final_state["summary_feedback"])
-    print(final_state["avg_score"])
\ No newline at end of file
+    print(final_state["avg_score"])
+    for path, state in zip(paths, states):
+        print(path, state["avg_score"])
\ No newline at end of file
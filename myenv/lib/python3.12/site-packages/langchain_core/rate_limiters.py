@@ -1,11 +1,28 @@
-"""Interface for a rate limiter and an in-memory rate limiter."""
+"""Interface for a rate limiter and its in-memory and shared implementations."""
 
 from __future__ import annotations
 
 import abc
 import asyncio
+import mmap
+import os
+import re
+import struct
 import threading
 import time
+import weakref
+from collections import deque
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any
+
+from langchain_core.callbacks.base import BaseCallbackHandler
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping, Sequence
+    from uuid import UUID
+
+    from langchain_core.messages import BaseMessage
+    from langchain_core.outputs import LLMResult
 
 
 class BaseRateLimiter(abc.ABC):
@@ -250,7 +267,629 @@ class InMemoryRateLimiter(BaseRateLimiter):
         return True
 
 
+class SharedMemoryRateLimiter(BaseRateLimiter):
+    """A rate limiter shared by the processes of a host, based on a token bucket.
+
+    Works like `InMemoryRateLimiter`, but the bucket is kept in a memory-mapped
+    file, so all the processes using the same file share one budget, e.g. the
+    workers of a web server each creating their own model. The bucket is updated
+    under an exclusive lock of the file, held only while reading and writing it.
+
+    Waiting requests sleep until the bucket holds a token, instead of checking
+    every `check_every_n_seconds`.
+
+    Current limitations:
+
+    - The processes must be on the same host, and the platform must support
+        `fcntl` file locks, i.e. not Windows.
+    - The rate and the bucket size are not stored in the file, so all the
+        processes should use the same.
+
+    Example:
+        ```python
+        from langchain_core.rate_limiters import SharedMemoryRateLimiter
+        from langchain_openai import ChatOpenAI
+
+        # /dev/shm keeps the file in memory on Linux
+        rate_limiter = SharedMemoryRateLimiter(
+            "/dev/shm/openai-rate-limiter",
+            requests_per_second=5,
+            max_bucket_size=10,
+        )
+
+        model = ChatOpenAI(rate_limiter=rate_limiter)
+        ```
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        requests_per_second: float = 1,
+        max_bucket_size: float = 1,
+    ) -> None:
+        """A rate limiter based on a token bucket kept in a file.
+
+        Args:
+            path: The file holding the bucket, created if it doesn't exist. The
+                processes sharing a budget must use the same file.
+            requests_per_second: The number of tokens to add per second to the bucket.
+                The tokens represent "credit" that can be used to make requests.
+            max_bucket_size: The maximum number of tokens that can be in the bucket.
+                Must be at least `1`. Used to prevent bursts of requests.
+        """
+        try:
+            import fcntl  # noqa: PLC0415
+        except ImportError as e:
+            msg = "SharedMemoryRateLimiter requires fcntl file locks, not on Windows"
+            raise NotImplementedError(msg) from e
+        if requests_per_second <= 0:
+            msg = "requests_per_second must be positive"
+            raise ValueError(msg)
+        if max_bucket_size < 1:
+            msg = "max_bucket_size must be at least 1"
+            raise ValueError(msg)
+        self._fcntl = fcntl
+        self.path = os.fspath(path)
+        self.requests_per_second = requests_per_second
+        self.max_bucket_size = max_bucket_size
+        # The file is opened by each process, as forked processes would share the
+        # lock of an inherited file.
+        self._pid: int | None = None
+        self._fd = -1
+        self._mmap: mmap.mmap | None = None
+        # The file lock doesn't exclude the threads of a process. It's replaced
+        # in forked processes, as another thread may have held it when forking.
+        self._lock = threading.Lock()
+        _SHARED_MEMORY_RATE_LIMITERS.add(self)
+        self._open()
+
+    def _open(self) -> mmap.mmap:
+        if self._pid == os.getpid() and self._mmap is not None:
+            return self._mmap
+        inherited = self._fd, self._mmap
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        self._fcntl.flock(fd, self._fcntl.LOCK_EX)
+        try:
+            if os.fstat(fd).st_size < _BUCKET.size:
+                os.ftruncate(fd, _BUCKET.size)
+            buffer = mmap.mmap(fd, _BUCKET.size)
+            if _BUCKET.unpack_from(buffer)[0] != _BUCKET_MAGIC:
+                # start empty to avoid a burst, like InMemoryRateLimiter
+                _BUCKET.pack_into(buffer, 0, _BUCKET_MAGIC, 0.0, time.monotonic())
+        finally:
+            self._fcntl.flock(fd, self._fcntl.LOCK_UN)
+        self._pid, self._fd, self._mmap = os.getpid(), fd, buffer
+        # the parent process keeps its own copies open
+        if inherited[1] is not None:
+            inherited[1].close()
+        if inherited[0] >= 0:
+            os.close(inherited[0])
+        return buffer
+
+    def _consume(self) -> float:
+        """Try to consume a token.
+
+        Returns:
+            `0` if a token was consumed, and the caller can proceed to make the
+            request, otherwise the number of seconds until a token is available.
+        """
+        with self._lock:
+            buffer = self._open()
+            self._fcntl.flock(self._fd, self._fcntl.LOCK_EX)
+            try:
+                _, available, last = _BUCKET.unpack_from(buffer)
+                # monotonic clocks are shared by the processes of a host
+                now = time.monotonic()
+                available = min(
+                    self.max_bucket_size,
+                    available + max(now - last, 0) * self.requests_per_second,
+                )
+                if available >= 1:
+                    available -= 1
+                    wait = 0.0
+                else:
+                    wait = (1 - available) / self.requests_per_second
+                _BUCKET.pack_into(buffer, 0, _BUCKET_MAGIC, available, now)
+            finally:
+                self._fcntl.flock(self._fd, self._fcntl.LOCK_UN)
+        return wait
+
+    def acquire(self, *, blocking: bool = True) -> bool:
+        """Attempt to acquire a token from the rate limiter.
+
+        This method blocks until the required tokens are available if `blocking`
+        is set to `True`.
+
+        If `blocking` is set to `False`, the method will immediately return the result
+        of the attempt to acquire the tokens.
+
+        Args:
+            blocking: If `True`, the method will block until the tokens are available.
+                If `False`, the method will return immediately with the result of
+                the attempt.
+
+        Returns:
+            `True` if the tokens were successfully acquired, `False` otherwise.
+        """
+        while wait := self._consume():
+            if not blocking:
+                return False
+            time.sleep(wait)
+        return True
+
+    async def aacquire(self, *, blocking: bool = True) -> bool:
+        """Attempt to acquire a token from the rate limiter. Async version.
+
+        This method blocks until the required tokens are available if `blocking`
+        is set to `True`.
+
+        If `blocking` is set to `False`, the method will immediately return the result
+        of the attempt to acquire the tokens.
+
+        Args:
+            blocking: If `True`, the method will block until the tokens are available.
+                If `False`, the method will return immediately with the result of
+                the attempt.
+
+        Returns:
+            `True` if the tokens were successfully acquired, `False` otherwise.
+        """
+        while wait := self._consume():
+            if not blocking:
+                return False
+            await asyncio.sleep(wait)
+        return True
+
+
+# The bucket of SharedMemoryRateLimiter: a marker, the available tokens and the
+# time it was last updated.
+_BUCKET = struct.Struct("<Qdd")
+_BUCKET_MAGIC = 0x4C43524C494D0001
+
+_SHARED_MEMORY_RATE_LIMITERS: weakref.WeakSet[SharedMemoryRateLimiter] = (
+    weakref.WeakSet()
+)
+
+
+def _reset_after_fork() -> None:
+    for limiter in _SHARED_MEMORY_RATE_LIMITERS:
+        limiter._lock = threading.Lock()  # noqa: SLF001
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+class _Waiter:
+    """A call of `acquire` or `aacquire` waiting for its turn."""
+
+    __slots__ = ("tokens", "event", "loop", "future")
+
+    def __init__(
+        self, tokens: int, loop: asyncio.AbstractEventLoop | None = None
+    ) -> None:
+        self.tokens = tokens
+        self.event = threading.Event() if loop is None else None
+        self.loop = loop
+        self.future: asyncio.Future[None] | None = None
+
+    def wake(self) -> None:
+        if self.event is not None:
+            self.event.set()
+        elif self.future is not None and self.loop is not None:
+            try:
+                self.loop.call_soon_threadsafe(_set_done, self.future)
+            except RuntimeError:
+                # the loop is closed
+                pass
+
+
+def _set_done(future: asyncio.Future[None]) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class TokenRateLimiter(BaseRateLimiter, BaseCallbackHandler):
+    """An in memory rate limiter for both requests and LLM tokens per minute.
+
+    Providers such as OpenAI and Groq limit the requests and the tokens sent to a
+    model per minute. This limiter keeps a bucket for each, refilled continuously
+    up to the per-minute limit. Each request consumes one request and the
+    estimated number of tokens of its prompt, and waits until both are available.
+
+    To estimate the prompt, and to correct the estimate with the usage reported
+    in the response, the limiter is also a callback handler, so it must be passed
+    to the model both as `rate_limiter` and in `callbacks`. When a response
+    reports its usage, the difference with the estimate is refunded or charged.
+    When the response carries the `x-ratelimit-*` headers of the provider, e.g.
+    with `include_response_headers=True` on `ChatOpenAI`, the buckets are lowered
+    to the remaining requests and tokens reported by the provider, and requests
+    wait for the reset time it reports once either is used up. Requests that are
+    rejected with a 429 status wait for the `retry-after` time of the response.
+
+    Waiting requests are served in order. Only the first one sleeps, until its
+    tokens are due, and it wakes the next one once it proceeds, so waiting doesn't
+    poll.
+
+    It is thread safe and can be used in either a sync or async context, but like
+    `InMemoryRateLimiter` it cannot rate limit across different processes.
+
+    Example:
+        ```python
+        from langchain_core.rate_limiters import TokenRateLimiter
+        from langchain_openai import ChatOpenAI
+
+        rate_limiter = TokenRateLimiter(
+            requests_per_minute=30,
+            tokens_per_minute=6_000,
+        )
+
+        model = ChatOpenAI(
+            model="llama-3.1-8b-instant",
+            base_url="https://api.groq.com/openai/v1",
+            rate_limiter=rate_limiter,
+            callbacks=[rate_limiter],
+            include_response_headers=True,
+        )
+        ```
+    """
+
+    # only LLM events are needed
+    run_inline = True
+    ignore_chain = True
+    ignore_agent = True
+    ignore_retriever = True
+    ignore_retry = True
+    ignore_custom_event = True
+
+    def __init__(
+        self,
+        *,
+        requests_per_minute: float,
+        tokens_per_minute: float,
+        estimate_tokens: Callable[[Sequence[BaseMessage | str]], int] | None = None,
+    ) -> None:
+        """A rate limiter for both requests and LLM tokens per minute.
+
+        Args:
+            requests_per_minute: The number of requests allowed per minute.
+            tokens_per_minute: The number of prompt and completion tokens allowed
+                per minute.
+            estimate_tokens: A function estimating the number of tokens of the
+                messages of a prompt. Defaults to `count_tokens_approximately`.
+        """
+        if requests_per_minute <= 0 or tokens_per_minute <= 0:
+            msg = "requests_per_minute and tokens_per_minute must be positive"
+            raise ValueError(msg)
+        if estimate_tokens is None:
+            from langchain_core.messages.utils import (  # noqa: PLC0415
+                count_tokens_approximately,
+            )
+
+            estimate_tokens = count_tokens_approximately
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.estimate_tokens = estimate_tokens
+
+        # The buckets start full, like the limits of the provider.
+        self.available_requests = float(requests_per_minute)
+        self.available_tokens = float(tokens_per_minute)
+        # Requests wait until then, after the provider reported a limit was hit.
+        self.paused_until = 0.0
+
+        self._lock = threading.Lock()
+        self._last = time.monotonic()
+        self._waiters: deque[_Waiter] = deque()
+        # Estimates of the prompts started in this context and not sent yet, as
+        # (run_id, tokens), taken in order by `acquire`.
+        self._pending: ContextVar[deque[tuple[UUID, int]] | None] = ContextVar(
+            f"token_rate_limiter_{id(self)}", default=None
+        )
+        # Tokens charged for each run sent, and when, until its usage is known,
+        # in the order they were charged.
+        self._charged: dict[UUID, tuple[int, float]] = {}
+
+    # rate limiter
+
+    def acquire(self, *, blocking: bool = True) -> bool:
+        """Wait until a request and the tokens of its prompt are available.
+
+        Args:
+            blocking: If `True`, the method will block until the tokens are available.
+                If `False`, the method will return immediately with the result of
+                the attempt.
+
+        Returns:
+            `True` if the tokens were successfully acquired, `False` otherwise.
+        """
+        run_id, tokens = self._next_estimate()
+        waiter = _Waiter(tokens)
+        with self._lock:
+            if not self._waiters and self._consume(run_id, tokens):
+                return True
+            if not blocking:
+                self._put_back(run_id, tokens)
+                return False
+            self._waiters.append(waiter)
+        assert waiter.event is not None
+        try:
+            while True:
+                with self._lock:
+                    if self._waiters[0] is waiter:
+                        if self._consume(run_id, tokens):
+                            self._waiters.popleft()
+                            self._wake_first()
+                            return True
+                        timeout: float | None = self._delay(tokens)
+                    else:
+                        timeout = None
+                    waiter.event.clear()
+                waiter.event.wait(timeout)
+        except BaseException:
+            self._leave(waiter)
+            raise
+
+    async def aacquire(self, *, blocking: bool = True) -> bool:
+        """Wait until a request and the tokens of its prompt are available.
+
+        Args:
+            blocking: If `True`, the method will block until the tokens are available.
+                If `False`, the method will return immediately with the result of
+                the attempt.
+
+        Returns:
+            `True` if the tokens were successfully acquired, `False` otherwise.
+        """
+        run_id, tokens = self._next_estimate()
+        loop = asyncio.get_running_loop()
+        waiter = _Waiter(tokens, loop)
+        with self._lock:
+            if not self._waiters and self._consume(run_id, tokens):
+                return True
+            if not blocking:
+                self._put_back(run_id, tokens)
+                return False
+            self._waiters.append(waiter)
+        try:
+            while True:
+                with self._lock:
+                    if self._waiters[0] is waiter:
+                        if self._consume(run_id, tokens):
+                            self._waiters.popleft()
+                            self._wake_first()
+                            return True
+                        timeout: float | None = self._delay(tokens)
+                    else:
+                        timeout = None
+                    waiter.future = future = loop.create_future()
+                await asyncio.wait([future], timeout=timeout)
+        except BaseException:
+            self._leave(waiter)
+            raise
+
+    def _next_estimate(self) -> tuple[UUID | None, int]:
+        if pending := self._pending.get():
+            try:
+                return pending.popleft()
+            except IndexError:
+                # taken by another thread sharing the context
+                pass
+        # the model wasn't given the limiter as a callback
+        return None, 0
+
+    def _put_back(self, run_id: UUID | None, tokens: int) -> None:
+        if run_id is not None and (pending := self._pending.get()) is not None:
+            pending.appendleft((run_id, tokens))
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._last
+        self._last = now
+        self.available_requests = min(
+            self.requests_per_minute,
+            self.available_requests + elapsed * self.requests_per_minute / 60,
+        )
+        self.available_tokens = min(
+            self.tokens_per_minute,
+            self.available_tokens + elapsed * self.tokens_per_minute / 60,
+        )
+
+    def _consume(self, run_id: UUID | None, tokens: int) -> bool:
+        """Take a request and `tokens` if available, with the lock held."""
+        now = time.monotonic()
+        self._refill(now)
+        # a prompt over the limit waits for a full bucket
+        needed = min(tokens, self.tokens_per_minute)
+        if (
+            now < self.paused_until
+            or self.available_requests < 1
+            or self.available_tokens < needed
+        ):
+            return False
+        self.available_requests -= 1
+        self.available_tokens -= tokens
+        if run_id is not None:
+            self._charged[run_id] = (tokens, now)
+        # forget the runs whose end was never reported, e.g. async calls
+        # cancelled while waiting for the response
+        while self._charged:
+            oldest = next(iter(self._charged))
+            if now - self._charged[oldest][1] < _MAX_CHARGE_AGE:
+                break
+            del self._charged[oldest]
+        return True
+
+    def _delay(self, tokens: int) -> float:
+        """Seconds until a request and `tokens` are available, with the lock held."""
+        needed = min(tokens, self.tokens_per_minute)
+        return max(
+            self.paused_until - self._last,
+            (1 - self.available_requests) * 60 / self.requests_per_minute,
+            (needed - self.available_tokens) * 60 / self.tokens_per_minute,
+            0,
+        )
+
+    def _wake_first(self) -> None:
+        if self._waiters:
+            self._waiters[0].wake()
+
+    def _leave(self, waiter: _Waiter) -> None:
+        with self._lock:
+            first = bool(self._waiters) and self._waiters[0] is waiter
+            try:
+                self._waiters.remove(waiter)
+            except ValueError:
+                pass
+            if first:
+                self._wake_first()
+
+    # callbacks
+
+    def on_llm_start(
+        self,
+        serialized: dict[str, Any],
+        prompts: list[str],
+        *,
+        run_id: UUID,
+        **kwargs: Any,
+    ) -> Any:
+        self._start(run_id, self.estimate_tokens(prompts))
+
+    def on_chat_model_start(
+        self,
+        serialized: dict[str, Any],
+        messages: list[list[BaseMessage]],
+        *,
+        run_id: UUID,
+        **kwargs: Any,
+    ) -> Any:
+        self._start(run_id, sum(self.estimate_tokens(m) for m in messages))
+
+    def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs: Any) -> Any:
+        self._discard_pending(run_id)
+        usage = _get_total_tokens(response)
+        headers = _get_headers(response)
+        with self._lock:
+            charged = self._charged.pop(run_id, None)
+            if charged is None or (usage is None and not headers):
+                # eg. a cached response
+                return
+            self._refill(time.monotonic())
+            if usage is not None:
+                self.available_tokens -= usage - charged[0]
+            if headers:
+                self._update(headers)
+            self._wake_first()
+
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> Any:
+        self._discard_pending(run_id)
+        with self._lock:
+            charged = self._charged.pop(run_id, None)
+            if charged is None or getattr(error, "status_code", None) != 429:
+                return
+            # the provider rejected the request without counting its tokens
+            self._refill(time.monotonic())
+            self.available_tokens += charged[0]
+            response = getattr(error, "response", None)
+            if headers := getattr(response, "headers", None):
+                self._update(headers)
+                if (
+                    delay := _parse_seconds(_header(headers, "retry-after"))
+                ) is not None:
+                    self.paused_until = max(self.paused_until, self._last + delay)
+            self._wake_first()
+
+    def _start(self, run_id: UUID, tokens: int) -> None:
+        if (pending := self._pending.get()) is None:
+            pending = deque()
+            self._pending.set(pending)
+        pending.append((run_id, tokens))
+
+    def _discard_pending(self, run_id: UUID) -> None:
+        # not sent, eg. the response was cached
+        if pending := self._pending.get():
+            for item in pending:
+                if item[0] == run_id:
+                    pending.remove(item)
+                    break
+
+    def _update(self, headers: Mapping[str, Any]) -> None:
+        """Follow the limits reported by the provider, with the lock held."""
+        for kind in ("requests", "tokens"):
+            remaining = _parse_float(_header(headers, f"x-ratelimit-remaining-{kind}"))
+            if remaining is None:
+                continue
+            # the limits aren't adopted, as they may be for another period than a
+            # minute, e.g. Groq reports the requests per day
+            if kind == "requests":
+                self.available_requests = min(self.available_requests, remaining)
+            else:
+                self.available_tokens = min(self.available_tokens, remaining)
+            if remaining < 1 and (
+                reset := _parse_seconds(_header(headers, f"x-ratelimit-reset-{kind}"))
+            ):
+                self.paused_until = max(self.paused_until, self._last + reset)
+
+
+# Seconds after which the usage of a run is no longer expected.
+_MAX_CHARGE_AGE = 600.0
+
+_DURATION = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_UNITS = {"h": 3600.0, "m": 60.0, "s": 1.0, "ms": 0.001}
+
+
+def _header(headers: Mapping[str, Any], name: str) -> Any:
+    if (value := headers.get(name)) is None:
+        for key, value_ in headers.items():
+            if key.lower() == name:
+                return value_
+    return value
+
+
+def _parse_float(value: Any) -> float | None:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_seconds(value: Any) -> float | None:
+    """Parse a duration such as `"20"`, `"1.5s"`, `"120ms"` or `"2m59.56s"`."""
+    if (seconds := _parse_float(value)) is not None or not isinstance(value, str):
+        return seconds
+    parts = _DURATION.findall(value)
+    if not parts or "".join(n + u for n, u in parts) != value.strip():
+        return None
+    return sum(float(n) * _UNITS[u] for n, u in parts)
+
+
+def _get_total_tokens(response: LLMResult) -> int | None:
+    total: int | None = None
+    for generations in response.generations:
+        for generation in generations:
+            message = getattr(generation, "message", None)
+            if usage := getattr(message, "usage_metadata", None):
+                total = (total or 0) + usage.get("total_tokens", 0)
+    # LLMs that report usage for the whole call instead
+    if total is None and response.llm_output:
+        total = (response.llm_output.get("token_usage") or {}).get("total_tokens")
+    return total
+
+
+def _get_headers(response: LLMResult) -> Mapping[str, Any] | None:
+    for generations in response.generations:
+        for generation in generations:
+            if headers := (generation.generation_info or {}).get("headers"):
+                return headers
+            message = getattr(generation, "message", None)
+            if headers := getattr(message, "response_metadata", {}).get("headers"):
+                return headers
+    return None
+
+
 __all__ = [
     "BaseRateLimiter",
     "InMemoryRateLimiter",
+    "SharedMemoryRateLimiter",
+    "TokenRateLimiter",
 ]
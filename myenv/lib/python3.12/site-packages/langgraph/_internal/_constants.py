@@ -63,6 +63,13 @@ CONFIG_KEY_RUNTIME = sys.intern("__pregel_runtime")
 # holds a `Runtime` instance with context, store, stream writer, etc.
 CONFIG_KEY_RESUME_MAP = sys.intern("__pregel_resume_map")
 # holds a mapping of task ns -> resume value for resuming tasks
+CONFIG_KEY_EXECUTOR = sys.intern("__pregel_executor")
+# holds a `SharedExecutor` used to run the sync tasks of the graph
+CONFIG_KEY_SPECULATIONS = sys.intern("__pregel_speculations")
+# holds a mutable dict of speculative node runs, scoped to the current run
+CONFIG_KEY_TASK_SUBMIT = sys.intern("__pregel_task_submit")
+# holds a weakref to the submit function of the executor of a sync run, for work
+# started by a running task
 
 # --- Other constants ---
 PUSH = sys.intern("__pregel_push")
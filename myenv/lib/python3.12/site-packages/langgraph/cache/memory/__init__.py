@@ -1,8 +1,12 @@
 from __future__ import annotations
 
 import datetime
+import heapq
 import threading
-from collections.abc import Mapping, Sequence
+import time
+from collections import OrderedDict
+from collections.abc import Iterable, Mapping, Sequence
+from typing import Any
 
 from langgraph.cache.base import BaseCache, FullKey, Namespace, ValueT
 from langgraph.checkpoint.serde.base import SerializerProtocol
@@ -71,3 +75,232 @@ class InMemoryCache(BaseCache[ValueT]):
         """Asynchronously delete the cached values for the given namespaces.
         If no namespaces are provided, clear all cached values."""
         self.clear(namespaces)
+
+
+class BoundedInMemoryCache(BaseCache[ValueT]):
+    """In-memory cache with bounded size per namespace.
+
+    Unlike `InMemoryCache`, which grows without limit and only drops expired
+    entries when they are read, this cache:
+
+    - evicts the least recently used entries of a namespace once it holds more
+      than `max_entries` entries or `max_bytes` bytes of serialized values
+    - proactively drops expired entries, using a heap ordered by expiry
+    - shards namespaces over several locks, so that concurrent access to
+      different namespaces doesn't contend on a single lock
+    - can store values as is, skipping serialization, when the cache is only
+      used in-process
+    """
+
+    def __init__(
+        self,
+        *,
+        serde: SerializerProtocol | None = None,
+        max_entries: int | None = None,
+        max_bytes: int | None = None,
+        serialize: bool = True,
+        num_stripes: int = 16,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            serde: Serializer to use for values
+            max_entries: Maximum number of entries per namespace
+            max_bytes: Maximum total size of the serialized values per namespace.
+                Values larger than this are not cached.
+            serialize: Whether to store values serialized. If `False`, values are
+                stored as is, so they must not be mutated after being cached or read.
+            num_stripes: Number of locks namespaces are sharded over
+        """
+        super().__init__(serde=serde)
+        if max_bytes is not None and not serialize:
+            raise ValueError("max_bytes requires serialize=True")
+        if num_stripes < 1:
+            raise ValueError("num_stripes must be a positive integer")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.serialize = serialize
+        self._stripes = [_CacheStripe() for _ in range(num_stripes)]
+
+    def _stripe(self, ns: Namespace) -> _CacheStripe:
+        return self._stripes[hash(ns) % len(self._stripes)]
+
+    def get(self, keys: Sequence[FullKey]) -> dict[FullKey, ValueT]:
+        """Get the cached values for the given keys."""
+        if not keys:
+            return {}
+        now = time.time()
+        found: dict[FullKey, Any] = {}
+        for stripe, stripe_keys in self._group_by_stripe(keys).items():
+            with stripe.lock:
+                stripe.sweep(now)
+                for ns, key in stripe_keys:
+                    if (entries := stripe.namespaces.get(ns)) is None:
+                        continue
+                    if (entry := entries.get(key)) is None:
+                        continue
+                    value, expiry, _ = entry
+                    if expiry is not None and now >= expiry:
+                        stripe.delete(ns, key)
+                        continue
+                    entries.move_to_end(key)
+                    found[(ns, key)] = value
+        # deserialize outside of the locks
+        if not self.serialize:
+            return found
+        return {k: self.serde.loads_typed(v) for k, v in found.items()}
+
+    async def aget(self, keys: Sequence[FullKey]) -> dict[FullKey, ValueT]:
+        """Asynchronously get the cached values for the given keys."""
+        return self.get(keys)
+
+    def set(self, keys: Mapping[FullKey, tuple[ValueT, int | None]]) -> None:
+        """Set the cached values for the given keys."""
+        now = time.time()
+        # serialize outside of the locks
+        pending: dict[FullKey, _Entry] = {}
+        for (ns, key), (value, ttl) in keys.items():
+            expiry = now + ttl if ttl is not None else None
+            if self.serialize:
+                typed = self.serde.dumps_typed(value)
+                pending[(Namespace(ns), key)] = (typed, expiry, len(typed[1]))
+            else:
+                pending[(Namespace(ns), key)] = (value, expiry, 0)
+        for stripe, stripe_keys in self._group_by_stripe(pending).items():
+            with stripe.lock:
+                stripe.sweep(now)
+                for ns, key in stripe_keys:
+                    stripe.put(ns, key, pending[(ns, key)])
+                    stripe.evict(ns, self.max_entries, self.max_bytes)
+
+    async def aset(self, keys: Mapping[FullKey, tuple[ValueT, int | None]]) -> None:
+        """Asynchronously set the cached values for the given keys."""
+        self.set(keys)
+
+    def clear(self, namespaces: Sequence[Namespace] | None = None) -> None:
+        """Delete the cached values for the given namespaces.
+        If no namespaces are provided, clear all cached values."""
+        if namespaces is None:
+            for stripe in self._stripes:
+                with stripe.lock:
+                    stripe.namespaces.clear()
+                    stripe.nbytes.clear()
+                    stripe.expiries.clear()
+                    stripe.timed = 0
+            return
+        for ns in namespaces:
+            stripe = self._stripe(ns)
+            with stripe.lock:
+                stripe.drop(ns)
+
+    async def aclear(self, namespaces: Sequence[Namespace] | None = None) -> None:
+        """Asynchronously delete the cached values for the given namespaces.
+        If no namespaces are provided, clear all cached values."""
+        self.clear(namespaces)
+
+    def sweep(self) -> None:
+        """Drop all expired entries from the cache.
+
+        Expired entries are also dropped as a side effect of `get` and `set`,
+        call this to reclaim memory without waiting for either."""
+        now = time.time()
+        for stripe in self._stripes:
+            with stripe.lock:
+                stripe.sweep(now)
+
+    def _group_by_stripe(
+        self, keys: Iterable[FullKey]
+    ) -> dict[_CacheStripe, list[FullKey]]:
+        grouped: dict[_CacheStripe, list[FullKey]] = {}
+        for ns, key in keys:
+            ns = Namespace(ns)
+            grouped.setdefault(self._stripe(ns), []).append((ns, key))
+        return grouped
+
+
+# (value, expiry, size of the serialized value)
+_Entry = tuple[Any, float | None, int]
+
+# entries of the expiry heap kept before compacting it, however few are live
+_MIN_EXPIRIES = 64
+
+
+class _CacheStripe:
+    """The namespaces of a `BoundedInMemoryCache` guarded by the same lock."""
+
+    __slots__ = ("lock", "namespaces", "nbytes", "expiries", "timed")
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        # namespace -> key -> (value, expiry, size), in least recently used order
+        self.namespaces: dict[Namespace, OrderedDict[str, _Entry]] = {}
+        # namespace -> total size of the values
+        self.nbytes: dict[Namespace, int] = {}
+        # heap of (expiry, namespace, key), may contain entries since replaced,
+        # evicted or deleted, compacted when those outnumber the live ones
+        self.expiries: list[tuple[float, Namespace, str]] = []
+        # number of live entries with an expiry
+        self.timed = 0
+
+    def put(self, ns: Namespace, key: str, entry: _Entry) -> None:
+        entries = self.namespaces.setdefault(ns, OrderedDict())
+        if (previous := entries.pop(key, None)) is not None:
+            self.nbytes[ns] -= previous[2]
+            if previous[1] is not None:
+                self.timed -= 1
+        entries[key] = entry
+        self.nbytes[ns] = self.nbytes.get(ns, 0) + entry[2]
+        if entry[1] is not None:
+            self.timed += 1
+            heapq.heappush(self.expiries, (entry[1], ns, key))
+            self.compact()
+
+    def delete(self, ns: Namespace, key: str) -> None:
+        entries = self.namespaces[ns]
+        entry = entries.pop(key)
+        self.nbytes[ns] -= entry[2]
+        if entry[1] is not None:
+            self.timed -= 1
+        if not entries:
+            del self.namespaces[ns]
+            del self.nbytes[ns]
+
+    def drop(self, ns: Namespace) -> None:
+        if (entries := self.namespaces.pop(ns, None)) is None:
+            return
+        del self.nbytes[ns]
+        self.timed -= sum(1 for entry in entries.values() if entry[1] is not None)
+        self.compact()
+
+    def compact(self) -> None:
+        """Rebuild the expiry heap from the live entries, if mostly stale."""
+        if len(self.expiries) <= max(2 * self.timed, _MIN_EXPIRIES):
+            return
+        self.expiries = [
+            (entry[1], ns, key)
+            for ns, entries in self.namespaces.items()
+            for key, entry in entries.items()
+            if entry[1] is not None
+        ]
+        heapq.heapify(self.expiries)
+
+    def evict(
+        self, ns: Namespace, max_entries: int | None, max_bytes: int | None
+    ) -> None:
+        while (entries := self.namespaces.get(ns)) and (
+            (max_entries is not None and len(entries) > max_entries)
+            or (max_bytes is not None and self.nbytes[ns] > max_bytes)
+        ):
+            self.delete(ns, next(iter(entries)))
+
+    def sweep(self, now: float) -> None:
+        expiries = self.expiries
+        while expiries and expiries[0][0] <= now:
+            expiry, ns, key = heapq.heappop(expiries)
+            # skip entries that were since replaced, evicted or cleared
+            if (
+                (entries := self.namespaces.get(ns)) is not None
+                and (entry := entries.get(key)) is not None
+                and entry[1] == expiry
+            ):
+                self.delete(ns, key)
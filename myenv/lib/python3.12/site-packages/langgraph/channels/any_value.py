@@ -18,6 +18,8 @@ class AnyValue(Generic[Value], BaseChannel[Value, Value, Value]):
 
     __slots__ = ("typ", "value")
 
+    reacts_to_finish = False
+
     value: Value | Any
 
     def __init__(self, typ: Any, key: str = "") -> None:
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from collections.abc import Sequence
-from typing import Any, Generic, TypeVar
+from typing import Any, ClassVar, Generic, TypeVar
 
 from typing_extensions import Self
 
@@ -21,6 +21,26 @@ class BaseChannel(Generic[Value, Update, Checkpoint], ABC):
 
     __slots__ = ("key", "typ")
 
+    reacts_to_empty_step: ClassVar[bool] = True
+    """Whether `update()` can change the channel when called with no values.
+
+    Channels that set this to `False` are not notified at the end of steps in
+    which they received no writes. Reset to `True` for subclasses that override
+    `update()` without setting it."""
+    reacts_to_finish: ClassVar[bool] = True
+    """Whether `finish()` can change the channel.
+
+    Channels that set this to `False` are not notified when the run is finishing.
+    Reset to `True` for subclasses that override `finish()` without setting it."""
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # the flags of the parent class describe its own update() and finish()
+        if "update" in cls.__dict__ and "reacts_to_empty_step" not in cls.__dict__:
+            cls.reacts_to_empty_step = True
+        if "finish" in cls.__dict__ and "reacts_to_finish" not in cls.__dict__:
+            cls.reacts_to_finish = True
+
     def __init__(self, typ: Any, key: str = "") -> None:
         self.typ = typ
         self.key = key
@@ -17,6 +17,8 @@ class EphemeralValue(Generic[Value], BaseChannel[Value, Value, Value]):
 
     __slots__ = ("value", "guard")
 
+    reacts_to_finish = False
+
     value: Value | Any
     guard: bool
 
@@ -22,6 +22,9 @@ class LastValue(Generic[Value], BaseChannel[Value, Value, Value]):
 
     __slots__ = ("value",)
 
+    reacts_to_empty_step = False
+    reacts_to_finish = False
+
     value: Value | Any
 
     def __init__(self, typ: Any, key: str = "") -> None:
@@ -86,6 +89,8 @@ class LastValueAfterFinish(
 
     __slots__ = ("value", "finished")
 
+    reacts_to_empty_step = False
+
     value: Value | Any
     finished: bool
 
@@ -15,6 +15,9 @@ class NamedBarrierValue(Generic[Value], BaseChannel[Value, Value, set[Value]]):
 
     __slots__ = ("names", "seen")
 
+    reacts_to_empty_step = False
+    reacts_to_finish = False
+
     names: set[Value]
     seen: set[Value]
 
@@ -88,6 +91,8 @@ class NamedBarrierValueAfterFinish(
 
     __slots__ = ("names", "seen", "finished")
 
+    reacts_to_empty_step = False
+
     names: set[Value]
     seen: set[Value]
 
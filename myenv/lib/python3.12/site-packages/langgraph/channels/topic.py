@@ -33,6 +33,8 @@ class Topic(
 
     __slots__ = ("values", "accumulate")
 
+    reacts_to_finish = False
+
     def __init__(self, typ: type[Value], accumulate: bool = False) -> None:
         super().__init__(typ)
         # attrs
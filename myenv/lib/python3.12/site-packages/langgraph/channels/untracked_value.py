@@ -17,6 +17,9 @@ class UntrackedValue(Generic[Value], BaseChannel[Value, Value, Value]):
 
     __slots__ = ("value", "guard")
 
+    reacts_to_empty_step = False
+    reacts_to_finish = False
+
     guard: bool
     value: Value | Any
 
@@ -440,6 +440,13 @@ EXCLUDED_METADATA_KEYS = {
     "langgraph_checkpoint_ns",
 }
 
+LAZY_CHANNEL_VALUES = "__lazy_channel_values"
+"""
+Configurable key asking `get_tuple` and `list` to return checkpoints whose
+`channel_values` is a read-only mapping that deserializes each value on first access.
+Checkpointers that don't support it return regular dicts instead.
+"""
+
 # --- below are deprecated utilities used by past versions of LangGraph ---
 
 LATEST_VERSION = 2
@@ -0,0 +1,663 @@
+from __future__ import annotations
+
+import logging
+import mmap
+import os
+import struct
+import threading
+import zlib
+from collections import Counter, defaultdict
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from typing import Any
+
+import ormsgpack
+from langchain_core.runnables import RunnableConfig
+
+from langgraph.checkpoint.base import (
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    SerializerProtocol,
+)
+from langgraph.checkpoint.memory import (
+    MESSAGE_REFS,
+    InMemorySaver,
+    _split_message_hashes,
+)
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+# record: body length, crc32 of body, then the body:
+#   kind, msgpack-encoded metadata length and bytes, then one or more
+#   typed payloads, each as type length, type, data length and data
+_HEADER = struct.Struct("<II")
+_BODY_HEADER = struct.Struct("<BI")
+_PAYLOAD_TYPE = struct.Struct("<B")
+_PAYLOAD_DATA = struct.Struct("<I")
+
+_BLOB = 1
+_CHECKPOINT = 2
+_WRITE = 3
+_DELETE_THREAD = 4
+_MESSAGE = 5
+
+_Typed = tuple[str, bytes]
+_Record = tuple[int, list[Any], Sequence[_Typed]]
+
+
+class FileSaver(InMemorySaver):
+    """A checkpoint saver that persists checkpoints to an append-only log file.
+
+    Checkpoints, writes, channel blobs and deduplicated messages are appended to a single log file,
+    which is memory-mapped for reads. Only an index of the log is kept in
+    memory: serialized values point into the mapped file, and msgpack payloads
+    are deserialized straight from it without copying. The index is rebuilt
+    from the log when the saver is opened, so checkpoints survive restarts.
+
+    Records that are overwritten or deleted stay in the log until it is
+    compacted. Compaction runs on a background thread once they make up
+    `compaction_ratio` of the log, by rewriting the live records to a new file
+    and atomically replacing the log with it. Writes are only blocked while the
+    live records are listed and while the logs are swapped.
+
+    Each record is checksummed, so a record torn by a crash is discarded on the
+    next open, together with anything written after it. Records are handed to the
+    OS on every write, which makes them survive a crash of the process; set
+    `fsync` to also survive a crash of the machine, at the cost of an fsync
+    per checkpoint, or per `batch()` of checkpoints.
+
+    Note:
+        Only one process can open a log file at a time.
+
+    Note:
+        Only POSIX systems are supported, as the log is written with
+        `os.pwrite` and locked with `fcntl.flock`.
+
+    Args:
+        path: Path of the log file. Created if it does not exist.
+        serde: The serializer to use for serializing and deserializing checkpoints.
+        delta_interval: See `InMemorySaver`.
+        metadata_index_keys: See `InMemorySaver`.
+        dedupe_messages: See `InMemorySaver`.
+        fsync: Whether to fsync the log after every write.
+        compaction_ratio: Fraction of the log taken by overwritten or deleted
+            records that triggers a compaction.
+        compaction_min_bytes: Size of overwritten or deleted records below which
+            the log is never compacted.
+
+    Example:
+        ```python
+        from langgraph.checkpoint.file import FileSaver
+        from langgraph.graph import StateGraph
+
+        builder = StateGraph(int)
+        builder.add_node("add_one", lambda x: x + 1)
+        builder.set_entry_point("add_one")
+        builder.set_finish_point("add_one")
+
+        with FileSaver("checkpoints.log") as checkpointer:
+            graph = builder.compile(checkpointer=checkpointer)
+            graph.invoke(1, {"configurable": {"thread_id": "thread-1"}})
+        ```
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        serde: SerializerProtocol | None = None,
+        delta_interval: int | None = None,
+        metadata_index_keys: Sequence[str] | None = None,
+        dedupe_messages: bool = False,
+        fsync: bool = False,
+        compaction_ratio: float = 0.5,
+        compaction_min_bytes: int = 1 << 20,
+    ) -> None:
+        super().__init__(
+            serde=serde,
+            delta_interval=delta_interval,
+            metadata_index_keys=metadata_index_keys,
+            dedupe_messages=dedupe_messages,
+        )
+        if not 0 < compaction_ratio <= 1:
+            raise ValueError("compaction_ratio must be in (0, 1]")
+        self.path = os.fspath(path)
+        self.fsync = fsync
+        self.compaction_ratio = compaction_ratio
+        self.compaction_min_bytes = compaction_min_bytes
+        self.lock = threading.RLock()
+        self._compactor: threading.Thread | None = None
+        # number of times the log was replaced by a compacted one
+        self._generation = 0
+        # nesting depth of batch() blocks, and whether they have unsynced writes
+        self._batch_depth = 0
+        self._unsynced = False
+        # bytes of overwritten or deleted records still in the log
+        self._garbage = 0
+        # hashes of messages stored since the last append
+        self._new_messages: list[bytes] = []
+        self._fd = _open_log(self.path, os.O_RDWR | os.O_CREAT)
+        self._mmap: mmap.mmap | None = None
+        self._capacity = os.fstat(self._fd).st_size
+        self._end = 0
+        self._load()
+        self.stack.callback(self.close)
+
+    def close(self) -> None:
+        """Wait for a running compaction, then trim and close the log file."""
+        if self._compactor is not None:
+            self._compactor.join()
+        with self.lock:
+            if self._fd < 0:
+                return
+            self.storage.clear()
+            self.writes.clear()
+            self.blobs.clear()
+            self.deltas.clear()
+            self.messages.clear()
+            self.message_refcounts.clear()
+            self._delta_heads.clear()
+            self._message_heads.clear()
+            self._mmap = None
+            os.ftruncate(self._fd, self._end)
+            os.close(self._fd)
+            self._fd = -1
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Hold the lock for a block of writes, and fsync them once at its end.
+
+        Example:
+            ```python
+            with checkpointer.batch():
+                for config, checkpoint, metadata, new_versions in pending:
+                    checkpointer.put(config, checkpoint, metadata, new_versions)
+            ```
+        """
+        with self.lock:
+            self._batch_depth += 1
+            try:
+                yield
+            finally:
+                self._batch_depth -= 1
+                if not self._batch_depth and self._unsynced:
+                    self._unsynced = False
+                    os.fsync(self._fd)
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        """Save a checkpoint to the log.
+
+        Args:
+            config: The config to associate with the checkpoint.
+            checkpoint: The checkpoint to save.
+            metadata: Additional metadata to save with the checkpoint.
+            new_versions: New versions as of this write
+
+        Returns:
+            RunnableConfig: The updated config containing the saved checkpoint's timestamp.
+        """
+        with self.lock, self._rollback_on_error():
+            next_config = super().put(config, checkpoint, metadata, new_versions)
+            thread_id = config["configurable"]["thread_id"]
+            checkpoint_ns = config["configurable"]["checkpoint_ns"]
+            checkpoint_id = checkpoint["id"]
+            records: list[_Record] = [
+                (_MESSAGE, [h], [self.messages[h]]) for h in self._new_messages
+            ]
+            blob_keys = [
+                (thread_id, checkpoint_ns, k, v) for k, v in new_versions.items()
+            ]
+            for key in blob_keys:
+                prev_version, depth = self.deltas.get(key, (None, 0))
+                records.append((_BLOB, [*key, prev_version, depth], [self.blobs[key]]))
+            saved = self.storage[thread_id][checkpoint_ns][checkpoint_id]
+            records.append(
+                (
+                    _CHECKPOINT,
+                    [thread_id, checkpoint_ns, checkpoint_id, saved[2]],
+                    saved[:2],
+                )
+            )
+            *appended, (saved_checkpoint, saved_metadata) = self._append(records)
+            messages = appended[: len(self._new_messages)]
+            blobs = appended[len(self._new_messages) :]
+            # point the index at the log instead of the serialized values
+            for h, (message,) in zip(self._new_messages, messages, strict=True):
+                self.messages[h] = message
+            self._new_messages.clear()
+            for key, (blob,) in zip(blob_keys, blobs, strict=True):
+                self.blobs[key] = blob
+            self.storage[thread_id][checkpoint_ns][checkpoint_id] = (
+                saved_checkpoint,
+                saved_metadata,
+                saved[2],
+            )
+            self._maybe_compact()
+            return next_config
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        """Save a list of writes to the log.
+
+        Args:
+            config: The config to associate with the writes.
+            writes: The writes to save.
+            task_id: Identifier for the task creating the writes.
+            task_path: Path of the task creating the writes.
+        """
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        checkpoint_id = config["configurable"]["checkpoint_id"]
+        outer_key = (thread_id, checkpoint_ns, checkpoint_id)
+        with self.lock, self._rollback_on_error():
+            previous = dict(self.writes.get(outer_key, {}))
+            super().put_writes(config, writes, task_id, task_path)
+            current = self.writes.get(outer_key, {})
+            changed = [
+                inner_key
+                for inner_key, write in current.items()
+                if previous.get(inner_key) is not write
+            ]
+            if not changed:
+                return
+            records: list[_Record] = []
+            for inner_key in changed:
+                _, channel, value, path = current[inner_key]
+                if (old := previous.get(inner_key)) is not None:
+                    self._garbage += len(old[2][1])
+                records.append(
+                    (_WRITE, [*outer_key, *inner_key, channel, path], [value])
+                )
+            for inner_key, (value,) in zip(changed, self._append(records), strict=True):
+                task_id_, channel, _, path = current[inner_key]
+                current[inner_key] = (task_id_, channel, value, path)
+            self._maybe_compact()
+
+    def delete_thread(self, thread_id: str) -> None:
+        """Delete all checkpoints and writes associated with a thread ID.
+
+        Args:
+            thread_id: The thread ID to delete.
+        """
+        with self.lock, self._rollback_on_error():
+            for saved in self.storage.get(thread_id, {}).values():
+                for checkpoint, metadata, _ in saved.values():
+                    self._garbage += len(checkpoint[1]) + len(metadata[1])
+            for key, writes in self.writes.items():
+                if key[0] == thread_id:
+                    self._garbage += sum(len(w[2][1]) for w in writes.values())
+            for key, blob in self.blobs.items():
+                if key[0] == thread_id:
+                    self._garbage += len(blob[1])
+            messages_size = sum(len(m[1]) for m in self.messages.values())
+            super().delete_thread(thread_id)
+            self._garbage += messages_size - sum(
+                len(m[1]) for m in self.messages.values()
+            )
+            self._append([(_DELETE_THREAD, [thread_id], ())])
+            self._maybe_compact()
+
+    def compact(self) -> None:
+        """Rewrite the log with only the records that are still live.
+
+        Unlike the compactions started in the background, this holds the lock
+        for the whole rewrite.
+        """
+        with self.lock:
+            self._compact(self.path + ".compact")
+
+    @contextmanager
+    def _rollback_on_error(self) -> Iterator[None]:
+        """Rebuild the index from the log if the block fails.
+
+        Writes are applied to the index before they are appended to the log, so
+        if the append fails, eg. on a full disk, the index is replayed from the
+        log to drop what was only applied in memory.
+        """
+        try:
+            yield
+        except BaseException:
+            self._new_messages.clear()
+            if self._fd >= 0:
+                self._mmap = None
+                self._capacity = os.fstat(self._fd).st_size
+                self._load()
+            raise
+
+    def _put_message(self, h: bytes, message: tuple[str, bytes]) -> None:
+        super()._put_message(h, message)
+        self._new_messages.append(h)
+
+    def _live_records(self) -> Iterator[_Record]:
+        for h, message in self.messages.items():
+            yield (_MESSAGE, [h], [message])
+        for key, blob in self.blobs.items():
+            prev_version, depth = self.deltas.get(key, (None, 0))
+            yield (_BLOB, [*key, prev_version, depth], [blob])
+        for thread_id, namespaces in self.storage.items():
+            for checkpoint_ns, checkpoints in namespaces.items():
+                for checkpoint_id, (
+                    checkpoint,
+                    metadata,
+                    parent,
+                ) in checkpoints.items():
+                    yield (
+                        _CHECKPOINT,
+                        [thread_id, checkpoint_ns, checkpoint_id, parent],
+                        [checkpoint, metadata],
+                    )
+        for outer_key, writes in self.writes.items():
+            for (task_id, idx), (_, channel, value, path) in writes.items():
+                yield (_WRITE, [*outer_key, task_id, idx, channel, path], [value])
+
+    def _load(self) -> None:
+        """Rebuild the index by replaying the log."""
+        index = _LogIndex()
+        if self._capacity:
+            self._mmap = mmap.mmap(self._fd, self._capacity, access=mmap.ACCESS_READ)
+            index.replay(self._mmap, 0)
+            if index.end < self._capacity:
+                logger.debug(
+                    f"Discarding log tail of {self.path} from byte {index.end}"
+                )
+        self._install(index)
+
+    def _install(self, index: _LogIndex) -> None:
+        """Replace the index with one replayed from the log."""
+        refcounts = Counter(
+            h
+            for blob in index.blobs.values()
+            if blob[0] == MESSAGE_REFS
+            for h in _split_message_hashes(blob[1])
+        )
+        for h in [h for h in index.messages if h not in refcounts]:
+            index.garbage += len(index.messages.pop(h)[1])
+        self.storage = index.storage
+        self.writes = index.writes
+        self.blobs = index.blobs
+        self.deltas = index.deltas
+        self.messages = index.messages
+        self.message_refcounts = dict(refcounts)
+        self._delta_heads.clear()
+        self._message_heads.clear()
+        self._checkpoint_ids.clear()
+        for by_value in self._metadata_index.values():
+            by_value.clear()
+        self._garbage = index.garbage
+        self._end = index.end
+
+    def _append(self, records: Sequence[_Record]) -> list[list[_Typed]]:
+        """Append records to the log, and return their payloads read back from it."""
+        if self._fd < 0:
+            raise RuntimeError("FileSaver is closed")
+        encoded = [_encode(*record) for record in records]
+        data = b"".join(d for d, _ in encoded)
+        start = self._end
+        if start + len(data) > self._capacity:
+            capacity = max(2 * self._capacity, start + len(data), 1 << 16)
+            os.ftruncate(self._fd, capacity)
+            self._capacity = capacity
+            # earlier maps stay alive for as long as the index points into them
+            self._mmap = mmap.mmap(self._fd, self._capacity, access=mmap.ACCESS_READ)
+        _write_all(self._fd, data, start)
+        if self.fsync:
+            if self._batch_depth:
+                self._unsynced = True
+            else:
+                os.fsync(self._fd)
+        self._end = start + len(data)
+        assert self._mmap is not None
+        view = memoryview(self._mmap)
+        results: list[list[_Typed]] = []
+        offset = start
+        for (data, spans), (_, _, payloads) in zip(encoded, records, strict=True):
+            results.append(
+                [
+                    (type_, _payload(type_, view, offset + lo, offset + hi))
+                    for (type_, _), (lo, hi) in zip(payloads, spans, strict=True)
+                ]
+            )
+            offset += len(data)
+        return results
+
+    def _maybe_compact(self) -> None:
+        if (
+            self._garbage >= self.compaction_min_bytes
+            and self._garbage >= self.compaction_ratio * self._end
+            and (self._compactor is None or not self._compactor.is_alive())
+        ):
+            self._compactor = threading.Thread(
+                target=self._compact_in_background, daemon=True
+            )
+            self._compactor.start()
+
+    def _compact_in_background(self) -> None:
+        try:
+            self._compact(self.path + ".compact-background")
+        except Exception:
+            logger.exception(f"Failed to compact {self.path}")
+
+    def _compact(self, tmp_path: str) -> None:
+        """Rewrite the live records to a new log, and replace the log with it.
+
+        The lock is only held to list the live records, and to swap the logs.
+        Records appended in between are copied from the tail of the old log,
+        and replayed on top of the index of the new one.
+        """
+        with self.lock:
+            if self._fd < 0:
+                return
+            records = list(self._live_records())
+            start, generation = self._end, self._generation
+        fd = _open_log(tmp_path, os.O_RDWR | os.O_CREAT | os.O_TRUNC)
+        try:
+            size = _write_records(fd, records)
+            del records
+            index = _LogIndex()
+            buf = mmap.mmap(fd, size, access=mmap.ACCESS_READ) if size else None
+            if buf is not None:
+                index.replay(buf, 0)
+            with self.lock:
+                if self._fd < 0 or generation != self._generation:
+                    # closed, or compacted in the foreground meanwhile
+                    os.close(fd)
+                    os.unlink(tmp_path)
+                    return
+                if self._end > start:
+                    assert self._mmap is not None
+                    _write_all(fd, self._mmap[start : self._end], size)
+                    size, tail = size + self._end - start, size
+                    buf = mmap.mmap(fd, size, access=mmap.ACCESS_READ)
+                    index.replay(buf, tail)
+                os.fsync(fd)
+                os.replace(tmp_path, self.path)
+                os.close(self._fd)
+                self._fd = fd
+                self._mmap = buf
+                self._capacity = size
+                self._generation += 1
+                self._install(index)
+        except BaseException:
+            if self._fd != fd:
+                os.close(fd)
+                os.unlink(tmp_path)
+            raise
+
+
+class _LogIndex:
+    """The index of a log, built by replaying its records."""
+
+    def __init__(self) -> None:
+        self.storage: defaultdict[str, dict[str, dict[str, Any]]] = defaultdict(
+            lambda: defaultdict(dict)
+        )
+        self.writes: defaultdict[tuple[str, str, str], dict[tuple[str, int], Any]] = (
+            defaultdict(dict)
+        )
+        self.blobs: dict[tuple[str, str, str, str | int | float], Any] = {}
+        self.deltas: dict[tuple[str, str, str, str | int | float], Any] = {}
+        self.messages: dict[bytes, Any] = {}
+        # bytes of overwritten or deleted records
+        self.garbage = 0
+        # end of the last valid record
+        self.end = 0
+
+    def replay(self, buf: mmap.mmap, offset: int) -> None:
+        """Apply the valid records of the log from an offset, up to a torn one."""
+        storage, writes = self.storage, self.writes
+        blobs, deltas = self.blobs, self.deltas
+        for end, kind, meta, payloads in _read_records(buf, offset):
+            if kind == _BLOB:
+                *key_, prev_version, depth = meta
+                key = tuple(key_)
+                if (old := blobs.get(key)) is not None:
+                    self.garbage += len(old[1])
+                blobs[key] = payloads[0]
+                if depth:
+                    deltas[key] = (prev_version, depth)
+                else:
+                    deltas.pop(key, None)
+            elif kind == _CHECKPOINT:
+                thread_id, checkpoint_ns, checkpoint_id, parent = meta
+                storage[thread_id][checkpoint_ns][checkpoint_id] = (
+                    payloads[0],
+                    payloads[1],
+                    parent,
+                )
+            elif kind == _WRITE:
+                *outer_key, task_id, idx, channel, path = meta
+                outer = writes[tuple(outer_key)]
+                if (old := outer.get((task_id, idx))) is not None:
+                    self.garbage += len(old[2][1])
+                outer[(task_id, idx)] = (task_id, channel, payloads[0], path)
+            elif kind == _MESSAGE:
+                self.messages[meta[0]] = payloads[0]
+            elif kind == _DELETE_THREAD:
+                thread_id = meta[0]
+                for saved in storage.pop(thread_id, {}).values():
+                    for checkpoint, metadata, _ in saved.values():
+                        self.garbage += len(checkpoint[1]) + len(metadata[1])
+                for k in [k for k in writes if k[0] == thread_id]:
+                    self.garbage += sum(len(w[2][1]) for w in writes.pop(k).values())
+                for k in [k for k in blobs if k[0] == thread_id]:
+                    self.garbage += len(blobs.pop(k)[1])
+                    deltas.pop(k, None)
+            self.end = end
+
+
+def _open_log(path: str, flags: int) -> int:
+    fd = os.open(path, flags, 0o644)
+    if fcntl is not None:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            raise RuntimeError(f"{path} is already open in another FileSaver") from None
+    return fd
+
+
+def _write_records(fd: int, records: Sequence[_Record]) -> int:
+    """Write records to the start of a file, fsynced, and return their size."""
+    chunk: list[bytes] = []
+    size = total = 0
+    for record in records:
+        data, _ = _encode(*record)
+        chunk.append(data)
+        size += len(data)
+        if size >= 1 << 20:
+            _write_all(fd, b"".join(chunk))
+            total += size
+            chunk.clear()
+            size = 0
+    _write_all(fd, b"".join(chunk))
+    os.fsync(fd)
+    return total + size
+
+
+def _write_all(fd: int, data: bytes, offset: int | None = None) -> None:
+    view = memoryview(data)
+    while view:
+        if offset is None:
+            written = os.write(fd, view)
+        else:
+            written = os.pwrite(fd, view, offset)
+            offset += written
+        view = view[written:]
+
+
+def _encode(
+    kind: int, meta: list[Any], payloads: Sequence[_Typed]
+) -> tuple[bytes, list[tuple[int, int]]]:
+    """Encode a record, and the spans of its payload data within it."""
+    meta_b = ormsgpack.packb(meta)
+    parts = [_BODY_HEADER.pack(kind, len(meta_b)), meta_b]
+    spans: list[tuple[int, int]] = []
+    offset = _HEADER.size + _BODY_HEADER.size + len(meta_b)
+    for type_, data in payloads:
+        type_b = type_.encode()
+        parts.append(_PAYLOAD_TYPE.pack(len(type_b)) + type_b)
+        parts.append(_PAYLOAD_DATA.pack(len(data)))
+        parts.append(data)
+        offset += _PAYLOAD_TYPE.size + len(type_b) + _PAYLOAD_DATA.size
+        spans.append((offset, offset + len(data)))
+        offset += len(data)
+    body = b"".join(parts)
+    return _HEADER.pack(len(body), zlib.crc32(body)) + body, spans
+
+
+def _read_records(
+    buf: mmap.mmap, offset: int = 0
+) -> Iterator[tuple[int, int, list[Any], list[_Typed]]]:
+    """Yield the end offset, kind, metadata and payloads of each valid record."""
+    view = memoryview(buf)
+    while offset + _HEADER.size <= len(buf):
+        length, crc = _HEADER.unpack_from(buf, offset)
+        start = offset + _HEADER.size
+        end = start + length
+        if length < _BODY_HEADER.size or end > len(buf):
+            return
+        if zlib.crc32(view[start:end]) != crc:
+            return
+        kind, meta_len = _BODY_HEADER.unpack_from(buf, start)
+        pos = start + _BODY_HEADER.size
+        meta = ormsgpack.unpackb(view[pos : pos + meta_len])
+        pos += meta_len
+        payloads: list[_Typed] = []
+        while pos < end:
+            (type_len,) = _PAYLOAD_TYPE.unpack_from(buf, pos)
+            pos += _PAYLOAD_TYPE.size
+            type_ = bytes(view[pos : pos + type_len]).decode()
+            pos += type_len
+            (data_len,) = _PAYLOAD_DATA.unpack_from(buf, pos)
+            pos += _PAYLOAD_DATA.size
+            payloads.append((type_, _payload(type_, view, pos, pos + data_len)))
+            pos += data_len
+        offset = end
+        yield end, kind, meta, payloads
+
+
+def _payload(type_: str, view: memoryview, start: int, end: int) -> Any:
+    # msgpack is decoded straight from the map, other serializers may expect bytes
+    if type_ == "msgpack":
+        return view[start:end]
+    return bytes(view[start:end])
+
+
+__all__ = ["FileSaver"]
@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Iterator, Sequence
+from concurrent.futures import Future
+from contextlib import AbstractContextManager, nullcontext
+from types import TracebackType
+from typing import Any
+
+from langchain_core.runnables import RunnableConfig
+
+from langgraph.checkpoint.base import (
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+    V,
+)
+
+_Op = tuple[Callable[..., Any], tuple[Any, ...], Future]
+
+
+class GroupCommitSaver(BaseCheckpointSaver[V], AbstractContextManager):
+    """A checkpoint saver that commits the writes of concurrent runs in batches.
+
+    `put`, `put_writes` and `delete_thread` calls, from any thread or event loop,
+    are queued and applied to the wrapped saver by a background thread. A batch
+    holds up to `max_batch_size` calls: the ones queued while the previous batch
+    was written. When calls kept arriving during that write, the next batch waits
+    up to `max_delay` seconds for more calls, otherwise it's written right away, so
+    a lone call isn't delayed. Each call returns when its batch has been written.
+    Calls are applied in the order they were queued, so the writes of each thread
+    are applied in order.
+
+    If the wrapped saver has a `batch()` context manager, like `FileSaver.batch`,
+    each batch is written inside it, e.g. with a single fsync for the whole batch.
+
+    Reads go straight to the wrapped saver, and see the writes of calls that have
+    returned.
+
+    Note:
+        Writes are applied with the sync methods of the wrapped saver, so it must
+        implement them.
+
+    Args:
+        saver: The checkpoint saver to write batches to.
+        max_batch_size: Maximum number of calls written in one batch.
+        max_delay: Maximum time in seconds to wait for more calls to add to a
+            batch that isn't full, when calls arrived while the previous batch
+            was written.
+
+    Example:
+        ```python
+        from langgraph.checkpoint.file import FileSaver
+        from langgraph.checkpoint.groupcommit import GroupCommitSaver
+
+        with GroupCommitSaver(FileSaver("checkpoints.log", fsync=True)) as checkpointer:
+            graph = builder.compile(checkpointer=checkpointer)
+            graph.batch(inputs, [{"configurable": {"thread_id": t}} for t in threads])
+        ```
+    """
+
+    def __init__(
+        self,
+        saver: BaseCheckpointSaver[V],
+        *,
+        max_batch_size: int = 64,
+        max_delay: float = 0.002,
+    ) -> None:
+        super().__init__(serde=saver.serde)
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be a positive integer")
+        self.saver = saver
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self._queue: deque[_Op] = deque()
+        self._cond = threading.Condition()
+        self._closed = False
+        self._flusher: threading.Thread | None = None
+
+    def __enter__(self) -> GroupCommitSaver[V]:
+        if isinstance(self.saver, AbstractContextManager):
+            self.saver.__enter__()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> bool | None:
+        self.close()
+        if isinstance(self.saver, AbstractContextManager):
+            return self.saver.__exit__(exc_type, exc_value, traceback)
+        return None
+
+    def close(self) -> None:
+        """Write the calls still queued, then stop the background thread."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+            flusher = self._flusher
+        if flusher is not None:
+            flusher.join()
+
+    @property
+    def config_specs(self) -> list:
+        return self.saver.config_specs
+
+    def get_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        return self.saver.get_tuple(config)
+
+    def list(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> Iterator[CheckpointTuple]:
+        return self.saver.list(config, filter=filter, before=before, limit=limit)
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        return self._submit(
+            self.saver.put, config, checkpoint, metadata, new_versions
+        ).result()
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        self._submit(self.saver.put_writes, config, writes, task_id, task_path).result()
+
+    def delete_thread(self, thread_id: str) -> None:
+        self._submit(self.saver.delete_thread, thread_id).result()
+
+    async def aget_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        return await self.saver.aget_tuple(config)
+
+    async def alist(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        async for item in self.saver.alist(
+            config, filter=filter, before=before, limit=limit
+        ):
+            yield item
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        return await asyncio.wrap_future(
+            self._submit(self.saver.put, config, checkpoint, metadata, new_versions)
+        )
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        await asyncio.wrap_future(
+            self._submit(self.saver.put_writes, config, writes, task_id, task_path)
+        )
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        await asyncio.wrap_future(self._submit(self.saver.delete_thread, thread_id))
+
+    def get_next_version(self, current: V | None, channel: None) -> V:
+        return self.saver.get_next_version(current, channel)
+
+    def _submit(self, fn: Callable[..., Any], *args: Any) -> Future:
+        fut: Future = Future()
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("GroupCommitSaver is closed")
+            self._queue.append((fn, args, fut))
+            if self._flusher is None:
+                self._flusher = threading.Thread(target=self._run, daemon=True)
+                self._flusher.start()
+            self._cond.notify()
+        return fut
+
+    def _run(self) -> None:
+        # whether calls were queued while the previous batch was written
+        busy = False
+        while True:
+            with self._cond:
+                while not self._queue and not self._closed:
+                    self._cond.wait()
+                if not self._queue:
+                    return
+                if busy:
+                    # more calls are likely on their way, wait for them
+                    deadline = time.monotonic() + self.max_delay
+                    while len(self._queue) < self.max_batch_size and not self._closed:
+                        if (remaining := deadline - time.monotonic()) <= 0:
+                            break
+                        self._cond.wait(remaining)
+                batch = [
+                    self._queue.popleft()
+                    for _ in range(min(len(self._queue), self.max_batch_size))
+                ]
+            self._commit(batch)
+            with self._cond:
+                busy = bool(self._queue)
+
+    def _commit(self, batch: list[_Op]) -> None:
+        results: list[tuple[Future, Any, BaseException | None]] = []
+        batch_cm = getattr(self.saver, "batch", None)
+        try:
+            with batch_cm() if callable(batch_cm) else nullcontext():
+                for fn, args, fut in batch:
+                    try:
+                        results.append((fut, fn(*args), None))
+                    except Exception as exc:
+                        results.append((fut, None, exc))
+        except Exception as exc:
+            # the batch as a whole failed to be written
+            for _, _, fut in batch:
+                fut.set_exception(exc)
+            return
+        for fut, result, exc in results:
+            if exc is None:
+                fut.set_result(result)
+            else:
+                fut.set_exception(exc)
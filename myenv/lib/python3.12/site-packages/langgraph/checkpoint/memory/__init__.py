@@ -5,15 +5,18 @@ import os
 import pickle
 import random
 import shutil
+from bisect import bisect_left, insort
 from collections import defaultdict
-from collections.abc import AsyncIterator, Iterator, Sequence
+from collections.abc import AsyncIterator, Iterator, Mapping, Sequence
 from contextlib import AbstractAsyncContextManager, AbstractContextManager, ExitStack
 from types import TracebackType
 from typing import Any
 
+from langchain_core.messages import BaseMessage
 from langchain_core.runnables import RunnableConfig
 
 from langgraph.checkpoint.base import (
+    LAZY_CHANNEL_VALUES,
     WRITES_IDX_MAP,
     BaseCheckpointSaver,
     ChannelVersions,
@@ -27,6 +30,10 @@ from langgraph.checkpoint.base import (
 
 logger = logging.getLogger(__name__)
 
+# type of blobs that hold the concatenated hashes of the messages in a list
+MESSAGE_REFS = "message_refs"
+_MESSAGE_HASH_SIZE = 16
+
 
 class InMemorySaver(
     BaseCheckpointSaver[str], AbstractContextManager, AbstractAsyncContextManager
@@ -43,6 +50,25 @@ class InMemorySaver(
 
     Args:
         serde: The serializer to use for serializing and deserializing checkpoints.
+        delta_interval: If set, list channel values that only grew by appending
+            since the previous checkpoint (e.g. channels reduced with `add_messages`
+            or `operator.add`) are stored as the appended suffix plus a pointer to
+            the previous blob, instead of re-serializing the whole list. At most
+            `delta_interval` deltas are chained before a full snapshot is written,
+            which keeps the cost of reading a checkpoint bounded.
+            Channel values must not be mutated in place for this to be correct.
+        metadata_index_keys: Checkpoint metadata keys to index (e.g. `"source"`,
+            `"step"` or keys of your own), so that `list` calls filtering on them
+            only visit the matching checkpoints instead of deserializing the
+            metadata of every checkpoint. Only hashable metadata values are indexed.
+        dedupe_messages: If set, lists of messages (e.g. channels reduced with
+            `add_messages`) are stored as references to their messages, and each
+            distinct message is serialized and stored once per saver, keyed by a
+            hash of its serialized form. Checkpoints of the same conversation,
+            and of threads forked from it, then share their messages instead of
+            storing a copy each. Messages are reused from the previous
+            checkpoint by identity, so they must not be mutated in place.
+            Requires `xxhash`.
 
     Example:
         ```python
@@ -79,22 +105,63 @@ class InMemorySaver(
         ],  # thread id, checkpoint ns, channel, version
         tuple[str, bytes],
     ]
+    # blob key -> (previous version, delta chain length), for blobs that only
+    # hold the suffix appended to the blob of the previous version
+    deltas: dict[
+        tuple[str, str, str, str | int | float],
+        tuple[str | int | float, int],
+    ]
+    # message hash -> serialized message, for blobs stored as message references
+    messages: dict[bytes, tuple[str, bytes]]
+    # message hash -> number of references to it from blobs
+    message_refcounts: dict[bytes, int]
 
     def __init__(
         self,
         *,
         serde: SerializerProtocol | None = None,
         factory: type[defaultdict] = defaultdict,
+        delta_interval: int | None = None,
+        metadata_index_keys: Sequence[str] | None = None,
+        dedupe_messages: bool = False,
     ) -> None:
         super().__init__(serde=serde)
+        if delta_interval is not None and delta_interval < 1:
+            raise ValueError("delta_interval must be a positive integer")
+        self.delta_interval = delta_interval
         self.storage = factory(lambda: defaultdict(dict))
         self.writes = factory(dict)
         self.blobs = factory()
+        self.deltas = factory()
+        self.dedupe_messages = dedupe_messages
+        self.messages = factory()
+        self.message_refcounts = factory()
+        # (thread id, checkpoint ns, channel) -> (messages, hashes) of the last
+        # message list written, to skip hashing messages already stored
+        self._message_heads: dict[
+            tuple[str, str, str], tuple[list[BaseMessage], list[bytes]]
+        ] = {}
+        # (thread id, checkpoint ns, channel) -> (version, value, delta chain length)
+        # of the last list blob written, used to detect append-only updates
+        self._delta_heads: dict[
+            tuple[str, str, str], tuple[str | int | float, list[Any], int]
+        ] = {}
+        # (thread id, checkpoint ns) -> checkpoint IDs in ascending order,
+        # rebuilt from storage when it no longer matches the number of checkpoints
+        self._checkpoint_ids: dict[tuple[str, str], list[str]] = {}
+        # metadata key -> metadata value -> (thread id, checkpoint ns) -> checkpoint IDs
+        self.metadata_index_keys = tuple(metadata_index_keys or ())
+        self._metadata_index: dict[str, dict[Any, dict[tuple[str, str], set[str]]]] = {
+            key: {} for key in self.metadata_index_keys
+        }
         self.stack = ExitStack()
         if factory is not defaultdict:
             self.stack.enter_context(self.storage)  # type: ignore[arg-type]
             self.stack.enter_context(self.writes)  # type: ignore[arg-type]
             self.stack.enter_context(self.blobs)  # type: ignore[arg-type]
+            self.stack.enter_context(self.deltas)  # type: ignore[arg-type]
+            self.stack.enter_context(self.messages)  # type: ignore[arg-type]
+            self.stack.enter_context(self.message_refcounts)  # type: ignore[arg-type]
 
     def __enter__(self) -> InMemorySaver:
         self.stack.__enter__()
@@ -121,17 +188,188 @@ class InMemorySaver(
         return self.stack.__exit__(__exc_type, __exc_value, __traceback)
 
     def _load_blobs(
-        self, thread_id: str, checkpoint_ns: str, versions: ChannelVersions
-    ) -> dict[str, Any]:
+        self,
+        thread_id: str,
+        checkpoint_ns: str,
+        versions: ChannelVersions,
+        lazy: bool = False,
+    ) -> dict[str, Any] | _LazyChannelValues:
+        if lazy:
+            return _LazyChannelValues(
+                self,
+                thread_id,
+                checkpoint_ns,
+                {
+                    k: v
+                    for k, v in versions.items()
+                    if (vv := self.blobs.get((thread_id, checkpoint_ns, k, v)))
+                    is not None
+                    and vv[0] != "empty"
+                },
+            )
         channel_values: dict[str, Any] = {}
         for k, v in versions.items():
             kk = (thread_id, checkpoint_ns, k, v)
-            if kk in self.blobs:
-                vv = self.blobs[kk]
-                if vv[0] != "empty":
-                    channel_values[k] = self.serde.loads_typed(vv)
+            if kk in self.blobs and self.blobs[kk][0] != "empty":
+                channel_values[k] = self._load_blob(kk)
         return channel_values
 
+    def _load_blob(self, key: tuple[str, str, str, str | int | float]) -> Any:
+        thread_id, checkpoint_ns, k, v = key
+        blob = self.blobs[key]
+        if key in self.deltas:
+            value = self._load_delta_blob(key)
+        else:
+            value = self._loads_blob(blob)
+        if self.delta_interval is not None and type(value) is list:
+            # track the loaded value so that a run resuming from this
+            # checkpoint can keep appending deltas to it
+            self._delta_heads[(thread_id, checkpoint_ns, k)] = (
+                v,
+                list(value),
+                self.deltas[key][1] if key in self.deltas else 0,
+            )
+        if blob[0] == MESSAGE_REFS:
+            # track the loaded messages so that a run resuming from this
+            # checkpoint doesn't hash them again
+            self._message_heads[(thread_id, checkpoint_ns, k)] = (
+                list(value),
+                self._load_message_hashes(key),
+            )
+        return value
+
+    def _load_delta_blob(
+        self, key: tuple[str, str, str, str | int | float]
+    ) -> list[Any]:
+        suffixes: list[list[Any]] = []
+        while (delta := self.deltas.get(key)) is not None:
+            suffixes.append(self._loads_blob(self.blobs[key]))
+            key = (key[0], key[1], key[2], delta[0])
+        value: list[Any] = self._loads_blob(self.blobs[key])
+        for suffix in reversed(suffixes):
+            value.extend(suffix)
+        return value
+
+    def _load_message_hashes(
+        self, key: tuple[str, str, str, str | int | float]
+    ) -> list[bytes]:
+        """Return the message hashes of a message references blob and its deltas."""
+        chunks: list[bytes] = []
+        while True:
+            chunks.append(bytes(self.blobs[key][1]))
+            if (delta := self.deltas.get(key)) is None:
+                break
+            key = (key[0], key[1], key[2], delta[0])
+        return [h for chunk in reversed(chunks) for h in _split_message_hashes(chunk)]
+
+    def _loads_blob(self, blob: tuple[str, bytes]) -> Any:
+        if blob[0] == MESSAGE_REFS:
+            return [
+                self.serde.loads_typed(self.messages[h])
+                for h in _split_message_hashes(blob[1])
+            ]
+        return self.serde.loads_typed(blob)
+
+    def _hash_messages(
+        self, head_key: tuple[str, str, str], value: Any
+    ) -> list[bytes] | None:
+        """Store the messages of a message list, and return their hashes.
+
+        Returns None if the value is not a list of messages.
+        """
+        if not (
+            self.dedupe_messages
+            and type(value) is list
+            and value
+            and all(isinstance(m, BaseMessage) for m in value)
+        ):
+            self._message_heads.pop(head_key, None)
+            return None
+        from xxhash import xxh3_128
+
+        prev_messages, prev_hashes = self._message_heads.get(head_key, ((), ()))
+        hashes: list[bytes] = []
+        for i, message in enumerate(value):
+            if i < len(prev_messages) and message is prev_messages[i]:
+                hashes.append(prev_hashes[i])
+                continue
+            type_, data = self.serde.dumps_typed(message)
+            hasher = xxh3_128(type_.encode())
+            hasher.update(data)
+            h = hasher.digest()
+            if h not in self.messages:
+                self._put_message(h, (type_, data))
+            hashes.append(h)
+        self._message_heads[head_key] = (list(value), hashes)
+        return hashes
+
+    def _put_message(self, h: bytes, message: tuple[str, bytes]) -> None:
+        self.messages[h] = message
+        self.message_refcounts[h] = 0
+
+    def _set_blob(
+        self,
+        key: tuple[str, str, str, str | int | float],
+        blob: tuple[str, bytes],
+    ) -> None:
+        if (replaced := self.blobs.get(key)) is not None:
+            self._release_messages(replaced)
+        self.blobs[key] = blob
+        if blob[0] == MESSAGE_REFS:
+            for h in _split_message_hashes(blob[1]):
+                self.message_refcounts[h] = self.message_refcounts.get(h, 0) + 1
+
+    def _release_messages(self, blob: tuple[str, bytes]) -> None:
+        """Drop a blob's references to messages, and messages left unreferenced."""
+        if blob[0] != MESSAGE_REFS:
+            return
+        for h in _split_message_hashes(blob[1]):
+            if (count := self.message_refcounts.get(h)) is None:
+                continue
+            if count <= 1:
+                del self.message_refcounts[h]
+                self.messages.pop(h, None)
+            else:
+                self.message_refcounts[h] = count - 1
+
+    def _put_blob(
+        self,
+        thread_id: str,
+        checkpoint_ns: str,
+        channel: str,
+        version: str | int | float,
+        value: Any,
+    ) -> None:
+        key = (thread_id, checkpoint_ns, channel, version)
+        head_key = (thread_id, checkpoint_ns, channel)
+        hashes = self._hash_messages(head_key, value)
+        if self.delta_interval is None or type(value) is not list:
+            self._set_blob(key, _dumps_blob(self.serde, value, hashes))
+            return
+        if (head := self._delta_heads.get(head_key)) is not None:
+            prev_version, prev_value, depth = head
+            prev_len = len(prev_value)
+            if (
+                depth < self.delta_interval
+                and prev_version != version
+                and len(value) >= prev_len
+                and all(a is b for a, b in zip(prev_value, value))
+            ):
+                self._set_blob(
+                    key,
+                    _dumps_blob(
+                        self.serde,
+                        value[prev_len:],
+                        hashes[prev_len:] if hashes is not None else None,
+                    ),
+                )
+                self.deltas[key] = (prev_version, depth + 1)
+                self._delta_heads[head_key] = (version, list(value), depth + 1)
+                return
+        self._set_blob(key, _dumps_blob(self.serde, value, hashes))
+        self.deltas.pop(key, None)
+        self._delta_heads[head_key] = (version, list(value), 0)
+
     def get_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
         """Get a checkpoint tuple from the in-memory storage.
 
@@ -148,6 +386,15 @@ class InMemorySaver(
         """
         thread_id: str = config["configurable"]["thread_id"]
         checkpoint_ns: str = config["configurable"].get("checkpoint_ns", "")
+        if lazy := config["configurable"].get(LAZY_CHANNEL_VALUES, False):
+            config = {
+                **config,
+                "configurable": {
+                    k: v
+                    for k, v in config["configurable"].items()
+                    if k != LAZY_CHANNEL_VALUES
+                },
+            }
         if checkpoint_id := get_checkpoint_id(config):
             if saved := self.storage[thread_id][checkpoint_ns].get(checkpoint_id):
                 checkpoint, metadata, parent_checkpoint_id = saved
@@ -158,7 +405,10 @@ class InMemorySaver(
                     checkpoint={
                         **checkpoint_,
                         "channel_values": self._load_blobs(
-                            thread_id, checkpoint_ns, checkpoint_["channel_versions"]
+                            thread_id,
+                            checkpoint_ns,
+                            checkpoint_["channel_versions"],
+                            lazy,
                         ),
                     },
                     metadata=self.serde.loads_typed(metadata),
@@ -179,7 +429,7 @@ class InMemorySaver(
                 )
         else:
             if checkpoints := self.storage[thread_id][checkpoint_ns]:
-                checkpoint_id = max(checkpoints.keys())
+                checkpoint_id = self._get_checkpoint_ids(thread_id, checkpoint_ns)[-1]
                 checkpoint, metadata, parent_checkpoint_id = checkpoints[checkpoint_id]
                 writes = self.writes[(thread_id, checkpoint_ns, checkpoint_id)].values()
                 checkpoint_ = self.serde.loads_typed(checkpoint)
@@ -194,7 +444,10 @@ class InMemorySaver(
                     checkpoint={
                         **checkpoint_,
                         "channel_values": self._load_blobs(
-                            thread_id, checkpoint_ns, checkpoint_["channel_versions"]
+                            thread_id,
+                            checkpoint_ns,
+                            checkpoint_["channel_versions"],
+                            lazy,
                         ),
                     },
                     metadata=self.serde.loads_typed(metadata),
@@ -241,6 +494,10 @@ class InMemorySaver(
             config["configurable"].get("checkpoint_ns") if config else None
         )
         config_checkpoint_id = get_checkpoint_id(config) if config else None
+        before_checkpoint_id = get_checkpoint_id(before) if before else None
+        lazy = (
+            config["configurable"].get(LAZY_CHANNEL_VALUES, False) if config else False
+        )
         for thread_id in thread_ids:
             for checkpoint_ns in self.storage[thread_id].keys():
                 if (
@@ -249,38 +506,29 @@ class InMemorySaver(
                 ):
                     continue
 
-                for checkpoint_id, (
-                    checkpoint,
-                    metadata_b,
-                    parent_checkpoint_id,
-                ) in sorted(
-                    self.storage[thread_id][checkpoint_ns].items(),
-                    key=lambda x: x[0],
-                    reverse=True,
+                checkpoints = self.storage[thread_id][checkpoint_ns]
+                for checkpoint_id, unindexed_filter in self._search_checkpoint_ids(
+                    thread_id,
+                    checkpoint_ns,
+                    filter,
+                    before_checkpoint_id,
+                    config_checkpoint_id,
                 ):
-                    # filter by checkpoint ID from config
-                    if config_checkpoint_id and checkpoint_id != config_checkpoint_id:
-                        continue
-
-                    # filter by checkpoint ID from `before` config
-                    if (
-                        before
-                        and (before_checkpoint_id := get_checkpoint_id(before))
-                        and checkpoint_id >= before_checkpoint_id
-                    ):
+                    if (saved := checkpoints.get(checkpoint_id)) is None:
                         continue
+                    checkpoint, metadata_b, parent_checkpoint_id = saved
 
                     # filter by metadata
                     metadata = self.serde.loads_typed(metadata_b)
-                    if filter and not all(
+                    if unindexed_filter and not all(
                         query_value == metadata.get(query_key)
-                        for query_key, query_value in filter.items()
+                        for query_key, query_value in unindexed_filter.items()
                     ):
                         continue
 
                     # limit search results
                     if limit is not None and limit <= 0:
-                        break
+                        return
                     elif limit is not None:
                         limit -= 1
 
@@ -304,6 +552,7 @@ class InMemorySaver(
                                 thread_id,
                                 checkpoint_ns,
                                 checkpoint_["channel_versions"],
+                                lazy,
                             ),
                         },
                         metadata=metadata,
@@ -349,18 +598,30 @@ class InMemorySaver(
         checkpoint_ns = config["configurable"]["checkpoint_ns"]
         values: dict[str, Any] = c.pop("channel_values")  # type: ignore[misc]
         for k, v in new_versions.items():
-            self.blobs[(thread_id, checkpoint_ns, k, v)] = (
-                self.serde.dumps_typed(values[k]) if k in values else ("empty", b"")
-            )
+            if k in values:
+                self._put_blob(thread_id, checkpoint_ns, k, v, values[k])
+            else:
+                self._set_blob((thread_id, checkpoint_ns, k, v), ("empty", b""))
+                self._delta_heads.pop((thread_id, checkpoint_ns, k), None)
+                self._message_heads.pop((thread_id, checkpoint_ns, k), None)
+        checkpoint_metadata = get_checkpoint_metadata(config, metadata)
+        replaced = self.storage[thread_id][checkpoint_ns].get(checkpoint["id"])
         self.storage[thread_id][checkpoint_ns].update(
             {
                 checkpoint["id"]: (
                     self.serde.dumps_typed(c),
-                    self.serde.dumps_typed(get_checkpoint_metadata(config, metadata)),
+                    self.serde.dumps_typed(checkpoint_metadata),
                     config["configurable"].get("checkpoint_id"),  # parent
                 )
             }
         )
+        self._index_checkpoint(
+            thread_id,
+            checkpoint_ns,
+            checkpoint["id"],
+            checkpoint_metadata,
+            self.serde.loads_typed(replaced[1]) if replaced else None,
+        )
         return {
             "configurable": {
                 "thread_id": thread_id,
@@ -423,7 +684,140 @@ class InMemorySaver(
                 del self.writes[k]
         for k in list(self.blobs.keys()):
             if k[0] == thread_id:
+                self._release_messages(self.blobs[k])
                 del self.blobs[k]
+        for k in list(self.deltas.keys()):
+            if k[0] == thread_id:
+                del self.deltas[k]
+        for k in list(self._delta_heads.keys()):
+            if k[0] == thread_id:
+                del self._delta_heads[k]
+        for k in list(self._message_heads.keys()):
+            if k[0] == thread_id:
+                del self._message_heads[k]
+        for k in list(self._checkpoint_ids.keys()):
+            if k[0] == thread_id:
+                del self._checkpoint_ids[k]
+        for by_value in self._metadata_index.values():
+            for value, by_ns in list(by_value.items()):
+                for k in [k for k in by_ns if k[0] == thread_id]:
+                    del by_ns[k]
+                if not by_ns:
+                    del by_value[value]
+
+    def _get_checkpoint_ids(self, thread_id: str, checkpoint_ns: str) -> list[str]:
+        """Return the IDs of the checkpoints of a thread and namespace, in ascending order."""
+        checkpoints = self.storage[thread_id][checkpoint_ns]
+        key = (thread_id, checkpoint_ns)
+        ids = self._checkpoint_ids.get(key)
+        if ids is None or len(ids) != len(checkpoints):
+            # storage was changed without going through put, e.g. loaded from disk
+            ids = self._checkpoint_ids[key] = sorted(checkpoints)
+            for by_value in self._metadata_index.values():
+                for value, by_ns in list(by_value.items()):
+                    if by_ns.pop(key, None) is not None and not by_ns:
+                        del by_value[value]
+            if self._metadata_index:
+                for checkpoint_id in ids:
+                    self._index_metadata(
+                        key,
+                        checkpoint_id,
+                        self.serde.loads_typed(checkpoints[checkpoint_id][1]),
+                    )
+        return ids
+
+    def _index_checkpoint(
+        self,
+        thread_id: str,
+        checkpoint_ns: str,
+        checkpoint_id: str,
+        metadata: CheckpointMetadata,
+        replaced_metadata: CheckpointMetadata | None,
+    ) -> None:
+        key = (thread_id, checkpoint_ns)
+        ids = self._checkpoint_ids.get(key)
+        if ids is None:
+            self._get_checkpoint_ids(thread_id, checkpoint_ns)
+            return
+        if replaced_metadata is None:
+            if not ids or ids[-1] < checkpoint_id:
+                ids.append(checkpoint_id)
+            else:
+                # copy, so that listings in progress keep a stable view
+                ids = self._checkpoint_ids[key] = ids.copy()
+                insort(ids, checkpoint_id)
+        else:
+            for meta_key, by_value in self._metadata_index.items():
+                value = replaced_metadata.get(meta_key)
+                if _is_hashable(value) and (by_ns := by_value.get(value)):
+                    by_ns.get(key, set()).discard(checkpoint_id)
+        self._index_metadata(key, checkpoint_id, metadata)
+
+    def _index_metadata(
+        self, key: tuple[str, str], checkpoint_id: str, metadata: CheckpointMetadata
+    ) -> None:
+        for meta_key, by_value in self._metadata_index.items():
+            value = metadata.get(meta_key)
+            if _is_hashable(value):
+                by_value.setdefault(value, {}).setdefault(key, set()).add(checkpoint_id)
+
+    def _search_checkpoint_ids(
+        self,
+        thread_id: str,
+        checkpoint_ns: str,
+        filter: dict[str, Any] | None,
+        before_checkpoint_id: str | None,
+        config_checkpoint_id: str | None,
+    ) -> Iterator[tuple[str, dict[str, Any] | None]]:
+        """Yield the IDs of candidate checkpoints in descending order.
+
+        Each ID is yielded with the part of `filter` that the metadata index
+        did not already apply.
+        """
+        ids = self._get_checkpoint_ids(thread_id, checkpoint_ns)
+        postings: list[set[str]] = []
+        if filter and self._metadata_index:
+            unindexed_filter: dict[str, Any] | None = {}
+            for query_key, query_value in filter.items():
+                if query_key in self._metadata_index and _is_hashable(query_value):
+                    postings.append(
+                        self._metadata_index[query_key]
+                        .get(query_value, {})
+                        .get((thread_id, checkpoint_ns), set())
+                    )
+                else:
+                    unindexed_filter[query_key] = query_value  # type: ignore[index]
+        else:
+            unindexed_filter = filter
+        if config_checkpoint_id:
+            candidates: Iterator[str] | list[str] = (
+                [config_checkpoint_id]
+                if config_checkpoint_id in self.storage[thread_id][checkpoint_ns]
+                and all(config_checkpoint_id in p for p in postings)
+                else []
+            )
+        elif postings:
+            smallest = min(postings, key=len)
+            candidates = sorted(
+                (
+                    id
+                    for id in smallest
+                    if all(id in p for p in postings if p is not smallest)
+                ),
+                reverse=True,
+            )
+        else:
+            end = (
+                bisect_left(ids, before_checkpoint_id)
+                if before_checkpoint_id
+                else len(ids)
+            )
+            candidates = (ids[i] for i in range(end - 1, -1, -1))
+        for checkpoint_id in candidates:
+            # filter by checkpoint ID from `before` config
+            if before_checkpoint_id and checkpoint_id >= before_checkpoint_id:
+                continue
+            yield checkpoint_id, unindexed_filter
 
     async def aget_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
         """Asynchronous version of `get_tuple`.
@@ -530,6 +924,72 @@ class InMemorySaver(
 MemorySaver = InMemorySaver  # Kept for backwards compatibility
 
 
+def _dumps_blob(
+    serde: SerializerProtocol, value: Any, hashes: list[bytes] | None
+) -> tuple[str, bytes]:
+    if hashes is not None:
+        return (MESSAGE_REFS, b"".join(hashes))
+    return serde.dumps_typed(value)
+
+
+def _split_message_hashes(data: bytes) -> Iterator[bytes]:
+    view = memoryview(data)
+    for i in range(0, len(view), _MESSAGE_HASH_SIZE):
+        yield bytes(view[i : i + _MESSAGE_HASH_SIZE])
+
+
+def _is_hashable(value: Any) -> bool:
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+
+class _LazyChannelValues(Mapping[str, Any]):
+    """Channel values of a checkpoint, each deserialized on first access."""
+
+    __slots__ = ("saver", "thread_id", "checkpoint_ns", "versions", "values")
+
+    def __init__(
+        self,
+        saver: InMemorySaver,
+        thread_id: str,
+        checkpoint_ns: str,
+        versions: ChannelVersions,
+    ) -> None:
+        self.saver = saver
+        self.thread_id = thread_id
+        self.checkpoint_ns = checkpoint_ns
+        self.versions = versions
+        self.values: dict[str, Any] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return self.values[key]
+        except KeyError:
+            version = self.versions[key]
+        value = self.values[key] = self.saver._load_blob(
+            (self.thread_id, self.checkpoint_ns, key, version)
+        )
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.versions
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.versions)
+
+    def __len__(self) -> int:
+        return len(self.versions)
+
+    def __repr__(self) -> str:
+        return repr(self.copy())
+
+    def copy(self) -> dict[str, Any]:
+        return {k: self[k] for k in self.versions}
+
+
 class PersistentDict(defaultdict):
     """Persistent dictionary with an API compatible with shelve and anydbm.
 
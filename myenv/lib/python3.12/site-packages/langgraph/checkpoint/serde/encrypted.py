@@ -29,7 +29,7 @@ class EncryptedSerializer(SerializerProtocol):
         if "+" not in enc_cipher:
             return self.serde.loads_typed(data)
         # extract cipher name
-        typ, ciphername = enc_cipher.split("+", 1)
+        typ, ciphername = enc_cipher.rsplit("+", 1)
         # decrypt data
         decrypted_data = self.cipher.decrypt(ciphername, ciphertext)
         # deserialize data
@@ -0,0 +1,130 @@
+import threading
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+from langgraph.checkpoint.serde.base import SerializerProtocol
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+ZSTD_TAG = "zstd"
+
+
+class ZstdSerializer(SerializerProtocol):
+    """Serializer that compresses data with Zstandard.
+
+    Compressed payloads have `+zstd` appended to their type. Payloads smaller
+    than `threshold`, or that don't get any smaller, are stored uncompressed, so
+    data written without this serializer still loads.
+
+    Args:
+        serde: The serializer whose output is compressed.
+        level: The Zstandard compression level.
+        threshold: Payloads smaller than this many bytes are not compressed.
+        dictionaries: Dictionaries created with `train_dictionary`. The first one
+            is used to compress, and all of them to decompress, so dictionaries
+            that are no longer used can be kept to read data written with them.
+    """
+
+    def __init__(
+        self,
+        serde: SerializerProtocol = JsonPlusSerializer(),
+        *,
+        level: int = 3,
+        threshold: int = 512,
+        dictionaries: Sequence[bytes] = (),
+    ) -> None:
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError(
+                "zstandard is not installed. Please install it with `pip install zstandard`."
+            ) from None
+
+        self.serde = serde
+        self.level = level
+        self.threshold = threshold
+        self._zstd = zstandard
+        self._dicts: dict[int, Any] = {}
+        self._dict: Any = None
+        for data in dictionaries:
+            zdict = zstandard.ZstdCompressionDict(
+                data, dict_type=zstandard.DICT_TYPE_FULLDICT
+            )
+            if self._dict is None:
+                zdict.precompute_compress(level=level)
+                self._dict = zdict
+            self._dicts[zdict.dict_id()] = zdict
+        # compression contexts can't be shared between threads
+        self._local = threading.local()
+
+    def dumps_typed(self, obj: Any) -> tuple[str, bytes]:
+        """Serialize an object to a tuple `(type, bytes)` and compress the bytes."""
+        typ, data = self.serde.dumps_typed(obj)
+        if len(data) < self.threshold:
+            return typ, data
+        compressed = self._compressor().compress(data)
+        if len(compressed) >= len(data):
+            return typ, data
+        return f"{typ}+{ZSTD_TAG}", compressed
+
+    def loads_typed(self, data: tuple[str, bytes]) -> Any:
+        typ, payload = data
+        base, sep, tag = typ.rpartition("+")
+        # uncompressed data
+        if not sep or tag != ZSTD_TAG:
+            return self.serde.loads_typed(data)
+        return self.serde.loads_typed((base, self._decompress(payload)))
+
+    def _compressor(self) -> Any:
+        try:
+            return self._local.compressor
+        except AttributeError:
+            compressor = self._local.compressor = self._zstd.ZstdCompressor(
+                level=self.level, dict_data=self._dict
+            )
+            return compressor
+
+    def _decompress(self, payload: bytes) -> bytes:
+        try:
+            decompressors = self._local.decompressors
+        except AttributeError:
+            decompressors = self._local.decompressors = {}
+        # frames record the id of the dictionary they were compressed with
+        dict_id = self._zstd.get_frame_parameters(payload).dict_id
+        if (decompressor := decompressors.get(dict_id)) is None:
+            if dict_id and dict_id not in self._dicts:
+                raise ValueError(f"Unknown Zstandard dictionary id: {dict_id}")
+            decompressor = decompressors[dict_id] = self._zstd.ZstdDecompressor(
+                dict_data=self._dicts.get(dict_id)
+            )
+        return decompressor.decompress(payload)
+
+    @staticmethod
+    def train_dictionary(
+        samples: Iterable[Any],
+        *,
+        serde: SerializerProtocol = JsonPlusSerializer(),
+        dict_size: int = 112_640,
+    ) -> bytes:
+        """Train a Zstandard dictionary on sample objects.
+
+        Samples should look like the data that will be stored, e.g. checkpoints
+        and channel values read back from an existing checkpointer. Needs at
+        least a few hundred samples to train a useful dictionary.
+
+        Args:
+            samples: Objects to serialize with `serde` and train on.
+            serde: The serializer that will be wrapped by `ZstdSerializer`.
+            dict_size: The maximum size of the dictionary, in bytes.
+
+        Returns:
+            The dictionary, to be passed to `ZstdSerializer(dictionaries=...)`.
+        """
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError(
+                "zstandard is not installed. Please install it with `pip install zstandard`."
+            ) from None
+
+        data = [serde.dumps_typed(sample)[1] for sample in samples]
+        return zstandard.train_dictionary(dict_size, data).as_bytes()
@@ -1,7 +1,15 @@
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from langgraph.constants import END, START
-from langgraph.graph.message import MessageGraph, MessagesState, add_messages
 from langgraph.graph.state import StateGraph
 
+if TYPE_CHECKING:
+    from langgraph.graph._compile_cache import CompileCache
+    from langgraph.graph.message import MessageGraph, MessagesState, add_messages
+
 __all__ = (
     "END",
     "START",
@@ -9,4 +17,24 @@ __all__ = (
     "add_messages",
     "MessagesState",
     "MessageGraph",
+    "CompileCache",
 )
+
+# imported on first access, to keep `from langgraph.graph import StateGraph` fast
+_LAZY_IMPORTS = {
+    "add_messages": "langgraph.graph.message",
+    "MessagesState": "langgraph.graph.message",
+    "MessageGraph": "langgraph.graph.message",
+    "CompileCache": "langgraph.graph._compile_cache",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if (module := _LAZY_IMPORTS.get(name)) is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = globals()[name] = getattr(import_module(module), name)
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_IMPORTS})
@@ -29,6 +29,7 @@ from langgraph._internal._runnable import (
 )
 from langgraph.constants import END, START
 from langgraph.errors import InvalidUpdateError
+from langgraph.graph._speculate import SpeculativeNode, commit_speculations
 from langgraph.pregel._write import PASSTHROUGH, ChannelWrite, ChannelWriteEntry
 from langgraph.types import Send
 
@@ -84,6 +85,7 @@ class BranchSpec(NamedTuple):
     path: Runnable[Any, Hashable | list[Hashable]]
     ends: dict[Hashable, str] | None
     input_schema: type[Any] | None = None
+    speculate: tuple[str, ...] = ()
 
     @classmethod
     def from_path(
@@ -91,6 +93,7 @@ class BranchSpec(NamedTuple):
         path: Runnable[Any, Hashable | list[Hashable]],
         path_map: dict[Hashable, str] | list[str] | None,
         infer_schema: bool = False,
+        speculate: Sequence[str] = (),
     ) -> BranchSpec:
         # coerce path_map to a dictionary
         path_map_: dict[Hashable, str] | None = None
@@ -117,12 +120,18 @@ class BranchSpec(NamedTuple):
         # infer input schema
         input_schema = _get_branch_path_input_schema(path) if infer_schema else None
         # create branch
-        return cls(path=path, ends=path_map_, input_schema=input_schema)
+        return cls(
+            path=path,
+            ends=path_map_,
+            input_schema=input_schema,
+            speculate=tuple(dict.fromkeys(speculate)),
+        )
 
     def run(
         self,
         writer: _Writer,
         reader: Callable[[RunnableConfig], Any] | None = None,
+        speculative: Sequence[SpeculativeNode] = (),
     ) -> RunnableCallable:
         return ChannelWrite.register_writer(
             RunnableCallable(
@@ -130,6 +139,7 @@ class BranchSpec(NamedTuple):
                 afunc=self._aroute,
                 writer=writer,
                 reader=reader,
+                speculative=speculative,
                 name=None,
                 trace=False,
             ),
@@ -150,6 +160,7 @@ class BranchSpec(NamedTuple):
         *,
         reader: Callable[[RunnableConfig], Any] | None,
         writer: _Writer,
+        speculative: Sequence[SpeculativeNode],
     ) -> Runnable:
         if reader:
             value = reader(config)
@@ -164,7 +175,7 @@ class BranchSpec(NamedTuple):
         else:
             value = input
         result = self.path.invoke(value, config)
-        return self._finish(writer, input, result, config)
+        return self._finish(writer, input, result, config, speculative)
 
     async def _aroute(
         self,
@@ -173,6 +184,7 @@ class BranchSpec(NamedTuple):
         *,
         reader: Callable[[RunnableConfig], Any] | None,
         writer: _Writer,
+        speculative: Sequence[SpeculativeNode],
     ) -> Runnable:
         if reader:
             value = reader(config)
@@ -187,7 +199,7 @@ class BranchSpec(NamedTuple):
         else:
             value = input
         result = await self.path.ainvoke(value, config)
-        return self._finish(writer, input, result, config)
+        return self._finish(writer, input, result, config, speculative)
 
     def _finish(
         self,
@@ -195,6 +207,7 @@ class BranchSpec(NamedTuple):
         input: Any,
         result: Any,
         config: RunnableConfig,
+        speculative: Sequence[SpeculativeNode] = (),
     ) -> Runnable | Any:
         if not isinstance(result, (list, tuple)):
             result = [result]
@@ -208,6 +221,8 @@ class BranchSpec(NamedTuple):
             raise ValueError("Branch did not return a valid destination")
         if any(p.node == END for p in destinations if isinstance(p, Send)):
             raise InvalidUpdateError("Cannot send a packet to the END node")
+        if speculative:
+            commit_speculations(config, speculative, destinations)
         entries = writer(destinations, False)
         if not entries:
             return input
@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sys
+import tempfile
+import threading
+from collections.abc import Callable
+from inspect import unwrap
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+_VERSION = 1
+
+
+class CompileCache:
+    """A cache of the source analysis done by `StateGraph.compile`, kept in a file.
+
+    To find the subgraphs called by each node, compiling a graph parses the
+    source of the node functions, which is most of the time spent compiling. This
+    cache keeps the result for each function, so that graphs compiled later in this
+    process, or in later processes using the same file, skip the parsing.
+
+    Entries are keyed by the source file of the function, its modification time
+    and size, so editing a file invalidates the entries of its functions. Functions
+    without a source file, e.g. defined in a notebook, are parsed every time.
+
+    The file is written when a compile adds entries, by replacing it, so processes
+    can share it. Failing to write it, eg. in a read-only directory, is logged and
+    doesn't fail the compile.
+
+    Args:
+        path: The file to load the cache from and save it to. If `None`, the cache
+            is only kept in memory.
+
+    Example:
+        ```python
+        from langgraph.graph import CompileCache, StateGraph
+
+        compile_cache = CompileCache(".langgraph/compile-cache.json")
+
+        graph = builder.compile(compile_cache=compile_cache)
+        ```
+    """
+
+    def __init__(self, path: str | os.PathLike[str] | None = None) -> None:
+        self.path = os.fspath(path) if path is not None else None
+        self.lock = threading.Lock()
+        # held while writing the file, so that lookups don't wait on it
+        self.save_lock = threading.Lock()
+        self.names: dict[str, list[str]] = self._load() if self.path else {}
+        self.dirty = False
+
+    def function_names(
+        self, func: Callable[..., Any], analyze: Callable[[Callable], set[str]]
+    ) -> set[str]:
+        """The names referenced by `func`, as found by `analyze` in its source."""
+        if (key := _function_key(func)) is None:
+            return analyze(func)
+        if (names := self.names.get(key)) is not None:
+            return set(names)
+        found = analyze(func)
+        with self.lock:
+            self.names[key] = sorted(found)
+            self.dirty = True
+        return found
+
+    def save(self) -> None:
+        """Write the entries added since the cache was loaded to the file."""
+        if self.path is None or not self.dirty:
+            return
+        with self.save_lock:
+            with self.lock:
+                # keep the entries added by other processes in the meantime
+                names = {**self._load(), **self.names}
+                self.dirty = False
+            names = {key: value for key, value in names.items() if _is_current(key)}
+            try:
+                self._write(names)
+            except OSError as exc:
+                logger.warning(f"Failed to write compile cache {self.path}: {exc}")
+                with self.lock:
+                    self.dirty = True
+
+    def _write(self, names: dict[str, list[str]]) -> None:
+        assert self.path is not None
+        dirname = os.path.dirname(self.path)
+        if dirname:
+            os.makedirs(dirname, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(
+            dir=dirname or None, prefix=f"{os.path.basename(self.path)}.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(
+                    {
+                        "version": _VERSION,
+                        "python": sys.implementation.cache_tag,
+                        "names": names,
+                    },
+                    f,
+                )
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def clear(self) -> None:
+        """Remove all entries, and the file."""
+        with self.lock:
+            self.names.clear()
+            self.dirty = False
+        if self.path is not None:
+            try:
+                os.unlink(self.path)
+            except FileNotFoundError:
+                pass
+
+    def _load(self) -> dict[str, list[str]]:
+        assert self.path is not None
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if (
+            not isinstance(data, dict)
+            or data.get("version") != _VERSION
+            or data.get("python") != sys.implementation.cache_tag
+            or not isinstance(data.get("names"), dict)
+        ):
+            return {}
+        return data["names"]
+
+
+def _function_key(func: Callable[..., Any]) -> str | None:
+    func = getattr(unwrap(func), "__func__", func)
+    try:
+        code = func.__code__
+        stat = os.stat(code.co_filename)
+    except (AttributeError, OSError, ValueError):
+        return None
+    return (
+        f"{code.co_filename}:{stat.st_mtime_ns}:{stat.st_size}:"
+        f"{func.__qualname__}:{code.co_firstlineno}"
+    )
+
+
+def _is_current(key: str) -> bool:
+    filename, mtime, size, _, _ = key.rsplit(":", 4)
+    try:
+        stat = os.stat(filename)
+    except OSError:
+        return False
+    return f"{stat.st_mtime_ns}" == mtime and f"{stat.st_size}" == size
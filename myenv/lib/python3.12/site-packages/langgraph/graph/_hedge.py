@@ -0,0 +1,286 @@
+"""Hedged runs of nodes with a `HedgePolicy`.
+
+The node's runnable is wrapped in a `HedgedNode`, which keeps the latencies of
+its recent runs. Once enough runs were seen, a run that takes longer than the
+policy's percentile of those latencies is raced against a second run, as long as
+the share of hedged runs stays under the policy's budget. The result of the first
+run to succeed is returned, so the node's writers only see one result. The other
+run is cancelled, or in sync runs, left to finish and ignored.
+
+A run that may be hedged has its stream writer output and its writes (eg.
+resume values of interrupts) buffered, and its own counters, so that only the
+run whose result is used is replayed into the task. Both runs keep the callbacks
+of the task, so they are traced and their messages are streamed. In sync runs,
+they are submitted to the executor of the graph run, which waits for them on
+exit, and when it has no free thread for the first run, the node is run in the
+calling thread without hedging.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import dataclasses
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any
+
+from langchain_core.runnables import Runnable, RunnableConfig
+from langchain_core.runnables.config import patch_config
+
+from langgraph._internal._constants import (
+    CONF,
+    CONFIG_KEY_RUNTIME,
+    CONFIG_KEY_SCRATCHPAD,
+    CONFIG_KEY_SEND,
+    CONFIG_KEY_TASK_SUBMIT,
+)
+from langgraph._internal._runnable import RunnableCallable, _set_config_context
+from langgraph._internal._scratchpad import PregelScratchpad
+from langgraph.errors import GraphBubbleUp
+from langgraph.pregel._algo import LazyAtomicCounter
+from langgraph.runtime import DEFAULT_RUNTIME, Runtime
+from langgraph.types import HedgePolicy
+
+logger = logging.getLogger(__name__)
+
+
+class _Attempt:
+    """A run of the node with buffered output, replayed into the task if used."""
+
+    __slots__ = ("config", "custom", "latency", "scratchpad", "writes")
+
+    def __init__(self, config: RunnableConfig) -> None:
+        scratchpad: PregelScratchpad = config[CONF][CONFIG_KEY_SCRATCHPAD]
+        runtime: Runtime = config[CONF].get(CONFIG_KEY_RUNTIME, DEFAULT_RUNTIME)
+        self.custom: list[Any] = []
+        self.writes: list[tuple[str, Any]] = []
+        # run time of the attempt, once it succeeded
+        self.latency: float | None = None
+        self.scratchpad = dataclasses.replace(
+            scratchpad,
+            call_counter=LazyAtomicCounter(),
+            interrupt_counter=LazyAtomicCounter(),
+            subgraph_counter=LazyAtomicCounter(),
+            resume=list(scratchpad.resume),
+            # the resume value is only consumed when replayed
+            get_null_resume=lambda consume=False: scratchpad.get_null_resume(False),
+        )
+        self.config = patch_config(
+            config,
+            configurable={
+                CONFIG_KEY_SEND: self.writes.extend,
+                CONFIG_KEY_SCRATCHPAD: self.scratchpad,
+                CONFIG_KEY_RUNTIME: runtime.override(stream_writer=self.custom.append),
+            },
+        )
+
+    def replay(self, config: RunnableConfig) -> None:
+        scratchpad: PregelScratchpad = config[CONF][CONFIG_KEY_SCRATCHPAD]
+        if len(self.scratchpad.resume) > len(scratchpad.resume):
+            # the run used the resume value given to the graph
+            scratchpad.get_null_resume(True)
+            scratchpad.resume[:] = self.scratchpad.resume
+        runtime: Runtime = config[CONF].get(CONFIG_KEY_RUNTIME, DEFAULT_RUNTIME)
+        for chunk in self.custom:
+            runtime.stream_writer(chunk)
+        if self.writes:
+            config[CONF][CONFIG_KEY_SEND](self.writes)
+
+
+class HedgedNode(RunnableCallable):
+    """Runs in place of a node, to hedge its slow runs."""
+
+    def __init__(self, name: str, policy: HedgePolicy, bound: Runnable) -> None:
+        super().__init__(self._run, self._arun, name=bound.get_name(), trace=False)
+        self.node = name
+        self.policy = policy
+        self.bound = bound
+        self.lock = threading.Lock()
+        # latencies of the recent successful runs, of the winner if hedged
+        self.latencies: deque[float] = deque(maxlen=policy.window)
+        self.runs = 0
+        self.hedged = 0
+        # hedged runs where the second run finished first
+        self.wins = 0
+
+    def stats(self) -> dict[str, Any]:
+        """The hedging statistics of the node."""
+        with self.lock:
+            return {
+                "runs": self.runs,
+                "hedged": self.hedged,
+                "wins": self.wins,
+                "hedge_rate": self.hedged / self.runs if self.runs else 0.0,
+                "win_rate": self.wins / self.hedged if self.hedged else 0.0,
+                "delay": self._delay(),
+            }
+
+    def _run(self, input: Any, config: RunnableConfig) -> Any:
+        delay = self._start()
+        # only sync graph runs can take work from their tasks
+        submit = config[CONF].get(CONFIG_KEY_TASK_SUBMIT)
+        if delay is None or submit is None:
+            return self._invoke(input, config)
+        first_attempt = _Attempt(config)
+        first = submit()(
+            self._attempt,
+            input,
+            first_attempt,
+            __cancel_on_exit__=True,
+            __reraise_on_exit__=False,
+        )
+        attempts: dict[concurrent.futures.Future, _Attempt] = {first: first_attempt}
+        pending: set[concurrent.futures.Future] = {first}
+        try:
+            done, pending = concurrent.futures.wait(pending, timeout=delay)
+            if done:
+                return self._result(config, first_attempt, first)
+            if first.cancel():
+                # all threads of the run are busy, maybe waiting on this one
+                pending = set()
+                return self._invoke(input, config)
+            if not self._hedge(delay):
+                concurrent.futures.wait([first])
+                return self._result(config, first_attempt, first)
+            second_attempt = _Attempt(config)
+            second = submit()(
+                self._attempt,
+                input,
+                second_attempt,
+                __cancel_on_exit__=True,
+                __reraise_on_exit__=False,
+            )
+            attempts[second] = second_attempt
+            pending = set(attempts)
+            while pending:
+                done, pending = concurrent.futures.wait(
+                    pending, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future, attempt in attempts.items():
+                    if future not in done:
+                        continue
+                    exc = future.exception()
+                    if exc is None or isinstance(exc, GraphBubbleUp):
+                        self._finish(future is second)
+                        return self._result(config, attempt, future)
+            return self._result(config, first_attempt, first)
+        finally:
+            for future in pending:
+                future.cancel()
+
+    async def _arun(self, input: Any, config: RunnableConfig) -> Any:
+        if (delay := self._start()) is None:
+            return await self._ainvoke(input, config)
+        first_attempt = _Attempt(config)
+        first = asyncio.ensure_future(self._aattempt(input, first_attempt))
+        attempts: dict[asyncio.Future, _Attempt] = {first: first_attempt}
+        pending: set[asyncio.Future] = {first}
+        try:
+            done, pending = await asyncio.wait(pending, timeout=delay)
+            if done:
+                return self._result(config, first_attempt, first)
+            if not self._hedge(delay):
+                await asyncio.wait([first])
+                return self._result(config, first_attempt, first)
+            second_attempt = _Attempt(config)
+            second = asyncio.ensure_future(self._aattempt(input, second_attempt))
+            attempts[second] = second_attempt
+            pending = set(attempts)
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for future, attempt in attempts.items():
+                    if future not in done:
+                        continue
+                    exc = future.exception()
+                    if exc is None or isinstance(exc, GraphBubbleUp):
+                        self._finish(future is second)
+                        return self._result(config, attempt, future)
+            return self._result(config, first_attempt, first)
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def _invoke(self, input: Any, config: RunnableConfig) -> Any:
+        started = time.perf_counter()
+        result = self.bound.invoke(input, config)
+        self._record(time.perf_counter() - started)
+        return result
+
+    async def _ainvoke(self, input: Any, config: RunnableConfig) -> Any:
+        started = time.perf_counter()
+        result = await self.bound.ainvoke(input, config)
+        self._record(time.perf_counter() - started)
+        return result
+
+    def _attempt(self, input: Any, attempt: _Attempt) -> Any:
+        # runs in a copy of the context, so the config doesn't leak
+        _set_config_context(attempt.config)
+        started = time.perf_counter()
+        result = self.bound.invoke(input, attempt.config)
+        attempt.latency = time.perf_counter() - started
+        return result
+
+    async def _aattempt(self, input: Any, attempt: _Attempt) -> Any:
+        # runs in its own task, so the config doesn't leak
+        _set_config_context(attempt.config)
+        started = time.perf_counter()
+        result = await self.bound.ainvoke(input, attempt.config)
+        attempt.latency = time.perf_counter() - started
+        return result
+
+    def _result(
+        self,
+        config: RunnableConfig,
+        attempt: _Attempt,
+        future: concurrent.futures.Future | asyncio.Future,
+    ) -> Any:
+        """The result of a finished attempt, after replaying it into the task."""
+        try:
+            result = future.result()
+        except GraphBubbleUp:
+            # eg. an interrupt, after the resume values it used
+            attempt.replay(config)
+            raise
+        attempt.replay(config)
+        # the latency of the other attempt, if any, is never recorded
+        if attempt.latency is not None:
+            self._record(attempt.latency)
+        return result
+
+    def _start(self) -> float | None:
+        """Count a run, and return how long to wait before hedging it, if it can be."""
+        with self.lock:
+            self.runs += 1
+            if self.hedged + 1 > self.policy.max_hedge_rate * self.runs:
+                return None
+            return self._delay()
+
+    def _delay(self) -> float | None:
+        if len(self.latencies) < max(self.policy.min_samples, 1):
+            return None
+        ordered = sorted(self.latencies)
+        index = min(len(ordered) - 1, int(len(ordered) * self.policy.percentile / 100))
+        return max(ordered[index], self.policy.min_delay)
+
+    def _hedge(self, delay: float) -> bool:
+        """Whether the budget allows hedging the current run, and count it if so."""
+        with self.lock:
+            if self.hedged + 1 > self.policy.max_hedge_rate * self.runs:
+                return False
+            self.hedged += 1
+        logger.debug(f"Hedging run of node '{self.node}' after {delay:.2f} seconds")
+        return True
+
+    def _finish(self, won: bool) -> None:
+        if won:
+            with self.lock:
+                self.wins += 1
+
+    def _record(self, latency: float) -> None:
+        with self.lock:
+            self.latencies.append(latency)
@@ -0,0 +1,288 @@
+"""Speculative runs of the targets of conditional edges.
+
+A target listed in `add_conditional_edges(..., speculate=[...])` is started
+when its source node starts, with the state the source node was run with. Its
+run is isolated from the graph: writes, calls and interrupts make it fail, and
+its stream writer output is buffered. Once the branch has picked its
+destinations, the runs of the other targets are cancelled. In sync runs,
+speculative runs are submitted to the executor of the graph run, so only those
+that haven't started yet can be cancelled, the others run to completion and the
+graph run waits for them on exit. When a picked target
+is then run by the graph, it returns the result of its speculative run instead,
+as long as the state it reads only differs in keys written by the source node.
+Otherwise, or if the speculative run failed, it runs as usual. The result goes
+through the node's writers like any other, so nothing from a speculative run
+reaches a checkpoint unless the target was picked and its result used.
+
+Speculative runs of a graph run are kept in a dict under
+`CONFIG_KEY_SPECULATIONS`, keyed by `(task_id, target)` from the start of the
+source node until its branch is done, then by `(checkpoint_ns, target)` until
+the target is run.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import dataclasses
+from collections.abc import Callable, Sequence
+from typing import Any
+
+from langchain_core.runnables import Runnable, RunnableConfig
+from langchain_core.runnables.config import patch_config
+
+from langgraph._internal._constants import (
+    CONF,
+    CONFIG_KEY_CALL,
+    CONFIG_KEY_CHECKPOINT_NS,
+    CONFIG_KEY_READ,
+    CONFIG_KEY_RUNTIME,
+    CONFIG_KEY_SCRATCHPAD,
+    CONFIG_KEY_SEND,
+    CONFIG_KEY_SPECULATIONS,
+    CONFIG_KEY_TASK_ID,
+    CONFIG_KEY_TASK_SUBMIT,
+    NS_SEP,
+)
+from langgraph._internal._runnable import RunnableCallable, _set_config_context
+from langgraph._internal._scratchpad import PregelScratchpad
+from langgraph.pregel._algo import LazyAtomicCounter
+from langgraph.runtime import DEFAULT_RUNTIME, Runtime
+
+
+class _Speculation:
+    """A run of a node started before the node was triggered."""
+
+    __slots__ = ("values", "future", "custom", "ignore")
+
+    def __init__(
+        self,
+        values: dict[str, Any],
+        future: concurrent.futures.Future | asyncio.Future,
+        custom: list[Any],
+    ) -> None:
+        # the state the node was run with
+        self.values = values
+        self.future = future
+        # stream writer output, replayed if the result is used
+        self.custom = custom
+        # keys written by the source node
+        self.ignore: set[str] = set()
+
+    def matches(self, values: dict[str, Any]) -> bool:
+        return not (_changed(self.values, values) - self.ignore)
+
+
+class SpeculativeNode(RunnableCallable):
+    """Runs in place of a node, to run it speculatively and reuse the result."""
+
+    def __init__(
+        self,
+        name: str,
+        bound: Runnable,
+        channels: str | list[str],
+        mapper: Callable[[Any], Any] | None,
+    ) -> None:
+        super().__init__(self._run, self._arun, name=bound.get_name(), trace=False)
+        self.node = name
+        self.bound = bound
+        self.channels = channels
+        self.select = [channels] if isinstance(channels, str) else channels
+        self.mapper = mapper
+
+    def start(self, config: RunnableConfig) -> _Speculation | None:
+        # only sync graph runs can take work from their tasks
+        if (submit := config[CONF].get(CONFIG_KEY_TASK_SUBMIT)) is None:
+            return None
+        if (input := self._input(values := self._read(config, False))) is None:
+            return None
+        custom: list[Any] = []
+        future = submit()(
+            self._speculate,
+            input,
+            _speculative_config(config, custom),
+            __cancel_on_exit__=True,
+            __reraise_on_exit__=False,
+        )
+        return _Speculation(values, future, custom)
+
+    def astart(self, config: RunnableConfig) -> _Speculation | None:
+        if (input := self._input(values := self._read(config, False))) is None:
+            return None
+        custom: list[Any] = []
+        task = asyncio.ensure_future(
+            self._aspeculate(input, _speculative_config(config, custom))
+        )
+        # unused results are never awaited
+        task.add_done_callback(_retrieve)
+        return _Speculation(values, task, custom)
+
+    def _speculate(self, input: Any, config: RunnableConfig) -> Any:
+        # runs in a copy of the context, so the config doesn't leak
+        _set_config_context(config)
+        return self.bound.invoke(input, config)
+
+    async def _aspeculate(self, input: Any, config: RunnableConfig) -> Any:
+        # runs in its own task, so the config doesn't leak
+        _set_config_context(config)
+        return await self.bound.ainvoke(input, config)
+
+    def commit(self, config: RunnableConfig, spec: _Speculation) -> None:
+        """Keep a speculative run of this node after its branch picked it."""
+        spec.ignore = _changed(spec.values, self._read(config, True))
+        registry = config[CONF][CONFIG_KEY_SPECULATIONS]
+        registry.setdefault((_graph_ns(config), self.node), []).append(spec)
+
+    def _run(self, input: Any, config: RunnableConfig) -> Any:
+        # a run that hasn't started yet, eg. while all threads of the graph run
+        # are busy, is run by this task instead
+        if (spec := self._take(config)) is not None and not spec.future.cancel():
+            try:
+                result = spec.future.result()
+            except (Exception, concurrent.futures.CancelledError):
+                pass
+            else:
+                return self._replay(config, spec, result)
+        return self.bound.invoke(input, config)
+
+    async def _arun(self, input: Any, config: RunnableConfig) -> Any:
+        if (spec := self._take(config)) is not None:
+            future = spec.future
+            if isinstance(future, concurrent.futures.Future):
+                future = asyncio.wrap_future(future)
+            await asyncio.wait([future])
+            if not future.cancelled() and future.exception() is None:
+                return self._replay(config, spec, future.result())
+        return await self.bound.ainvoke(input, config)
+
+    def _take(self, config: RunnableConfig) -> _Speculation | None:
+        registry = config[CONF].get(CONFIG_KEY_SPECULATIONS)
+        if not registry or not (
+            specs := registry.pop((_graph_ns(config), self.node), None)
+        ):
+            return None
+        values = self._read(config, False)
+        found: _Speculation | None = None
+        for spec in specs:
+            if found is None and spec.matches(values):
+                found = spec
+            else:
+                spec.future.cancel()
+        return found
+
+    def _read(self, config: RunnableConfig, fresh: bool) -> dict[str, Any]:
+        return config[CONF][CONFIG_KEY_READ](self.select, fresh)
+
+    def _input(self, values: dict[str, Any]) -> Any:
+        if isinstance(self.channels, str):
+            if self.channels not in values:
+                return None
+            value = values[self.channels]
+        else:
+            value = values
+        return self.mapper(value) if self.mapper is not None else value
+
+    def _replay(self, config: RunnableConfig, spec: _Speculation, result: Any) -> Any:
+        if spec.custom:
+            runtime: Runtime = config[CONF].get(CONFIG_KEY_RUNTIME, DEFAULT_RUNTIME)
+            for chunk in spec.custom:
+                runtime.stream_writer(chunk)
+        return result
+
+
+def speculate(bound: Runnable, targets: Sequence[SpeculativeNode]) -> RunnableCallable:
+    """Wrap a source node to start speculative runs of `targets` with it."""
+
+    def _start(config: RunnableConfig, start: str) -> None:
+        registry = config[CONF].get(CONFIG_KEY_SPECULATIONS)
+        if registry is None:
+            return
+        task_id = config[CONF][CONFIG_KEY_TASK_ID]
+        for node in targets:
+            # drop the runs started by a previous attempt of this task
+            if (prev := registry.pop((task_id, node.node), None)) is not None:
+                prev.future.cancel()
+            if (spec := getattr(node, start)(config)) is not None:
+                registry[(task_id, node.node)] = spec
+
+    def _run(input: Any, config: RunnableConfig) -> Any:
+        _start(config, "start")
+        return bound.invoke(input, config)
+
+    async def _arun(input: Any, config: RunnableConfig) -> Any:
+        _start(config, "astart")
+        return await bound.ainvoke(input, config)
+
+    return RunnableCallable(_run, _arun, name=bound.get_name(), trace=False)
+
+
+def commit_speculations(
+    config: RunnableConfig,
+    targets: Sequence[SpeculativeNode],
+    destinations: Sequence[Any],
+) -> None:
+    """Keep the speculative runs of the picked `destinations`, cancel the others."""
+    registry = config[CONF].get(CONFIG_KEY_SPECULATIONS)
+    if not registry:
+        return
+    task_id = config[CONF][CONFIG_KEY_TASK_ID]
+    for node in targets:
+        if (spec := registry.pop((task_id, node.node), None)) is None:
+            continue
+        if node.node in destinations:
+            node.commit(config, spec)
+        else:
+            spec.future.cancel()
+
+
+def _speculative_config(config: RunnableConfig, custom: list[Any]) -> RunnableConfig:
+    scratchpad: PregelScratchpad = config[CONF][CONFIG_KEY_SCRATCHPAD]
+    runtime: Runtime = config[CONF].get(CONFIG_KEY_RUNTIME, DEFAULT_RUNTIME)
+    return patch_config(
+        config,
+        # the run isn't traced or streamed, unless its result is used
+        callbacks=[],
+        configurable={
+            CONFIG_KEY_SEND: _reject_writes,
+            CONFIG_KEY_CALL: None,
+            # without resume values, so that interrupts are raised
+            CONFIG_KEY_SCRATCHPAD: dataclasses.replace(
+                scratchpad,
+                call_counter=LazyAtomicCounter(),
+                interrupt_counter=LazyAtomicCounter(),
+                get_null_resume=_no_resume,
+                resume=[],
+                subgraph_counter=LazyAtomicCounter(),
+            ),
+            CONFIG_KEY_RUNTIME: runtime.override(stream_writer=custom.append),
+        },
+    )
+
+
+def _graph_ns(config: RunnableConfig) -> str:
+    return config[CONF].get(CONFIG_KEY_CHECKPOINT_NS, "").rpartition(NS_SEP)[0]
+
+
+def _changed(old: dict[str, Any], new: dict[str, Any]) -> set[str]:
+    changed = set(old.keys() ^ new.keys())
+    for key in old.keys() & new.keys():
+        try:
+            if old[key] is not new[key] and old[key] != new[key]:
+                changed.add(key)
+        except Exception:
+            # eg. values with an ambiguous truth value
+            changed.add(key)
+    return changed
+
+
+def _reject_writes(writes: Any) -> None:
+    raise RuntimeError("Speculative runs can't write to channels")
+
+
+def _no_resume(consume: bool = False) -> None:
+    return None
+
+
+def _retrieve(task: asyncio.Future) -> None:
+    if not task.cancelled():
+        task.exception()
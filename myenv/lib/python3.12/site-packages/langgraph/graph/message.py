@@ -20,9 +20,12 @@ from langchain_core.messages import (
     convert_to_messages,
     message_chunk_to_message,
 )
-from typing_extensions import TypedDict, deprecated
+from typing_extensions import Self, TypedDict, deprecated
 
 from langgraph._internal._constants import CONF, CONFIG_KEY_SEND, NS_SEP
+from langgraph._internal._typing import MISSING
+from langgraph.channels.binop import BinaryOperatorAggregate, _get_overwrite
+from langgraph.errors import ErrorCode, InvalidUpdateError, create_error_message
 from langgraph.graph.state import StateGraph
 from langgraph.warnings import LangGraphDeprecatedSinceV10
 
@@ -184,37 +187,69 @@ def add_messages(
         ```
 
     """
-    remove_all_idx = None
+    left = _coerce_messages(left)
+    right = _coerce_messages(right)
+    if (remove_all_idx := _find_remove_all(right)) is not None:
+        return right[remove_all_idx + 1 :]
+
+    # merge
+    merged = _merge_messages(left, right, {m.id: i for i, m in enumerate(left)})
+
+    if format == "langchain-openai":
+        merged = _format_messages(merged)
+    elif format:
+        msg = f"Unrecognized {format=}. Expected one of 'langchain-openai', None."
+        raise ValueError(msg)
+    else:
+        pass
+
+    return merged
+
+
+def _coerce_messages(messages: Messages) -> list[BaseMessage]:
     # coerce to list
-    if not isinstance(left, list):
-        left = [left]  # type: ignore[assignment]
-    if not isinstance(right, list):
-        right = [right]  # type: ignore[assignment]
+    if not isinstance(messages, list):
+        messages = [messages]  # type: ignore[assignment]
     # coerce to message
-    left = [
-        message_chunk_to_message(cast(BaseMessageChunk, m))
-        for m in convert_to_messages(left)
-    ]
-    right = [
+    coerced = [
         message_chunk_to_message(cast(BaseMessageChunk, m))
-        for m in convert_to_messages(right)
+        for m in convert_to_messages(messages)
     ]
     # assign missing ids
-    for m in left:
-        if m.id is None:
-            m.id = str(uuid.uuid4())
-    for idx, m in enumerate(right):
+    for m in coerced:
         if m.id is None:
             m.id = str(uuid.uuid4())
+    return coerced
+
+
+def _find_remove_all(messages: list[BaseMessage]) -> int | None:
+    remove_all_idx = None
+    for idx, m in enumerate(messages):
         if isinstance(m, RemoveMessage) and m.id == REMOVE_ALL_MESSAGES:
             remove_all_idx = idx
+    return remove_all_idx
 
-    if remove_all_idx is not None:
-        return right[remove_all_idx + 1 :]
 
-    # merge
-    merged = left.copy()
-    merged_by_id = {m.id: i for i, m in enumerate(merged)}
+def _merge_messages(
+    left: list[BaseMessage],
+    right: list[BaseMessage],
+    merged_by_id: dict[str | None, int],
+) -> list[BaseMessage]:
+    """Merge coerced messages from `right` into `left`, in place.
+
+    `merged_by_id` must map the ID of each message in `left` to its index. It is
+    updated in place to index the returned list, which is `left` unless messages
+    were removed. Nothing is modified if `right` is invalid.
+    """
+    added = set()
+    for m in right:
+        if not isinstance(m, RemoveMessage):
+            added.add(m.id)
+        elif m.id not in merged_by_id and m.id not in added:
+            raise ValueError(
+                f"Attempting to delete a message with an ID that doesn't exist ('{m.id}')"
+            )
+    merged = left
     ids_to_remove = set()
     for m in right:
         if (existing_idx := merged_by_id.get(m.id)) is not None:
@@ -224,24 +259,102 @@ def add_messages(
                 ids_to_remove.discard(m.id)
                 merged[existing_idx] = m
         else:
-            if isinstance(m, RemoveMessage):
-                raise ValueError(
-                    f"Attempting to delete a message with an ID that doesn't exist ('{m.id}')"
-                )
-
             merged_by_id[m.id] = len(merged)
             merged.append(m)
-    merged = [m for m in merged if m.id not in ids_to_remove]
+    if ids_to_remove:
+        merged = [m for m in merged if m.id not in ids_to_remove]
+        merged_by_id.clear()
+        merged_by_id.update({m.id: i for i, m in enumerate(merged)})
+    return merged
 
-    if format == "langchain-openai":
-        merged = _format_messages(merged)
-    elif format:
-        msg = f"Unrecognized {format=}. Expected one of 'langchain-openai', None."
-        raise ValueError(msg)
-    else:
-        pass
 
-    return merged
+class _AddMessagesAggregate(BinaryOperatorAggregate):
+    """Channel used for state keys reduced with `add_messages`.
+
+    Keeps the ID -> index map of the current list of messages across steps, so
+    that merging an update only coerces the new messages, instead of re-coercing
+    and re-indexing the whole history like calling `add_messages` does.
+
+    Updates are appended in place while the channel owns its list. The list and
+    the map are shared once read, checkpointed or copied, and the next update
+    copies them first, so values already handed out never change. Updates from
+    the tasks of a step are thus merged with one copy of the history in total.
+    """
+
+    __slots__ = ("index", "owned")
+
+    reacts_to_empty_step = False
+
+    def __init__(self, typ: Any, operator: Callable[[Any, Any], Any]) -> None:
+        super().__init__(typ, operator)
+        self.index: dict[str | None, int] | None = None
+        # whether the list and the index are only referenced by this channel
+        self.owned = False
+
+    def copy(self) -> Self:
+        empty = super().copy()
+        empty.index = self.index
+        self.owned = False
+        return empty
+
+    def get(self) -> list[BaseMessage]:
+        self.owned = False
+        return super().get()
+
+    def checkpoint(self) -> list[BaseMessage]:
+        self.owned = False
+        return super().checkpoint()
+
+    def update(self, values: Sequence[Messages]) -> bool:
+        if not values:
+            return False
+        if self.value is MISSING:
+            self.value = values[0]
+            values = values[1:]
+        seen_overwrite: bool = False
+        for value in values:
+            is_overwrite, overwrite_value = _get_overwrite(value)
+            if is_overwrite:
+                if seen_overwrite:
+                    msg = create_error_message(
+                        message="Can receive only one Overwrite value per super-step.",
+                        error_code=ErrorCode.INVALID_CONCURRENT_GRAPH_UPDATE,
+                    )
+                    raise InvalidUpdateError(msg)
+                self.value = overwrite_value
+                self.index = None
+                self.owned = False
+                seen_overwrite = True
+                continue
+            if not seen_overwrite:
+                self.value = self._add(value)
+        return True
+
+    def _add(self, update: Messages) -> list[BaseMessage]:
+        right = _coerce_messages(update)
+        if (remove_all_idx := _find_remove_all(right)) is not None:
+            self.index = None
+            self.owned = True
+            return right[remove_all_idx + 1 :]
+        left = self.value
+        if self.index is None:
+            # values restored from a checkpoint are already coerced
+            left = left.copy() if _is_coerced(left) else _coerce_messages(left)
+            self.index = {m.id: i for i, m in enumerate(left)}
+        elif not self.owned:
+            left = left.copy()
+            self.index = self.index.copy()
+        self.owned = True
+        return _merge_messages(left, right, self.index)
+
+
+def _is_coerced(messages: Any) -> bool:
+    return isinstance(messages, list) and all(
+        isinstance(m, BaseMessage)
+        and not isinstance(m, BaseMessageChunk)
+        and m.id is not None
+        for m in messages
+    )
 
 
 @deprecated(
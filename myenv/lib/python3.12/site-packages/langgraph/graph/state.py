@@ -11,6 +11,7 @@ from inspect import isclass, isfunction, ismethod, signature
 from types import FunctionType
 from types import NoneType as NoneType
 from typing import (
+    TYPE_CHECKING,
     Any,
     Generic,
     Literal,
@@ -60,11 +61,13 @@ from langgraph.errors import (
 )
 from langgraph.graph._branch import BranchSpec
 from langgraph.graph._node import StateNode, StateNodeSpec
+from langgraph.graph._hedge import HedgedNode
+from langgraph.graph._speculate import SpeculativeNode, speculate
 from langgraph.managed.base import (
     ManagedValueSpec,
     is_managed_value,
 )
-from langgraph.pregel import Pregel
+from langgraph.pregel import Pregel, SharedExecutor
 from langgraph.pregel._read import ChannelRead, PregelNode
 from langgraph.pregel._write import (
     ChannelWrite,
@@ -76,6 +79,7 @@ from langgraph.types import (
     CachePolicy,
     Checkpointer,
     Command,
+    HedgePolicy,
     RetryPolicy,
     Send,
     ensure_valid_checkpointer,
@@ -83,6 +87,9 @@ from langgraph.types import (
 from langgraph.typing import ContextT, InputT, NodeInputT, OutputT, StateT
 from langgraph.warnings import LangGraphDeprecatedSinceV05, LangGraphDeprecatedSinceV10
 
+if TYPE_CHECKING:
+    from langgraph.graph._compile_cache import CompileCache
+
 __all__ = ("StateGraph", "CompiledStateGraph")
 
 logger = logging.getLogger(__name__)
@@ -296,6 +303,7 @@ class StateGraph(Generic[StateT, ContextT, InputT, OutputT]):
         input_schema: None = None,
         retry_policy: RetryPolicy | Sequence[RetryPolicy] | None = None,
         cache_policy: CachePolicy | None = None,
+        hedge_policy: HedgePolicy | None = None,
         destinations: dict[str, str] | tuple[str, ...] | None = None,
         **kwargs: Unpack[DeprecatedKwargs],
     ) -> Self:
@@ -312,6 +320,9 @@ class StateGraph(Generic[StateT, ContextT, InputT, OutputT]):
 
                 If a sequence is provided, the first matching policy will be applied.
             cache_policy: The cache policy for the node.
+            hedge_policy: The hedge policy for the node.
+
+                Runs slower than most recent runs are raced against a second run.
             destinations: Destinations that indicate where a node can route to.
 
                 Useful for edgeless graphs with nodes that return `Command` objects.
@@ -363,6 +374,7 @@ class StateGraph(Generic[StateT, ContextT, InputT, OutputT]):
         input_schema: type[NodeInputT],
         retry_policy: RetryPolicy | Sequence[RetryPolicy] | None = None,
         cache_policy: CachePolicy | None = None,
+        hedge_policy: HedgePolicy | None = None,
         destinations: dict[str, str] | tuple[str, ...] | None = None,
         **kwargs: Unpack[DeprecatedKwargs],
     ) -> Self:
@@ -379,6 +391,9 @@ class StateGraph(Generic[StateT, ContextT, InputT, OutputT]):
 
                 If a sequence is provided, the first matching policy will be applied.
             cache_policy: The cache policy for the node.
+            hedge_policy: The hedge policy for the node.
+
+                Runs slower than most recent runs are raced against a second run.
             destinations: Destinations that indicate where a node can route to.
 
                 Useful for edgeless graphs with nodes that return `Command` objects.
@@ -435,6 +450,7 @@ class StateGraph(Generic[StateT, ContextT, InputT, OutputT]):
         input_schema: None = None,
         retry_policy: RetryPolicy | Sequence[RetryPolicy] | None = None,
         cache_policy: CachePolicy | None = None,
+        hedge_policy: HedgePolicy | None = None,
         destinations: dict[str, str] | tuple[str, ...] | None = None,
         **kwargs: Unpack[DeprecatedKwargs],
     ) -> Self:
@@ -450,6 +466,9 @@ class StateGraph(Generic[StateT, ContextT, InputT, OutputT]):
 
                 If a sequence is provided, the first matching policy will be applied.
             cache_policy: The cache policy for the node.
+            hedge_policy: The hedge policy for the node.
+
+                Runs slower than most recent runs are raced against a second run.
             destinations: Destinations that indicate where a node can route to.
 
                 Useful for edgeless graphs with nodes that return `Command` objects.
@@ -502,6 +521,7 @@ class StateGraph(Generic[StateT, ContextT, InputT, OutputT]):
         input_schema: type[NodeInputT],
         retry_policy: RetryPolicy | Sequence[RetryPolicy] | None = None,
         cache_policy: CachePolicy | None = None,
+        hedge_policy: HedgePolicy | None = None,
         destinations: dict[str, str] | tuple[str, ...] | None = None,
         **kwargs: Unpack[DeprecatedKwargs],
     ) -> Self:
@@ -521,6 +541,9 @@ class StateGraph(Generic[StateT, ContextT, InputT, OutputT]):
 
                 If a sequence is provided, the first matching policy will be applied.
             cache_policy: The cache policy for the node.
+            hedge_policy: The hedge policy for the node.
+
+                Runs slower than most recent runs are raced against a second run.
             destinations: Destinations that indicate where a node can route to.
 
                 Useful for edgeless graphs with nodes that return `Command` objects.
@@ -576,6 +599,7 @@ class StateGraph(Generic[StateT, ContextT, InputT, OutputT]):
         input_schema: type[NodeInputT] | None = None,
         retry_policy: RetryPolicy | Sequence[RetryPolicy] | None = None,
         cache_policy: CachePolicy | None = None,
+        hedge_policy: HedgePolicy | None = None,
         destinations: dict[str, str] | tuple[str, ...] | None = None,
         **kwargs: Unpack[DeprecatedKwargs],
     ) -> Self:
@@ -595,6 +619,9 @@ class StateGraph(Generic[StateT, ContextT, InputT, OutputT]):
 
                 If a sequence is provided, the first matching policy will be applied.
             cache_policy: The cache policy for the node.
+            hedge_policy: The hedge policy for the node.
+
+                Runs slower than most recent runs are raced against a second run.
             destinations: Destinations that indicate where a node can route to.
 
                 Useful for edgeless graphs with nodes that return `Command` objects.
@@ -752,6 +779,7 @@ class StateGraph(Generic[StateT, ContextT, InputT, OutputT]):
                 input_schema=input_schema,
                 retry_policy=retry_policy,
                 cache_policy=cache_policy,
+                hedge_policy=hedge_policy,
                 ends=ends,
                 defer=defer,
             )
@@ -762,6 +790,7 @@ class StateGraph(Generic[StateT, ContextT, InputT, OutputT]):
                 input_schema=inferred_input_schema,
                 retry_policy=retry_policy,
                 cache_policy=cache_policy,
+                hedge_policy=hedge_policy,
                 ends=ends,
                 defer=defer,
             )
@@ -772,6 +801,7 @@ class StateGraph(Generic[StateT, ContextT, InputT, OutputT]):
                 input_schema=self.state_schema,
                 retry_policy=retry_policy,
                 cache_policy=cache_policy,
+                hedge_policy=hedge_policy,
                 ends=ends,
                 defer=defer,
             )
@@ -843,6 +873,8 @@ class StateGraph(Generic[StateT, ContextT, InputT, OutputT]):
         | Callable[..., Awaitable[Hashable | Sequence[Hashable]]]
         | Runnable[Any, Hashable | Sequence[Hashable]],
         path_map: dict[Hashable, str] | list[str] | None = None,
+        *,
+        speculate: Sequence[str] = (),
     ) -> Self:
         """Add a conditional edge from the starting node to any number of destination nodes.
 
@@ -857,6 +889,24 @@ class StateGraph(Generic[StateT, ContextT, InputT, OutputT]):
             path_map: Optional mapping of paths to node names.
 
                 If omitted the paths returned by `path` should be node names.
+            speculate: Destination nodes to start in parallel with the starting
+                node, with the state the starting node is run with.
+
+                Once `path` picks the destinations, the runs of the other nodes
+                are cancelled. In sync runs, they run in the executor of the
+                graph run, and a run that already started can't be cancelled: it
+                runs to completion, and the graph run waits for it before
+                returning. So each listed node that isn't picked costs a wasted
+                run, eg. a model call. A picked node returns the result of its
+                run, unless the state it reads changed in keys not written by
+                the starting node, or the run failed, in which case it runs
+                again. Only list nodes whose result doesn't depend on the keys
+                the starting node writes, and that are likely to be picked.
+
+                Speculative runs can't write to channels, make calls, raise
+                interrupts or run subgraphs; such runs fail and the node is run
+                as usual. Their output to the stream writer is only streamed if
+                their result is used, and they aren't traced.
 
         Returns:
             Self: The instance of the graph, allowing for method chaining.
@@ -881,7 +931,9 @@ class StateGraph(Generic[StateT, ContextT, InputT, OutputT]):
                 f"Branch with name `{path.name}` already exists for node `{source}`"
             )
         # save it
-        self.branches[source][name] = BranchSpec.from_path(path, path_map, True)
+        self.branches[source][name] = BranchSpec.from_path(
+            path, path_map, True, speculate
+        )
         if schema := self.branches[source][name].input_schema:
             self._add_schema(schema)
         return self
@@ -1017,6 +1069,16 @@ class StateGraph(Generic[StateT, ContextT, InputT, OutputT]):
                     for node in self.nodes:
                         if node != start:
                             all_targets.add(node)
+                for node in branch.speculate:
+                    if node not in self.nodes or node == start:
+                        raise ValueError(
+                            f"At '{start}' node, '{cond}' branch can't speculate '{node}'"
+                        )
+                    if branch.ends is not None and node not in branch.ends.values():
+                        raise ValueError(
+                            f"At '{start}' node, '{cond}' branch speculates '{node}', "
+                            "which it can't route to"
+                        )
         for name, spec in self.nodes.items():
             if spec.ends:
                 all_targets.update(spec.ends)
@@ -1038,10 +1100,12 @@ class StateGraph(Generic[StateT, ContextT, InputT, OutputT]):
         *,
         cache: BaseCache | None = None,
         store: BaseStore | None = None,
+        executor: SharedExecutor | None = None,
         interrupt_before: All | list[str] | None = None,
         interrupt_after: All | list[str] | None = None,
         debug: bool = False,
         name: str | None = None,
+        compile_cache: CompileCache | None = None,
     ) -> CompiledStateGraph[StateT, ContextT, InputT, OutputT]:
         """Compiles the `StateGraph` into a `CompiledStateGraph` object.
 
@@ -1070,10 +1134,15 @@ class StateGraph(Generic[StateT, ContextT, InputT, OutputT]):
                 unique ID for independent runs, or reuse the same ID to accumulate state
                 across invocations (e.g., for conversation memory).
 
+            executor: An optional long-lived thread pool to run the graph's sync tasks in,
+                instead of creating a thread pool for each run. Useful when invoking
+                small graphs many times, see `SharedExecutor`.
             interrupt_before: An optional list of node names to interrupt before.
             interrupt_after: An optional list of node names to interrupt after.
             debug: A flag indicating whether to enable debug mode.
             name: The name to use for the compiled graph.
+            compile_cache: An optional cache of the analysis of node functions, to
+                compile graphs faster in later processes, see `CompileCache`.
 
         Returns:
             CompiledStateGraph: The compiled `StateGraph`.
@@ -1133,12 +1202,13 @@ class StateGraph(Generic[StateT, ContextT, InputT, OutputT]):
             debug=debug,
             store=store,
             cache=cache,
+            executor=executor,
             name=name or "LangGraph",
         )
 
         compiled.attach_node(START, None)
         for key, node in self.nodes.items():
-            compiled.attach_node(key, node)
+            compiled.attach_node(key, node, compile_cache)
 
         for start, end in self.edges:
             compiled.attach_edge(start, end)
@@ -1150,7 +1220,10 @@ class StateGraph(Generic[StateT, ContextT, InputT, OutputT]):
             for name, branch in branches.items():
                 compiled.attach_branch(start, name, branch)
 
-        return compiled.validate()
+        compiled.validate()
+        if compile_cache is not None:
+            compile_cache.save()
+        return compiled
 
 
 class CompiledStateGraph(
@@ -1159,17 +1232,32 @@ class CompiledStateGraph(
 ):
     builder: StateGraph[StateT, ContextT, InputT, OutputT]
     schema_to_mapper: dict[type[Any], Callable[[Any], Any] | None]
+    hedged_nodes: dict[str, HedgedNode]
 
     def __init__(
         self,
         *,
         builder: StateGraph[StateT, ContextT, InputT, OutputT],
         schema_to_mapper: dict[type[Any], Callable[[Any], Any] | None],
+        hedged_nodes: dict[str, HedgedNode] | None = None,
         **kwargs: Any,
     ) -> None:
         super().__init__(**kwargs)
         self.builder = builder
         self.schema_to_mapper = schema_to_mapper
+        self.hedged_nodes = hedged_nodes if hedged_nodes is not None else {}
+
+    def get_hedge_stats(self) -> dict[str, dict[str, Any]]:
+        """Get the hedging statistics of the nodes with a hedge policy.
+
+        Returns:
+            A dict from node name to the statistics of its runs in this process:
+            `runs`, `hedged` (runs raced against a second run), `wins` (hedged
+            runs where the second run finished first), `hedge_rate`, `win_rate`,
+            and `delay`, the current time in seconds after which runs are hedged,
+            or `None` until enough runs were seen.
+        """
+        return {name: node.stats() for name, node in self.hedged_nodes.items()}
 
     def get_input_jsonschema(
         self, config: RunnableConfig | None = None
@@ -1191,7 +1279,12 @@ class CompiledStateGraph(
             name=self.get_name("Output"),
         )
 
-    def attach_node(self, key: str, node: StateNodeSpec[Any, ContextT] | None) -> None:
+    def attach_node(
+        self,
+        key: str,
+        node: StateNodeSpec[Any, ContextT] | None,
+        compile_cache: CompileCache | None = None,
+    ) -> None:
         if key == START:
             output_keys = [
                 k
@@ -1290,7 +1383,16 @@ class CompiledStateGraph(
                 retry_policy=node.retry_policy,
                 cache_policy=node.cache_policy,
                 bound=node.runnable,  # type: ignore[arg-type]
+                compile_cache=compile_cache,
             )
+            if node.hedge_policy is not None:
+                if self.nodes[key].subgraphs:
+                    raise ValueError(
+                        f"Node '{key}' runs a subgraph, it can't be hedged"
+                    )
+                self.nodes[key].bound = self.hedged_nodes[key] = HedgedNode(
+                    key, node.hedge_policy, self.nodes[key].bound
+                )
         else:
             raise RuntimeError
 
@@ -1366,8 +1468,22 @@ class CompiledStateGraph(
         else:
             reader = None
 
+        # start speculative runs of targets along with the start node
+        speculative = [self._speculative_node(node) for node in branch.speculate]
+        if speculative:
+            self.nodes[start].bound = speculate(self.nodes[start].bound, speculative)
+
         # attach branch publisher
-        self.nodes[start].writers.append(branch.run(get_writes, reader))
+        self.nodes[start].writers.append(branch.run(get_writes, reader, speculative))
+
+    def _speculative_node(self, key: str) -> SpeculativeNode:
+        node = self.nodes[key]
+        if isinstance(node.bound, SpeculativeNode):
+            return node.bound
+        if node.subgraphs:
+            raise ValueError(f"Node '{key}' runs a subgraph, it can't be speculated")
+        node.bound = SpeculativeNode(key, node.bound, node.channels, node.mapper)
+        return node.bound
 
     def _migrate_checkpoint(self, checkpoint: Checkpoint) -> None:
         """Migrate a checkpoint to new channel layout."""
@@ -1643,6 +1759,13 @@ def _is_field_binop(typ: type[Any]) -> BinaryOperatorAggregate | None:
                 )
                 == 2
             ):
+                from langgraph.graph.message import (
+                    _AddMessagesAggregate,
+                    add_messages,
+                )
+
+                if meta[-1] is add_messages:
+                    return _AddMessagesAggregate(typ, meta[-1])
                 return BinaryOperatorAggregate(typ, meta[-1])
             else:
                 raise ValueError(
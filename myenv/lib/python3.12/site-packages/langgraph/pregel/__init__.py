@@ -1,3 +1,28 @@
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+from langgraph.pregel._executor import SharedExecutor
 from langgraph.pregel.main import NodeBuilder, Pregel
 
-__all__ = ("Pregel", "NodeBuilder")
+if TYPE_CHECKING:
+    from langgraph.pregel._batching import BatchedRunnable
+
+__all__ = ("Pregel", "NodeBuilder", "SharedExecutor", "BatchedRunnable")
+
+# imported on first access, as running a graph doesn't need them
+_LAZY_IMPORTS = {
+    "BatchedRunnable": "langgraph.pregel._batching",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if (module := _LAZY_IMPORTS.get(name)) is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = globals()[name] = getattr(import_module(module), name)
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_IMPORTS})
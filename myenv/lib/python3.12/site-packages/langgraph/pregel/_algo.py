@@ -112,6 +112,23 @@ class PregelTaskWrites(NamedTuple):
     triggers: Sequence[str]
 
 
+class ReactiveChannels(NamedTuple):
+    """Names of the channels that need to be notified at the end of a step
+    even if they received no writes, see `BaseChannel.reacts_to_empty_step`
+    and `BaseChannel.reacts_to_finish`."""
+
+    empty_step: Sequence[str]
+    finish: Sequence[str]
+
+
+def get_reactive_channels(channels: Mapping[str, BaseChannel]) -> ReactiveChannels:
+    """Precompute the channels `apply_writes` notifies on empty steps and finish."""
+    return ReactiveChannels(
+        [k for k, c in channels.items() if c.reacts_to_empty_step],
+        [k for k, c in channels.items() if c.reacts_to_finish],
+    )
+
+
 class Call:
     __slots__ = ("func", "input", "retry_policy", "cache_policy", "callbacks")
 
@@ -220,6 +237,7 @@ def apply_writes(
     tasks: Iterable[WritesProtocol],
     get_next_version: GetNextVersion | None,
     trigger_to_nodes: Mapping[str, Sequence[str]],
+    reactive_channels: ReactiveChannels | None = None,
 ) -> set[str]:
     """Apply writes from a set of tasks (usually the tasks from a Pregel step)
     to the checkpoint and channels, and return managed values writes to be applied
@@ -231,6 +249,9 @@ def apply_writes(
         tasks: The tasks to apply writes from.
         get_next_version: Optional function to determine the next version of a channel.
         trigger_to_nodes: Mapping of channel names to the set of nodes that can be triggered by updates to that channel.
+        reactive_channels: The result of `get_reactive_channels(channels)`, which
+            callers applying writes repeatedly to the same channels should
+            compute once. Computed on each call if not provided.
 
     Returns:
         Set of channels that were updated in this step.
@@ -300,8 +321,10 @@ def apply_writes(
                     updated_channels.add(chan)
 
     # Channels that weren't updated in this step are notified of a new step
+    if reactive_channels is None:
+        reactive_channels = get_reactive_channels(channels)
     if bump_step:
-        for chan in channels:
+        for chan in reactive_channels.empty_step:
             if channels[chan].is_available() and chan not in updated_channels:
                 if channels[chan].update(EMPTY_SEQ) and next_version is not None:
                     checkpoint["channel_versions"][chan] = next_version
@@ -311,7 +334,7 @@ def apply_writes(
 
     # If this is (tentatively) the last superstep, notify all channels of finish
     if bump_step and updated_channels.isdisjoint(trigger_to_nodes):
-        for chan in channels:
+        for chan in reactive_channels.finish:
             if channels[chan].finish() and next_version is not None:
                 checkpoint["channel_versions"][chan] = next_version
                 # unavailable channels can't trigger tasks, so don't add them
@@ -1131,6 +1154,13 @@ def _proc_input(
     # if in cache return shallow copy
     if input_cache is not None and proc.input_cache_key in input_cache:
         return copy(input_cache[proc.input_cache_key])
+    # If the task isn't executed its input isn't used, only whether it has one
+    if not for_execution:
+        if isinstance(proc.channels, str) and not (
+            proc.channels in channels and channels[proc.channels].is_available()
+        ):
+            return MISSING
+        return None
     # If all trigger channels subscribed by this process are not empty
     # then invoke the process with the values of all non-empty channels
     if isinstance(proc.channels, list):
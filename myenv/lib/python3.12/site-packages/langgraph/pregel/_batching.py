@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import threading
+import weakref
+from typing import Any, Generic
+
+from langchain_core.runnables import Runnable, RunnableConfig
+from langchain_core.runnables.config import ensure_config
+from langchain_core.runnables.utils import Input, Output
+
+
+class _Batch(Generic[Input, Output]):
+    """Calls waiting to be sent to the wrapped runnable together."""
+
+    __slots__ = ("inputs", "configs", "futures", "full")
+
+    def __init__(self, full: Any) -> None:
+        self.inputs: list[Input] = []
+        self.configs: list[RunnableConfig] = []
+        self.futures: list[Any] = []
+        # set once the batch is full
+        self.full = full
+
+
+class BatchedRunnable(Runnable[Input, Output]):
+    """A runnable that groups concurrent calls into batch calls of another runnable.
+
+    Calls to `invoke` made from different threads, and calls to `ainvoke` made on
+    the same event loop, within `max_delay` seconds of the first one are sent to
+    the wrapped runnable as a single `batch` or `abatch` call. Each call then
+    returns its own result, or raises its own exception. The first call of a batch
+    waits up to `max_delay` for others to join it, and a batch is sent right away
+    once it holds `max_batch_size` calls.
+
+    This lets nodes of many concurrent runs of a graph, eg. from `graph.batch()`,
+    share batch calls to a model or embedder, without changing the nodes. Calls
+    with extra keyword arguments are passed through one by one.
+
+    Args:
+        bound: The runnable to send batches to.
+        max_batch_size: The maximum number of calls in a batch.
+        max_delay: How long in seconds the first call of a batch waits for more.
+
+    Example:
+        ```python
+        from langgraph.pregel import BatchedRunnable
+
+        model = BatchedRunnable(ChatOpenAI(), max_batch_size=32, max_delay=0.02)
+
+
+        def find_sentiment(state: ReviewState):
+            return {"sentiment": model.invoke(state["review_text"]).content}
+
+
+        graph.batch([{"review_text": review} for review in reviews])
+        ```
+    """
+
+    def __init__(
+        self,
+        bound: Runnable[Input, Output],
+        *,
+        max_batch_size: int = 16,
+        max_delay: float = 0.01,
+    ) -> None:
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be a positive integer")
+        self.bound = bound
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self.name = f"Batched{bound.get_name()}"
+        self._lock = threading.Lock()
+        self._batch: _Batch[Input, Output] | None = None
+        self._abatches: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, _Batch[Input, Output]
+        ] = weakref.WeakKeyDictionary()
+        self._tasks: set[asyncio.Task] = set()
+
+    @property
+    def InputType(self) -> Any:
+        return self.bound.InputType
+
+    @property
+    def OutputType(self) -> Any:
+        return self.bound.OutputType
+
+    def invoke(
+        self, input: Input, config: RunnableConfig | None = None, **kwargs: Any
+    ) -> Output:
+        if kwargs:
+            return self.bound.invoke(input, config, **kwargs)
+        future: concurrent.futures.Future[Output] = concurrent.futures.Future()
+        with self._lock:
+            if leader := self._batch is None:
+                self._batch = _Batch(threading.Event())
+            batch = self._batch
+            self._add(batch, input, config, future)
+            if len(batch.inputs) >= self.max_batch_size:
+                self._batch = None
+                batch.full.set()
+        if leader:
+            batch.full.wait(self.max_delay)
+            with self._lock:
+                if self._batch is batch:
+                    self._batch = None
+            try:
+                results = self.bound.batch(
+                    batch.inputs, batch.configs, return_exceptions=True
+                )
+            except BaseException as exc:
+                results = [exc] * len(batch.inputs)
+            self._set_results(batch, results)
+        return future.result()
+
+    async def ainvoke(
+        self, input: Input, config: RunnableConfig | None = None, **kwargs: Any
+    ) -> Output:
+        if kwargs:
+            return await self.bound.ainvoke(input, config, **kwargs)
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[Output] = loop.create_future()
+        if (batch := self._abatches.get(loop)) is None:
+            batch = self._abatches[loop] = _Batch(asyncio.Event())
+            # sent from its own task, so that cancelling a call doesn't cancel it
+            task = loop.create_task(self._asend(loop, batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        self._add(batch, input, config, future)
+        if len(batch.inputs) >= self.max_batch_size:
+            del self._abatches[loop]
+            batch.full.set()
+        return await future
+
+    async def _asend(
+        self, loop: asyncio.AbstractEventLoop, batch: _Batch[Input, Output]
+    ) -> None:
+        try:
+            await asyncio.wait_for(batch.full.wait(), self.max_delay)
+        except asyncio.TimeoutError:
+            pass
+        if self._abatches.get(loop) is batch:
+            del self._abatches[loop]
+        try:
+            results = await self.bound.abatch(
+                batch.inputs, batch.configs, return_exceptions=True
+            )
+        except BaseException as exc:
+            results = [exc] * len(batch.inputs)
+        self._set_results(batch, results)
+
+    def _add(
+        self,
+        batch: _Batch[Input, Output],
+        input: Input,
+        config: RunnableConfig | None,
+        future: concurrent.futures.Future[Output] | asyncio.Future[Output],
+    ) -> None:
+        batch.inputs.append(input)
+        batch.configs.append(ensure_config(config))
+        batch.futures.append(future)
+
+    def _set_results(self, batch: _Batch[Input, Output], results: list[Any]) -> None:
+        for future, result in zip(batch.futures, results, strict=True):
+            if future.done():
+                # eg. the caller was cancelled
+                continue
+            if isinstance(result, asyncio.CancelledError):
+                future.cancel()
+            elif isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
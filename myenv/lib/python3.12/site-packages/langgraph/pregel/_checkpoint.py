@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Iterator, Mapping
 from datetime import datetime, timezone
+from typing import Any
 
 from langgraph.checkpoint.base import Checkpoint
 from langgraph.checkpoint.base.id import uuid6
@@ -58,8 +59,13 @@ def create_checkpoint(
 def channels_from_checkpoint(
     specs: Mapping[str, BaseChannel | ManagedValueSpec],
     checkpoint: Checkpoint,
+    *,
+    lazy: bool = False,
 ) -> tuple[Mapping[str, BaseChannel], ManagedValueMapping]:
-    """Get channels from a checkpoint."""
+    """Get channels from a checkpoint.
+
+    If `lazy` is set, each channel is restored the first time it is accessed,
+    so that channel values that are never read aren't deserialized either."""
     channel_specs: dict[str, BaseChannel] = {}
     managed_specs: dict[str, ManagedValueSpec] = {}
     for k, v in specs.items():
@@ -67,6 +73,8 @@ def channels_from_checkpoint(
             channel_specs[k] = v
         else:
             managed_specs[k] = v
+    if lazy:
+        return LazyChannels(channel_specs, checkpoint["channel_values"]), managed_specs
     return (
         {
             k: v.from_checkpoint(checkpoint["channel_values"].get(k, MISSING))
@@ -76,6 +84,38 @@ def channels_from_checkpoint(
     )
 
 
+class LazyChannels(Mapping[str, BaseChannel]):
+    """Channels restored from checkpointed values the first time they're accessed."""
+
+    __slots__ = ("specs", "values", "channels")
+
+    def __init__(
+        self, specs: Mapping[str, BaseChannel], values: Mapping[str, Any]
+    ) -> None:
+        self.specs = specs
+        self.values = values
+        self.channels: dict[str, BaseChannel] = {}
+
+    def __getitem__(self, key: str) -> BaseChannel:
+        try:
+            return self.channels[key]
+        except KeyError:
+            spec = self.specs[key]
+        channel = self.channels[key] = spec.from_checkpoint(
+            self.values.get(key, MISSING)
+        )
+        return channel
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.specs
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.specs)
+
+    def __len__(self) -> int:
+        return len(self.specs)
+
+
 def copy_checkpoint(checkpoint: Checkpoint) -> Checkpoint:
     return Checkpoint(
         v=checkpoint["v"],
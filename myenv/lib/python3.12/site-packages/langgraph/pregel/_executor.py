@@ -2,12 +2,15 @@ from __future__ import annotations
 
 import asyncio
 import concurrent.futures
+import threading
 import time
+from collections import deque
 from collections.abc import Awaitable, Callable, Coroutine
 from contextlib import AbstractAsyncContextManager, AbstractContextManager, ExitStack
 from contextvars import copy_context
 from types import TracebackType
 from typing import (
+    Any,
     Protocol,
     TypeVar,
     cast,
@@ -17,6 +20,7 @@ from langchain_core.runnables import RunnableConfig
 from langchain_core.runnables.config import get_executor_for_config
 from typing_extensions import ParamSpec
 
+from langgraph._internal._constants import CONF, CONFIG_KEY_EXECUTOR
 from langgraph._internal._future import CONTEXT_NOT_SUPPORTED, run_coroutine_threadsafe
 from langgraph.errors import GraphBubbleUp
 
@@ -37,6 +41,127 @@ class Submit(Protocol[P, T]):
     ) -> concurrent.futures.Future[T]: ...
 
 
+class SharedExecutor(AbstractContextManager):
+    """A long-lived, bounded thread pool shared by sync graph runs.
+
+    By default each sync run creates a thread pool on entry and shuts it down on
+    exit. When a graph is invoked many times, eg. from a server, reusing the
+    threads of a `SharedExecutor` avoids paying for that on every run.
+
+    Use it for all runs of a graph with `compile(executor=...)`, or for a single
+    run by setting it under the `"__pregel_executor"` key of
+    `config["configurable"]`.
+
+    Each run still only waits for, cancels and re-raises from its own tasks on
+    exit, and runs at most `max_concurrency` (from its config) tasks at a time.
+    Runs started from a thread of the pool, eg. subgraphs invoked by a node, use
+    a private thread pool instead, and so do tasks called by running tasks, eg.
+    `@task` functions called from an `@entrypoint`, so that tasks waiting on them
+    can't exhaust the pool.
+
+    Args:
+        max_workers: The maximum number of threads in the pool.
+        thread_name_prefix: The prefix for the names of the threads in the pool.
+
+    Example:
+        ```python
+        from langgraph.pregel import SharedExecutor
+
+        executor = SharedExecutor(max_workers=32)
+        graph = builder.compile(executor=executor)
+        ...
+        executor.shutdown()
+        ```
+    """
+
+    def __init__(
+        self, max_workers: int | None = None, *, thread_name_prefix: str = "langgraph"
+    ) -> None:
+        self.local = threading.local()
+        self.executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix=thread_name_prefix,
+            initializer=self._init_worker,
+        )
+
+    def _init_worker(self) -> None:
+        self.local.is_worker = True
+
+    def is_worker_thread(self) -> bool:
+        """Return `True` if called from one of the threads of this pool."""
+        return getattr(self.local, "is_worker", False)
+
+    def for_run(self, max_concurrency: int | None) -> concurrent.futures.Executor:
+        """Return an executor that submits the tasks of a single run to the pool."""
+        if max_concurrency is None:
+            return self.executor
+        return _RunExecutor(self.executor, max_concurrency)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down the pool, see `ThreadPoolExecutor.shutdown`."""
+        self.executor.shutdown(wait=wait)
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.shutdown()
+
+
+class _RunExecutor(concurrent.futures.Executor):
+    """Submits the tasks of a single run to a shared thread pool, running at most
+    `max_concurrency` of them at a time and queueing the rest, like a private
+    thread pool with `max_workers=max_concurrency` would."""
+
+    def __init__(
+        self, executor: concurrent.futures.Executor, max_concurrency: int
+    ) -> None:
+        self.executor = executor
+        self.max_concurrency = max_concurrency
+        self.running = 0
+        self.backlog: deque[tuple[concurrent.futures.Future, Callable, Any, Any]] = (
+            deque()
+        )
+        self.lock = threading.Lock()
+
+    def submit(  # type: ignore[override]
+        self, fn: Callable[..., T], /, *args: Any, **kwargs: Any
+    ) -> concurrent.futures.Future[T]:
+        fut: concurrent.futures.Future[T] = concurrent.futures.Future()
+        with self.lock:
+            if self.running >= self.max_concurrency:
+                self.backlog.append((fut, fn, args, kwargs))
+                return fut
+            self.running += 1
+        self.executor.submit(self._run, fut, fn, args, kwargs)
+        return fut
+
+    def _run(
+        self,
+        fut: concurrent.futures.Future,
+        fn: Callable,
+        args: Any,
+        kwargs: Any,
+    ) -> None:
+        while True:
+            # tasks cancelled while queued are skipped
+            if fut.set_running_or_notify_cancel():
+                try:
+                    result = fn(*args, **kwargs)
+                except BaseException as exc:
+                    fut.set_exception(exc)
+                else:
+                    fut.set_result(result)
+            # run the next queued task in the same thread, if any
+            with self.lock:
+                if not self.backlog:
+                    self.running -= 1
+                    return
+                fut, fn, args, kwargs = self.backlog.popleft()
+
+
 class BackgroundExecutor(AbstractContextManager):
     """A context manager that runs sync tasks in the background.
     Uses a thread pool executor to delegate tasks to separate threads.
@@ -47,7 +172,20 @@ class BackgroundExecutor(AbstractContextManager):
 
     def __init__(self, config: RunnableConfig) -> None:
         self.stack = ExitStack()
-        self.executor = self.stack.enter_context(get_executor_for_config(config))
+        self.config = config
+        # the thread running the loop, when tasks are submitted to a shared pool
+        self.owner: int | None = None
+        self.private: concurrent.futures.Executor | None = None
+        self.lock = threading.Lock()
+        shared: SharedExecutor | None = config.get(CONF, {}).get(CONFIG_KEY_EXECUTOR)
+        if shared is not None and not shared.is_worker_thread():
+            # the shared pool outlives this executor, so it's not shut down on exit
+            self.executor: concurrent.futures.Executor = shared.for_run(
+                config.get("max_concurrency")
+            )
+            self.owner = threading.get_ident()
+        else:
+            self.executor = self.stack.enter_context(get_executor_for_config(config))
         # mapping of Future to (__cancel_on_exit__, __reraise_on_exit__) flags
         self.tasks: dict[concurrent.futures.Future, tuple[bool, bool]] = {}
 
@@ -62,18 +200,31 @@ class BackgroundExecutor(AbstractContextManager):
         **kwargs: P.kwargs,
     ) -> concurrent.futures.Future[T]:
         ctx = copy_context()
+        executor = self._executor()
         if __next_tick__:
             task = cast(
                 concurrent.futures.Future[T],
-                self.executor.submit(next_tick, ctx.run, fn, *args, **kwargs),  # type: ignore[arg-type]
+                executor.submit(next_tick, ctx.run, fn, *args, **kwargs),  # type: ignore[arg-type]
             )
         else:
-            task = self.executor.submit(ctx.run, fn, *args, **kwargs)
+            task = executor.submit(ctx.run, fn, *args, **kwargs)
         self.tasks[task] = (__cancel_on_exit__, __reraise_on_exit__)
         # add a callback to remove the task from the tasks dict when it's done
         task.add_done_callback(self.done)
         return task
 
+    def _executor(self) -> concurrent.futures.Executor:
+        if self.owner is None or threading.get_ident() == self.owner:
+            return self.executor
+        # submitted by a running task, which may block a thread of the shared
+        # pool waiting on it, so it runs in a private pool, as in unshared runs
+        with self.lock:
+            if self.private is None:
+                self.private = self.stack.enter_context(
+                    get_executor_for_config(self.config)
+                )
+            return self.private
+
     def done(self, task: concurrent.futures.Future) -> None:
         """Remove the task from the tasks dict when it's done."""
         try:
@@ -53,6 +53,49 @@ def read_channels(
         return values
 
 
+class LazyValues(Mapping[str, Any]):
+    """The values of the `select` channels, each read on first access.
+
+    Channels without a value are left out, so iterating over it, or taking its
+    length, reads every channel."""
+
+    __slots__ = ("channels", "select", "selected", "values", "empty", "all")
+
+    def __init__(self, channels: Mapping[str, BaseChannel], select: Sequence[str]):
+        self.channels = channels
+        self.select = select
+        self.selected = frozenset(select)
+        self.values: dict[str, Any] = {}
+        self.empty: set[str] = set()
+        self.all: dict[str, Any] | None = None
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self.values:
+            return self.values[key]
+        if key not in self.selected or key in self.empty:
+            raise KeyError(key)
+        try:
+            value = self.values[key] = self.channels[key].get()
+        except EmptyChannelError:
+            self.empty.add(key)
+            raise KeyError(key) from None
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._read_all())
+
+    def __len__(self) -> int:
+        return len(self._read_all())
+
+    def __repr__(self) -> str:
+        return repr(self._read_all())
+
+    def _read_all(self) -> dict[str, Any]:
+        if self.all is None:
+            self.all = {k: self[k] for k in self.select if k in self}
+        return self.all
+
+
 def map_command(cmd: Command) -> Iterator[tuple[str, str, Any]]:
     """Map input chunk to a sequence of pending writes in the form (channel, value)."""
     if cmd.graph == Command.PARENT:
@@ -3,6 +3,7 @@ from __future__ import annotations
 import asyncio
 import binascii
 import concurrent.futures
+import time
 from collections import defaultdict, deque
 from collections.abc import Callable, Iterator, Mapping, Sequence
 from contextlib import (
@@ -75,8 +76,10 @@ from langgraph.pregel._algo import (
     Call,
     GetNextVersion,
     PregelTaskWrites,
+    ReactiveChannels,
     apply_writes,
     checkpoint_null_version,
+    get_reactive_channels,
     increment,
     prepare_next_tasks,
     prepare_single_task,
@@ -102,6 +105,7 @@ from langgraph.pregel._io import (
     map_output_values,
     read_channels,
 )
+from langgraph.pregel._profile import Profiler
 from langgraph.pregel._read import PregelNode
 from langgraph.pregel._utils import get_new_channel_versions, is_xxh3_128_hexdigest
 from langgraph.pregel.debug import (
@@ -180,6 +184,7 @@ class PregelLoop:
     _migrate_checkpoint: Callable[[Checkpoint], None] | None
     submit: Submit
     channels: Mapping[str, BaseChannel]
+    reactive_channels: ReactiveChannels
     managed: ManagedValueMapping
     checkpoint: Checkpoint
     checkpoint_id_saved: str
@@ -199,6 +204,7 @@ class PregelLoop:
         "out_of_steps",
     ]
     tasks: dict[str, PregelExecutableTask]
+    profiler: Profiler | None
     output: None | dict[str, Any] | Any = None
     updated_channels: set[str] | None = None
 
@@ -252,6 +258,11 @@ class PregelLoop:
         self.durability = durability
         if self.stream is not None and CONFIG_KEY_STREAM in config[CONF]:
             self.stream = DuplexStream(self.stream, config[CONF][CONFIG_KEY_STREAM])
+        self.profiler = (
+            Profiler()
+            if self.stream is not None and "profile" in self.stream.modes
+            else None
+        )
         scratchpad: PregelScratchpad | None = config[CONF].get(CONFIG_KEY_SCRATCHPAD)
         if isinstance(scratchpad, PregelScratchpad):
             # if count is > 0, append to checkpoint_ns
@@ -468,6 +479,9 @@ class PregelLoop:
             self.status = "out_of_steps"
             return False
 
+        if self.profiler is not None:
+            self.profiler.step_started = time.perf_counter()
+
         # prepare next tasks
         self.tasks = prepare_next_tasks(
             self.checkpoint,
@@ -514,6 +528,9 @@ class PregelLoop:
             self.status = "done"
             return False
 
+        if self.profiler is not None:
+            self.profiler.start_step(self.tasks)
+
         # if there are pending writes from a previous loop, apply them
         if self.skip_done_tasks and self.checkpoint_pending_writes:
             self._match_writes(self.tasks)
@@ -539,13 +556,17 @@ class PregelLoop:
         # finish superstep
         writes = [w for t in self.tasks.values() for w in t.writes]
         # all tasks have finished
+        started = time.perf_counter()
         self.updated_channels = apply_writes(
             self.checkpoint,
             self.channels,
             self.tasks.values(),
             self.checkpointer_get_next_version,
             self.trigger_to_nodes,
+            self.reactive_channels,
         )
+        if self.profiler is not None:
+            self.profiler.apply_writes = time.perf_counter() - started
         # produce values output
         if not self.updated_channels.isdisjoint(
             (self.output_keys,)
@@ -561,6 +582,9 @@ class PregelLoop:
         self.skip_done_tasks = True
         # save checkpoint
         self._put_checkpoint({"source": "loop"})
+        # produce profile output
+        if self.profiler is not None:
+            self._emit("profile", self.profiler.step_events, self.step - 1, self.tasks)
         # after execution, check if we should interrupt
         if self.interrupt_after and should_interrupt(
             self.checkpoint, self.interrupt_after, self.tasks.values()
@@ -675,6 +699,7 @@ class PregelLoop:
                 [PregelTaskWrites((), INPUT, null_writes, [])],
                 self.checkpointer_get_next_version,
                 self.trigger_to_nodes,
+                self.reactive_channels,
             )
             if updated_channels is not None:
                 updated_channels.update(null_updated_channels)
@@ -717,6 +742,7 @@ class PregelLoop:
                 ],
                 self.checkpointer_get_next_version,
                 self.trigger_to_nodes,
+                self.reactive_channels,
             )
             # save input checkpoint
             self.updated_channels = updated_channels
@@ -747,6 +773,7 @@ class PregelLoop:
             exiting or self.durability != "exit"
         )
         # create new checkpoint
+        started = time.perf_counter()
         self.checkpoint = create_checkpoint(
             self.checkpoint,
             self.channels if do_checkpoint else None,
@@ -754,6 +781,8 @@ class PregelLoop:
             id=self.checkpoint["id"] if exiting else None,
             updated_channels=self.updated_channels,
         )
+        if self.profiler is not None:
+            self.profiler.checkpoint = time.perf_counter() - started
         # sanitize TASK channel in the checkpoint before saving (durability=="exit")
         if TASKS in self.checkpoint["channel_values"] and any(
             isinstance(channel, UntrackedValue) for channel in self.channels.values()
@@ -844,6 +873,7 @@ class PregelLoop:
                     self.tasks.values(),
                     self.checkpointer_get_next_version,
                     self.trigger_to_nodes,
+                    self.reactive_channels,
                 )
                 if not updated_channels.isdisjoint(
                     (self.output_keys,)
@@ -909,6 +939,14 @@ class PregelLoop:
                     )
                 )
 
+    def _emit_put(self, metadata: CheckpointMetadata, duration: float) -> None:
+        event = {
+            "type": "checkpoint_put",
+            "step": metadata.get("step"),
+            "duration": duration,
+        }
+        self._emit("profile", iter, [event])
+
     def output_writes(
         self, task_id: str, writes: WritesT, *, cached: bool = False
     ) -> None:
@@ -1033,9 +1071,12 @@ class SyncPregelLoop(PregelLoop, AbstractContextManager):
             if prev is not None:
                 prev.result()
         finally:
+            started = time.perf_counter()
             cast(BaseCheckpointSaver, self.checkpointer).put(
                 config, checkpoint, metadata, new_versions
             )
+            if self.profiler is not None:
+                self._emit_put(metadata, time.perf_counter() - started)
 
     def match_cached_writes(self) -> Sequence[PregelExecutableTask]:
         if self.cache is None:
@@ -1114,6 +1155,7 @@ class SyncPregelLoop(PregelLoop, AbstractContextManager):
         self.channels, self.managed = channels_from_checkpoint(
             self.specs, self.checkpoint
         )
+        self.reactive_channels = get_reactive_channels(self.channels)
         self.stack.push(self._suppress_interrupt)
         self.status = "input"
         self.step = self.checkpoint_metadata["step"] + 1
@@ -1209,9 +1251,12 @@ class AsyncPregelLoop(PregelLoop, AbstractAsyncContextManager):
             if prev is not None:
                 await prev
         finally:
+            started = time.perf_counter()
             await cast(BaseCheckpointSaver, self.checkpointer).aput(
                 config, checkpoint, metadata, new_versions
             )
+            if self.profiler is not None:
+                self._emit_put(metadata, time.perf_counter() - started)
 
     async def amatch_cached_writes(self) -> Sequence[PregelExecutableTask]:
         if self.cache is None:
@@ -1295,6 +1340,7 @@ class AsyncPregelLoop(PregelLoop, AbstractAsyncContextManager):
         self.channels, self.managed = channels_from_checkpoint(
             self.specs, self.checkpoint
         )
+        self.reactive_channels = get_reactive_channels(self.channels)
         self.stack.push(self._suppress_interrupt)
         self.status = "input"
         self.step = self.checkpoint_metadata["step"] + 1
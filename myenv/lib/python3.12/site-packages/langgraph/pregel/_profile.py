@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Iterable, Iterator, Mapping
+from typing import Any
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.outputs import LLMResult
+
+from langgraph._internal._constants import NS_END, NS_SEP
+from langgraph.types import PregelExecutableTask
+
+
+class TaskProfile:
+    """Timings of a task, collected for stream_mode="profile"."""
+
+    __slots__ = ("queued", "started", "finished", "attempts", "backoff")
+
+    def __init__(self, queued: float) -> None:
+        self.queued = queued
+        self.started: float | None = None
+        self.finished: float | None = None
+        self.attempts = 0
+        # time slept between attempts, by the retry policy
+        self.backoff = 0.0
+
+    def attempt(self) -> None:
+        """Called by the runner before each attempt to run the task."""
+        if self.started is None:
+            self.started = time.perf_counter()
+        self.attempts += 1
+
+
+class Profiler(BaseCallbackHandler):
+    """Collects the task and step timings emitted by stream_mode="profile".
+
+    Also a callback handler, which adds up the token usage reported by the chat
+    models and LLMs called by each task.
+    """
+
+    # only LLM events are needed
+    ignore_chain = True
+    ignore_agent = True
+    ignore_retriever = True
+    ignore_retry = True
+    ignore_custom_event = True
+
+    def __init__(self) -> None:
+        self.tasks: dict[str, TaskProfile] = {}
+        self.usage: dict[str, dict[str, int]] = {}
+        self.llm_runs: dict[UUID, str] = {}
+        self.lock = threading.Lock()
+        # timings of the current step
+        self.step_started = 0.0
+        self.apply_writes = 0.0
+        self.checkpoint = 0.0
+
+    # tasks
+
+    def start_step(self, task_ids: Iterable[str]) -> None:
+        now = time.perf_counter()
+        self.tasks = {id: TaskProfile(now) for id in task_ids}
+        self.apply_writes = 0.0
+        self.checkpoint = 0.0
+
+    def task(self, task_id: str) -> TaskProfile:
+        if (profile := self.tasks.get(task_id)) is None:
+            # eg. pushed during the step
+            profile = self.tasks[task_id] = TaskProfile(time.perf_counter())
+        return profile
+
+    def finish(self, task_id: str) -> None:
+        if (profile := self.tasks.get(task_id)) is not None:
+            profile.finished = time.perf_counter()
+
+    def step_events(
+        self, step: int, tasks: Mapping[str, PregelExecutableTask]
+    ) -> Iterator[dict[str, Any]]:
+        """Events for the tasks that ran in this step, then for the step itself."""
+        queue_wait = 0.0
+        task_time = 0.0
+        backoff = 0.0
+        step_usage: dict[str, int] = {}
+        count = 0
+        for id, profile in self.tasks.items():
+            if profile.started is None or (task := tasks.get(id)) is None:
+                # not run, eg. cached or resumed
+                continue
+            finished = profile.finished or time.perf_counter()
+            usage = self.usage.pop(id, None)
+            # the time spent running the task, without the retry backoff
+            duration = finished - profile.started - profile.backoff
+            count += 1
+            queue_wait += profile.started - profile.queued
+            task_time += duration
+            backoff += profile.backoff
+            if usage:
+                _add_usage(step_usage, usage)
+            yield {
+                "type": "task",
+                "step": step,
+                "id": id,
+                "name": task.name,
+                "queue_wait": profile.started - profile.queued,
+                "duration": duration,
+                "attempts": profile.attempts,
+                "backoff": profile.backoff,
+                "usage": usage,
+            }
+        yield {
+            "type": "step",
+            "step": step,
+            "tasks": count,
+            "duration": time.perf_counter() - self.step_started,
+            "queue_wait": queue_wait,
+            "task_time": task_time,
+            "backoff": backoff,
+            "apply_writes": self.apply_writes,
+            "checkpoint": self.checkpoint,
+            "usage": step_usage or None,
+        }
+
+    # callbacks
+
+    def on_llm_start(
+        self,
+        serialized: dict[str, Any],
+        prompts: list[str],
+        *,
+        run_id: UUID,
+        metadata: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        self._start(run_id, metadata)
+
+    def on_chat_model_start(
+        self,
+        serialized: dict[str, Any],
+        messages: list[list[Any]],
+        *,
+        run_id: UUID,
+        metadata: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        self._start(run_id, metadata)
+
+    def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs: Any) -> Any:
+        if (task_id := self.llm_runs.pop(run_id, None)) is None:
+            return
+        if usage := _get_usage(response):
+            with self.lock:
+                _add_usage(self.usage.setdefault(task_id, {}), usage)
+
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> Any:
+        self.llm_runs.pop(run_id, None)
+
+    def _start(self, run_id: UUID, metadata: dict[str, Any] | None) -> None:
+        if not metadata or not (ns := metadata.get("langgraph_checkpoint_ns")):
+            return
+        # the namespace holds the ids of the task and its parent tasks, the
+        # usage of models called in subgraphs is added to the parent task too
+        for part in ns.split(NS_SEP):
+            if (task_id := part.rpartition(NS_END)[2]) in self.tasks:
+                self.llm_runs[run_id] = task_id
+                return
+
+
+def _get_usage(response: LLMResult) -> dict[str, int]:
+    usage: dict[str, int] = {}
+    for generations in response.generations:
+        for generation in generations:
+            message = getattr(generation, "message", None)
+            if metadata := getattr(message, "usage_metadata", None):
+                _add_usage(
+                    usage,
+                    {
+                        "input_tokens": metadata.get("input_tokens", 0),
+                        "output_tokens": metadata.get("output_tokens", 0),
+                        "total_tokens": metadata.get("total_tokens", 0),
+                    },
+                )
+    if not usage and response.llm_output:
+        # LLMs that report usage for the whole call instead
+        if token_usage := response.llm_output.get("token_usage"):
+            _add_usage(
+                usage,
+                {
+                    "input_tokens": token_usage.get("prompt_tokens", 0),
+                    "output_tokens": token_usage.get("completion_tokens", 0),
+                    "total_tokens": token_usage.get("total_tokens", 0),
+                },
+            )
+    return usage
+
+
+def _add_usage(total: dict[str, int], usage: Mapping[str, int]) -> None:
+    for key, value in usage.items():
+        total[key] = total.get(key, 0) + (value or 0)
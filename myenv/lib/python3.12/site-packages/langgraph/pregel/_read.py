@@ -3,6 +3,7 @@ from __future__ import annotations
 from collections.abc import AsyncIterator, Callable, Iterator, Mapping, Sequence
 from functools import cached_property
 from typing import (
+    TYPE_CHECKING,
     Any,
 )
 
@@ -16,6 +17,9 @@ from langgraph.pregel._write import ChannelWrite
 from langgraph.pregel.protocol import PregelProtocol
 from langgraph.types import CachePolicy, RetryPolicy
 
+if TYPE_CHECKING:
+    from langgraph.graph._compile_cache import CompileCache
+
 READ_TYPE = Callable[[str | Sequence[str], bool], Any | dict[str, Any]]
 INPUT_CACHE_KEY_TYPE = tuple[Callable[..., Any], tuple[str, ...]]
 
@@ -145,6 +149,7 @@ class PregelNode:
         retry_policy: RetryPolicy | Sequence[RetryPolicy] | None = None,
         cache_policy: CachePolicy | None = None,
         subgraphs: Sequence[PregelProtocol] | None = None,
+        compile_cache: CompileCache | None = None,
     ) -> None:
         self.channels = channels
         self.triggers = list(triggers)
@@ -162,7 +167,7 @@ class PregelNode:
             self.subgraphs = subgraphs
         elif self.bound is not DEFAULT_BOUND:
             try:
-                subgraph = find_subgraph_pregel(self.bound)
+                subgraph = find_subgraph_pregel(self.bound, compile_cache)
             except Exception:
                 subgraph = None
             if subgraph:
@@ -17,6 +17,7 @@ from langgraph._internal._constants import (
     NS_SEP,
 )
 from langgraph.errors import GraphBubbleUp, ParentCommand
+from langgraph.pregel._profile import TaskProfile
 from langgraph.types import Command, PregelExecutableTask, RetryPolicy
 
 logger = logging.getLogger(__name__)
@@ -27,6 +28,7 @@ def run_with_retry(
     task: PregelExecutableTask,
     retry_policy: Sequence[RetryPolicy] | None,
     configurable: dict[str, Any] | None = None,
+    profile: TaskProfile | None = None,
 ) -> None:
     """Run a task with retries."""
     retry_policy = task.retry_policy or retry_policy
@@ -35,6 +37,8 @@ def run_with_retry(
     if configurable is not None:
         config = patch_configurable(config, configurable)
     while True:
+        if profile is not None:
+            profile.attempt()
         try:
             # clear any writes from previous attempts
             task.writes.clear()
@@ -94,6 +98,8 @@ def run_with_retry(
             sleep_time = (
                 interval + random.uniform(0, 1) if matching_policy.jitter else interval
             )
+            if profile is not None:
+                profile.backoff += sleep_time
             time.sleep(sleep_time)
 
             # log the retry
@@ -112,6 +118,7 @@ async def arun_with_retry(
     match_cached_writes: Callable[[], Awaitable[Sequence[PregelExecutableTask]]]
     | None = None,
     configurable: dict[str, Any] | None = None,
+    profile: TaskProfile | None = None,
 ) -> None:
     """Run a task asynchronously with retries."""
     retry_policy = task.retry_policy or retry_policy
@@ -125,6 +132,8 @@ async def arun_with_retry(
                 # if the task is already cached, return
                 return
     while True:
+        if profile is not None:
+            profile.attempt()
         try:
             # clear any writes from previous attempts
             task.writes.clear()
@@ -190,6 +199,8 @@ async def arun_with_retry(
             sleep_time = (
                 interval + random.uniform(0, 1) if matching_policy.jitter else interval
             )
+            if profile is not None:
+                profile.backoff += sleep_time
             await asyncio.sleep(sleep_time)
 
             # log the retry
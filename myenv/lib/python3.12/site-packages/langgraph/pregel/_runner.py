@@ -28,6 +28,7 @@ from langgraph._internal._constants import (
     CONF,
     CONFIG_KEY_CALL,
     CONFIG_KEY_SCRATCHPAD,
+    CONFIG_KEY_TASK_SUBMIT,
     ERROR,
     INTERRUPT,
     NO_WRITES,
@@ -41,6 +42,7 @@ from langgraph.constants import TAG_HIDDEN
 from langgraph.errors import GraphBubbleUp, GraphInterrupt
 from langgraph.pregel._algo import Call
 from langgraph.pregel._executor import Submit
+from langgraph.pregel._profile import Profiler, TaskProfile
 from langgraph.pregel._retry import arun_with_retry, run_with_retry
 from langgraph.types import (
     CachePolicy,
@@ -131,11 +133,13 @@ class PregelRunner:
         put_writes: weakref.ref[Callable[[str, Sequence[tuple[str, Any]]], None]],
         use_astream: bool = False,
         node_finished: Callable[[str], None] | None = None,
+        profiler: Profiler | None = None,
     ) -> None:
         self.submit = submit
         self.put_writes = put_writes
         self.use_astream = use_astream
         self.node_finished = node_finished
+        self.profiler = profiler
 
     def tick(
         self,
@@ -167,6 +171,7 @@ class PregelRunner:
                 run_with_retry(
                     t,
                     retry_policy,
+                    profile=self._profile(t),
                     configurable={
                         CONFIG_KEY_CALL: partial(
                             _call,
@@ -176,6 +181,7 @@ class PregelRunner:
                             schedule_task=schedule_task,
                             submit=self.submit,
                         ),
+                        CONFIG_KEY_TASK_SUBMIT: self.submit,
                     },
                 )
                 self.commit(t, None)
@@ -208,6 +214,7 @@ class PregelRunner:
                 run_with_retry,
                 t,
                 retry_policy,
+                profile=self._profile(t),
                 configurable={
                     CONFIG_KEY_CALL: partial(
                         _call,
@@ -217,6 +224,7 @@ class PregelRunner:
                         schedule_task=schedule_task,
                         submit=self.submit,
                     ),
+                    CONFIG_KEY_TASK_SUBMIT: self.submit,
                 },
                 __reraise_on_exit__=reraise,
             )
@@ -305,6 +313,7 @@ class PregelRunner:
                     t,
                     retry_policy,
                     stream=self.use_astream,
+                    profile=self._profile(t),
                     configurable={
                         CONFIG_KEY_CALL: partial(
                             _acall,
@@ -351,6 +360,7 @@ class PregelRunner:
                     t,
                     retry_policy,
                     stream=self.use_astream,
+                    profile=self._profile(t),
                     configurable={
                         CONFIG_KEY_CALL: partial(
                             _acall,
@@ -422,11 +432,16 @@ class PregelRunner:
                 exc.__traceback__ = tb
             raise
 
+    def _profile(self, task: PregelExecutableTask) -> TaskProfile | None:
+        return self.profiler.task(task.id) if self.profiler is not None else None
+
     def commit(
         self,
         task: PregelExecutableTask,
         exception: BaseException | None,
     ) -> None:
+        if self.profiler is not None:
+            self.profiler.finish(task.id)
         if isinstance(exception, asyncio.CancelledError):
             # for cancelled tasks, also save error in task,
             # so loop can finish super-step
@@ -601,6 +616,7 @@ def _call(
                         schedule_task=schedule_task,
                         submit=submit,
                     ),
+                    CONFIG_KEY_TASK_SUBMIT: submit,
                 },
                 __reraise_on_exit__=False,
                 # starting a new task in the next tick ensures
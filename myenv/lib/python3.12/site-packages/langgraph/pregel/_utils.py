@@ -5,7 +5,7 @@ import inspect
 import re
 import textwrap
 from collections.abc import Callable
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from langchain_core.runnables import Runnable, RunnableLambda, RunnableSequence
 from langgraph.checkpoint.base import ChannelVersions
@@ -14,6 +14,9 @@ from typing_extensions import override
 from langgraph._internal._runnable import RunnableCallable, RunnableSeq
 from langgraph.pregel.protocol import PregelProtocol
 
+if TYPE_CHECKING:
+    from langgraph.graph._compile_cache import CompileCache
+
 
 def get_new_channel_versions(
     previous_versions: ChannelVersions, current_versions: ChannelVersions
@@ -33,7 +36,9 @@ def get_new_channel_versions(
     return new_versions
 
 
-def find_subgraph_pregel(candidate: Runnable) -> PregelProtocol | None:
+def find_subgraph_pregel(
+    candidate: Runnable, compile_cache: CompileCache | None = None
+) -> PregelProtocol | None:
     from langgraph.pregel import Pregel
 
     candidates: list[Runnable] = [candidate]
@@ -53,31 +58,36 @@ def find_subgraph_pregel(candidate: Runnable) -> PregelProtocol | None:
             if c.func is not None:
                 candidates.extend(
                     nl.__self__ if hasattr(nl, "__self__") else nl
-                    for nl in get_function_nonlocals(c.func)
+                    for nl in get_function_nonlocals(c.func, compile_cache)
                 )
             elif c.afunc is not None:
                 candidates.extend(
                     nl.__self__ if hasattr(nl, "__self__") else nl
-                    for nl in get_function_nonlocals(c.afunc)
+                    for nl in get_function_nonlocals(c.afunc, compile_cache)
                 )
 
     return None
 
 
-def get_function_nonlocals(func: Callable) -> list[Any]:
+def get_function_nonlocals(
+    func: Callable, compile_cache: CompileCache | None = None
+) -> list[Any]:
     """Get the nonlocal variables accessed by a function.
 
     Args:
         func: The function to check.
+        compile_cache: A cache of the names accessed by functions, to skip parsing
+            their source.
 
     Returns:
         List[Any]: The nonlocal variables accessed by the function.
     """
     try:
-        code = inspect.getsource(func)
-        tree = ast.parse(textwrap.dedent(code))
-        visitor = FunctionNonLocals()
-        visitor.visit(tree)
+        nonlocals = (
+            compile_cache.function_names(func, _get_nonlocal_names)
+            if compile_cache is not None
+            else _get_nonlocal_names(func)
+        )
         values: list[Any] = []
         closure = (
             inspect.getclosurevars(func.__wrapped__)
@@ -86,9 +96,9 @@ def get_function_nonlocals(func: Callable) -> list[Any]:
         )
         candidates = {**closure.globals, **closure.nonlocals}
         for k, v in candidates.items():
-            if k in visitor.nonlocals:
+            if k in nonlocals:
                 values.append(v)
-            for kk in visitor.nonlocals:
+            for kk in nonlocals:
                 if "." in kk and kk.startswith(k):
                     vv = v
                     for part in kk.split(".")[1:]:
@@ -107,6 +117,14 @@ def get_function_nonlocals(func: Callable) -> list[Any]:
     return values
 
 
+def _get_nonlocal_names(func: Callable) -> set[str]:
+    code = inspect.getsource(func)
+    tree = ast.parse(textwrap.dedent(code))
+    visitor = FunctionNonLocals()
+    visitor.visit(tree)
+    return visitor.nonlocals
+
+
 class FunctionNonLocals(ast.NodeVisitor):
     """Get the nonlocal variables accessed of a function."""
 
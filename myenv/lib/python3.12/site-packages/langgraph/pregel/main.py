@@ -20,6 +20,7 @@ from dataclasses import is_dataclass
 from functools import partial
 from inspect import isclass
 from typing import (
+    TYPE_CHECKING,
     Any,
     Generic,
     cast,
@@ -37,9 +38,9 @@ from langchain_core.runnables.config import (
     get_async_callback_manager_for_config,
     get_callback_manager_for_config,
 )
-from langchain_core.runnables.graph import Graph
 from langgraph.cache.base import BaseCache
 from langgraph.checkpoint.base import (
+    LAZY_CHANNEL_VALUES,
     BaseCheckpointSaver,
     Checkpoint,
     CheckpointTuple,
@@ -64,10 +65,12 @@ from langgraph._internal._constants import (
     CONFIG_KEY_CHECKPOINT_NS,
     CONFIG_KEY_CHECKPOINTER,
     CONFIG_KEY_DURABILITY,
+    CONFIG_KEY_EXECUTOR,
     CONFIG_KEY_NODE_FINISHED,
     CONFIG_KEY_READ,
     CONFIG_KEY_RUNNER_SUBMIT,
     CONFIG_KEY_RUNTIME,
+    CONFIG_KEY_SPECULATIONS,
     CONFIG_KEY_SEND,
     CONFIG_KEY_STREAM,
     CONFIG_KEY_TASK_ID,
@@ -108,20 +111,21 @@ from langgraph.pregel._algo import (
     PregelTaskWrites,
     _scratchpad,
     apply_writes,
+    get_reactive_channels,
     local_read,
     prepare_next_tasks,
 )
 from langgraph.pregel._call import identifier
 from langgraph.pregel._checkpoint import (
+    LazyChannels,
     channels_from_checkpoint,
     copy_checkpoint,
     create_checkpoint,
     empty_checkpoint,
 )
-from langgraph.pregel._draw import draw_graph
-from langgraph.pregel._io import map_input, read_channels
+from langgraph.pregel._executor import SharedExecutor
+from langgraph.pregel._io import LazyValues, map_input, read_channels
 from langgraph.pregel._loop import AsyncPregelLoop, SyncPregelLoop
-from langgraph.pregel._messages import StreamMessagesHandler
 from langgraph.pregel._read import DEFAULT_BOUND, PregelNode
 from langgraph.pregel._retry import RetryPolicy
 from langgraph.pregel._runner import PregelRunner
@@ -147,6 +151,9 @@ from langgraph.types import (
 from langgraph.typing import ContextT, InputT, OutputT, StateT
 from langgraph.warnings import LangGraphDeprecatedSinceV10
 
+if TYPE_CHECKING:
+    from langchain_core.runnables.graph import Graph
+
 try:
     from langchain_core.tracers._streaming import _StreamingCallbackHandler
 except ImportError:
@@ -613,6 +620,9 @@ class Pregel(
     cache: BaseCache | None = None
     """Cache to use for storing node results."""
 
+    executor: SharedExecutor | None = None
+    """Long-lived thread pool to run sync tasks in, instead of a thread pool per run."""
+
     retry_policy: Sequence[RetryPolicy] = ()
     """Retry policies to use when running tasks. Empty set disables retries."""
 
@@ -646,6 +656,7 @@ class Pregel(
         checkpointer: Checkpointer = None,
         store: BaseStore | None = None,
         cache: BaseCache | None = None,
+        executor: SharedExecutor | None = None,
         retry_policy: RetryPolicy | Sequence[RetryPolicy] = (),
         cache_policy: CachePolicy | None = None,
         context_schema: type[ContextT] | None = None,
@@ -690,6 +701,7 @@ class Pregel(
         self.checkpointer = checkpointer
         self.store = store
         self.cache = cache
+        self.executor = executor
         self.retry_policy = (
             (retry_policy,) if isinstance(retry_policy, RetryPolicy) else retry_policy
         )
@@ -705,6 +717,8 @@ class Pregel(
         self, config: RunnableConfig | None = None, *, xray: int | bool = False
     ) -> Graph:
         """Return a drawable representation of the computation graph."""
+        from langgraph.pregel._draw import draw_graph
+
         # gather subgraphs
         if xray:
             subgraphs = {
@@ -733,6 +747,7 @@ class Pregel(
         self, config: RunnableConfig | None = None, *, xray: int | bool = False
     ) -> Graph:
         """Return a drawable representation of the computation graph."""
+        from langgraph.pregel._draw import draw_graph
 
         # gather subgraphs
         if xray:
@@ -999,6 +1014,7 @@ class Pregel(
         saved: CheckpointTuple | None,
         recurse: BaseCheckpointSaver | None = None,
         apply_pending_writes: bool = False,
+        lazy: bool = False,
     ) -> StateSnapshot:
         if not saved:
             return StateSnapshot(
@@ -1018,9 +1034,17 @@ class Pregel(
         step = saved.metadata.get("step", -1) + 1
         stop = step + 2
         channels, managed = channels_from_checkpoint(
-            self.channels,
-            saved.checkpoint,
+            self.channels, saved.checkpoint, lazy=lazy
         )
+        # only restore the channels that writes are applied to
+        reactive_channels = (
+            get_reactive_channels(channels.specs)
+            if isinstance(channels, LazyChannels)
+            else None
+        )
+        # executable tasks read their input from the channels, so in lazy mode
+        # they're only prepared if pending writes have to be applied to them
+        for_execution = not lazy or bool(apply_pending_writes and saved.pending_writes)
         # tasks for this checkpoint
         next_tasks = prepare_next_tasks(
             saved.checkpoint,
@@ -1031,7 +1055,7 @@ class Pregel(
             saved.config,
             step,
             stop,
-            for_execution=True,
+            for_execution=for_execution,
             store=self.store,
             checkpointer=(
                 self.checkpointer
@@ -1070,7 +1094,7 @@ class Pregel(
                     }
                 }
                 task_states[task.id] = subgraphs[task.name].get_state(
-                    config, subgraphs=True
+                    config, subgraphs=True, lazy=lazy
                 )
         # apply pending writes
         if null_writes := [
@@ -1082,6 +1106,7 @@ class Pregel(
                 [PregelTaskWrites((), INPUT, null_writes, [])],
                 None,
                 self.trigger_to_nodes,
+                reactive_channels,
             )
         if apply_pending_writes and saved.pending_writes:
             for tid, k, v in saved.pending_writes:
@@ -1092,7 +1117,12 @@ class Pregel(
                 next_tasks[tid].writes.append((k, v))
             if tasks := [t for t in next_tasks.values() if t.writes]:
                 apply_writes(
-                    saved.checkpoint, channels, tasks, None, self.trigger_to_nodes
+                    saved.checkpoint,
+                    channels,
+                    tasks,
+                    None,
+                    self.trigger_to_nodes,
+                    reactive_channels,
                 )
         tasks_with_writes = tasks_w_writes(
             next_tasks.values(),
@@ -1102,8 +1132,14 @@ class Pregel(
         )
         # assemble the state snapshot
         return StateSnapshot(
-            read_channels(channels, self.stream_channels_asis),
-            tuple(t.name for t in next_tasks.values() if not t.writes),
+            (
+                LazyValues(channels, self.stream_channels_asis)
+                if lazy and not isinstance(self.stream_channels_asis, str)
+                else read_channels(channels, self.stream_channels_asis)
+            ),
+            tuple(
+                t.name for t in next_tasks.values() if not for_execution or not t.writes
+            ),
             patch_checkpoint_map(saved.config, saved.metadata),
             saved.metadata,
             saved.checkpoint["ts"],
@@ -1118,6 +1154,7 @@ class Pregel(
         saved: CheckpointTuple | None,
         recurse: BaseCheckpointSaver | None = None,
         apply_pending_writes: bool = False,
+        lazy: bool = False,
     ) -> StateSnapshot:
         if not saved:
             return StateSnapshot(
@@ -1137,9 +1174,17 @@ class Pregel(
         step = saved.metadata.get("step", -1) + 1
         stop = step + 2
         channels, managed = channels_from_checkpoint(
-            self.channels,
-            saved.checkpoint,
+            self.channels, saved.checkpoint, lazy=lazy
+        )
+        # only restore the channels that writes are applied to
+        reactive_channels = (
+            get_reactive_channels(channels.specs)
+            if isinstance(channels, LazyChannels)
+            else None
         )
+        # executable tasks read their input from the channels, so in lazy mode
+        # they're only prepared if pending writes have to be applied to them
+        for_execution = not lazy or bool(apply_pending_writes and saved.pending_writes)
         # tasks for this checkpoint
         next_tasks = prepare_next_tasks(
             saved.checkpoint,
@@ -1150,7 +1195,7 @@ class Pregel(
             saved.config,
             step,
             stop,
-            for_execution=True,
+            for_execution=for_execution,
             store=self.store,
             checkpointer=(
                 self.checkpointer
@@ -1189,7 +1234,7 @@ class Pregel(
                     }
                 }
                 task_states[task.id] = await subgraphs[task.name].aget_state(
-                    config, subgraphs=True
+                    config, subgraphs=True, lazy=lazy
                 )
         # apply pending writes
         if null_writes := [
@@ -1201,6 +1246,7 @@ class Pregel(
                 [PregelTaskWrites((), INPUT, null_writes, [])],
                 None,
                 self.trigger_to_nodes,
+                reactive_channels,
             )
         if apply_pending_writes and saved.pending_writes:
             for tid, k, v in saved.pending_writes:
@@ -1211,7 +1257,12 @@ class Pregel(
                 next_tasks[tid].writes.append((k, v))
             if tasks := [t for t in next_tasks.values() if t.writes]:
                 apply_writes(
-                    saved.checkpoint, channels, tasks, None, self.trigger_to_nodes
+                    saved.checkpoint,
+                    channels,
+                    tasks,
+                    None,
+                    self.trigger_to_nodes,
+                    reactive_channels,
                 )
 
         tasks_with_writes = tasks_w_writes(
@@ -1222,8 +1273,14 @@ class Pregel(
         )
         # assemble the state snapshot
         return StateSnapshot(
-            read_channels(channels, self.stream_channels_asis),
-            tuple(t.name for t in next_tasks.values() if not t.writes),
+            (
+                LazyValues(channels, self.stream_channels_asis)
+                if lazy and not isinstance(self.stream_channels_asis, str)
+                else read_channels(channels, self.stream_channels_asis)
+            ),
+            tuple(
+                t.name for t in next_tasks.values() if not for_execution or not t.writes
+            ),
             patch_checkpoint_map(saved.config, saved.metadata),
             saved.metadata,
             saved.checkpoint["ts"],
@@ -1233,9 +1290,14 @@ class Pregel(
         )
 
     def get_state(
-        self, config: RunnableConfig, *, subgraphs: bool = False
+        self, config: RunnableConfig, *, subgraphs: bool = False, lazy: bool = False
     ) -> StateSnapshot:
-        """Get the current state of the graph."""
+        """Get the current state of the graph.
+
+        If `lazy` is set, the snapshot's `values` is a read-only mapping that reads
+        each channel on first access, and checkpointers that support it only
+        deserialize the checkpointed values that are read.
+        """
         checkpointer: BaseCheckpointSaver | None = ensure_config(config)[CONF].get(
             CONFIG_KEY_CHECKPOINTER, self.checkpointer
         )
@@ -1252,6 +1314,7 @@ class Pregel(
                 return pregel.get_state(
                     patch_configurable(config, {CONFIG_KEY_CHECKPOINTER: checkpointer}),
                     subgraphs=subgraphs,
+                    lazy=lazy,
                 )
             else:
                 raise ValueError(f"Subgraph {recast} not found")
@@ -1266,18 +1329,26 @@ class Pregel(
         if not isinstance(thread_id, str):
             config[CONF][CONFIG_KEY_THREAD_ID] = str(thread_id)
 
-        saved = checkpointer.get_tuple(config)
+        saved = checkpointer.get_tuple(
+            patch_configurable(config, {LAZY_CHANNEL_VALUES: True}) if lazy else config
+        )
         return self._prepare_state_snapshot(
             config,
             saved,
             recurse=checkpointer if subgraphs else None,
             apply_pending_writes=CONFIG_KEY_CHECKPOINT_ID not in config[CONF],
+            lazy=lazy,
         )
 
     async def aget_state(
-        self, config: RunnableConfig, *, subgraphs: bool = False
+        self, config: RunnableConfig, *, subgraphs: bool = False, lazy: bool = False
     ) -> StateSnapshot:
-        """Get the current state of the graph."""
+        """Get the current state of the graph.
+
+        If `lazy` is set, the snapshot's `values` is a read-only mapping that reads
+        each channel on first access, and checkpointers that support it only
+        deserialize the checkpointed values that are read.
+        """
         checkpointer: BaseCheckpointSaver | None = ensure_config(config)[CONF].get(
             CONFIG_KEY_CHECKPOINTER, self.checkpointer
         )
@@ -1294,6 +1365,7 @@ class Pregel(
                 return await pregel.aget_state(
                     patch_configurable(config, {CONFIG_KEY_CHECKPOINTER: checkpointer}),
                     subgraphs=subgraphs,
+                    lazy=lazy,
                 )
             else:
                 raise ValueError(f"Subgraph {recast} not found")
@@ -1308,12 +1380,15 @@ class Pregel(
         if not isinstance(thread_id, str):
             config[CONF][CONFIG_KEY_THREAD_ID] = str(thread_id)
 
-        saved = await checkpointer.aget_tuple(config)
+        saved = await checkpointer.aget_tuple(
+            patch_configurable(config, {LAZY_CHANNEL_VALUES: True}) if lazy else config
+        )
         return await self._aprepare_state_snapshot(
             config,
             saved,
             recurse=checkpointer if subgraphs else None,
             apply_pending_writes=CONFIG_KEY_CHECKPOINT_ID not in config[CONF],
+            lazy=lazy,
         )
 
     def get_state_history(
@@ -1323,8 +1398,13 @@ class Pregel(
         filter: dict[str, Any] | None = None,
         before: RunnableConfig | None = None,
         limit: int | None = None,
+        lazy: bool = False,
     ) -> Iterator[StateSnapshot]:
-        """Get the history of the state of the graph."""
+        """Get the history of the state of the graph.
+
+        If `lazy` is set, the values of each snapshot are read on first access, see
+        `get_state`.
+        """
         config = ensure_config(config)
         checkpointer: BaseCheckpointSaver | None = config[CONF].get(
             CONFIG_KEY_CHECKPOINTER, self.checkpointer
@@ -1344,6 +1424,7 @@ class Pregel(
                     filter=filter,
                     before=before,
                     limit=limit,
+                    lazy=lazy,
                 )
                 return
             else:
@@ -1356,6 +1437,7 @@ class Pregel(
                 CONF: {
                     CONFIG_KEY_CHECKPOINT_NS: checkpoint_ns,
                     CONFIG_KEY_THREAD_ID: str(config[CONF][CONFIG_KEY_THREAD_ID]),
+                    **({LAZY_CHANNEL_VALUES: True} if lazy else {}),
                 }
             },
         )
@@ -1364,7 +1446,7 @@ class Pregel(
             checkpointer.list(config, before=before, limit=limit, filter=filter)
         ):
             yield self._prepare_state_snapshot(
-                checkpoint_tuple.config, checkpoint_tuple
+                checkpoint_tuple.config, checkpoint_tuple, lazy=lazy
             )
 
     async def aget_state_history(
@@ -1374,8 +1456,13 @@ class Pregel(
         filter: dict[str, Any] | None = None,
         before: RunnableConfig | None = None,
         limit: int | None = None,
+        lazy: bool = False,
     ) -> AsyncIterator[StateSnapshot]:
-        """Asynchronously get the history of the state of the graph."""
+        """Asynchronously get the history of the state of the graph.
+
+        If `lazy` is set, the values of each snapshot are read on first access, see
+        `get_state`.
+        """
         config = ensure_config(config)
         checkpointer: BaseCheckpointSaver | None = ensure_config(config)[CONF].get(
             CONFIG_KEY_CHECKPOINTER, self.checkpointer
@@ -1395,6 +1482,7 @@ class Pregel(
                     filter=filter,
                     before=before,
                     limit=limit,
+                    lazy=lazy,
                 ):
                     yield state
                 return
@@ -1408,6 +1496,7 @@ class Pregel(
                 CONF: {
                     CONFIG_KEY_CHECKPOINT_NS: checkpoint_ns,
                     CONFIG_KEY_THREAD_ID: str(config[CONF][CONFIG_KEY_THREAD_ID]),
+                    **({LAZY_CHANNEL_VALUES: True} if lazy else {}),
                 }
             },
         )
@@ -1419,7 +1508,7 @@ class Pregel(
             )
         ]:
             yield await self._aprepare_state_snapshot(
-                checkpoint_tuple.config, checkpoint_tuple
+                checkpoint_tuple.config, checkpoint_tuple, lazy=lazy
             )
 
     def bulk_update_state(
@@ -2441,6 +2530,8 @@ class Pregel(
                 - `"checkpoints"`: Emit an event when a checkpoint is created, in the same format as returned by `get_state()`.
                 - `"tasks"`: Emit events when tasks start and finish, including their results and errors.
                 - `"debug"`: Emit debug events with as much information as possible for each step.
+                - `"profile"`: Emit timings and token usage of each task, and timings of
+                    each step and checkpoint write. See `StreamMode` for the events.
 
                 You can pass a list as the `stream_mode` parameter to stream multiple modes at once.
                 The streamed outputs will be tuples of `(mode, data)`.
@@ -2534,6 +2625,8 @@ class Pregel(
                 config[CONF][CONFIG_KEY_CHECKPOINT_NS] = recast_checkpoint_ns(ns)
             # set up messages stream mode
             if "messages" in stream_modes:
+                from langgraph.pregel._messages import StreamMessagesHandler
+
                 ns_ = cast(str | None, config[CONF].get(CONFIG_KEY_CHECKPOINT_NS))
                 run_manager.inheritable_handlers.append(
                     StreamMessagesHandler(
@@ -2578,6 +2671,12 @@ class Pregel(
             parent_runtime = config[CONF].get(CONFIG_KEY_RUNTIME, DEFAULT_RUNTIME)
             runtime = parent_runtime.merge(runtime)
             config[CONF][CONFIG_KEY_RUNTIME] = runtime
+            # speculative node runs, shared with subgraphs
+            config[CONF].setdefault(CONFIG_KEY_SPECULATIONS, {})
+
+            # run sync tasks in the shared executor, unless set in config
+            if self.executor is not None:
+                config[CONF].setdefault(CONFIG_KEY_EXECUTOR, self.executor)
 
             with SyncPregelLoop(
                 input,
@@ -2607,7 +2706,11 @@ class Pregel(
                     ),
                     put_writes=weakref.WeakMethod(loop.put_writes),
                     node_finished=config[CONF].get(CONFIG_KEY_NODE_FINISHED),
+                    profiler=loop.profiler,
                 )
+                # count token usage of each task for profile stream mode
+                if loop.profiler is not None:
+                    run_manager.inheritable_handlers.append(loop.profiler)
                 # enable subgraph streaming
                 if subgraphs:
                     loop.config[CONF][CONFIG_KEY_STREAM] = loop.stream
@@ -2715,6 +2818,8 @@ class Pregel(
                 - `"checkpoints"`: Emit an event when a checkpoint is created, in the same format as returned by `get_state()`.
                 - `"tasks"`: Emit events when tasks start and finish, including their results and errors.
                 - `"debug"`: Emit debug events with as much information as possible for each step.
+                - `"profile"`: Emit timings and token usage of each task, and timings of
+                    each step and checkpoint write. See `StreamMode` for the events.
 
                 You can pass a list as the `stream_mode` parameter to stream multiple modes at once.
                 The streamed outputs will be tuples of `(mode, data)`.
@@ -2783,6 +2888,8 @@ class Pregel(
             name=config.get("run_name", self.get_name()),
             run_id=config.get("run_id"),
         )
+        from langgraph.pregel._messages import StreamMessagesHandler
+
         # if running from astream_log() run each proc with streaming
         do_stream = (
             next(
@@ -2887,6 +2994,8 @@ class Pregel(
             parent_runtime = config[CONF].get(CONFIG_KEY_RUNTIME, DEFAULT_RUNTIME)
             runtime = parent_runtime.merge(runtime)
             config[CONF][CONFIG_KEY_RUNTIME] = runtime
+            # speculative node runs, shared with subgraphs
+            config[CONF].setdefault(CONFIG_KEY_SPECULATIONS, {})
 
             async with AsyncPregelLoop(
                 input,
@@ -2917,7 +3026,11 @@ class Pregel(
                     put_writes=weakref.WeakMethod(loop.put_writes),
                     use_astream=do_stream,
                     node_finished=config[CONF].get(CONFIG_KEY_NODE_FINISHED),
+                    profiler=loop.profiler,
                 )
+                # count token usage of each task for profile stream mode
+                if loop.profiler is not None:
+                    run_manager.inheritable_handlers.append(loop.profiler)
                 # enable subgraph streaming
                 if subgraphs:
                     loop.config[CONF][CONFIG_KEY_STREAM] = StreamProtocol(
@@ -2,15 +2,17 @@ from __future__ import annotations
 
 from abc import abstractmethod
 from collections.abc import AsyncIterator, Callable, Iterator, Sequence
-from typing import Any, Generic, cast
+from typing import TYPE_CHECKING, Any, Generic, cast
 
 from langchain_core.runnables import Runnable, RunnableConfig
-from langchain_core.runnables.graph import Graph as DrawableGraph
 from typing_extensions import Self
 
 from langgraph.types import All, Command, StateSnapshot, StateUpdate, StreamMode
 from langgraph.typing import ContextT, InputT, OutputT, StateT
 
+if TYPE_CHECKING:
+    from langchain_core.runnables.graph import Graph as DrawableGraph
+
 __all__ = ("PregelProtocol", "StreamProtocol")
 
 
@@ -38,12 +40,12 @@ class PregelProtocol(Runnable[InputT, Any], Generic[StateT, ContextT, InputT, Ou
 
     @abstractmethod
     def get_state(
-        self, config: RunnableConfig, *, subgraphs: bool = False
+        self, config: RunnableConfig, *, subgraphs: bool = False, lazy: bool = False
     ) -> StateSnapshot: ...
 
     @abstractmethod
     async def aget_state(
-        self, config: RunnableConfig, *, subgraphs: bool = False
+        self, config: RunnableConfig, *, subgraphs: bool = False, lazy: bool = False
     ) -> StateSnapshot: ...
 
     @abstractmethod
@@ -54,6 +56,7 @@ class PregelProtocol(Runnable[InputT, Any], Generic[StateT, ContextT, InputT, Ou
         filter: dict[str, Any] | None = None,
         before: RunnableConfig | None = None,
         limit: int | None = None,
+        lazy: bool = False,
     ) -> Iterator[StateSnapshot]: ...
 
     @abstractmethod
@@ -64,6 +67,7 @@ class PregelProtocol(Runnable[InputT, Any], Generic[StateT, ContextT, InputT, Ou
         filter: dict[str, Any] | None = None,
         before: RunnableConfig | None = None,
         limit: int | None = None,
+        lazy: bool = False,
     ) -> AsyncIterator[StateSnapshot]: ...
 
     @abstractmethod
@@ -1,9 +1,17 @@
 from __future__ import annotations
 
+import asyncio
+import concurrent.futures
+import copy
+import json
 import logging
-from collections.abc import AsyncIterator, Iterator, Sequence
+import threading
+import weakref
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator, Sequence
 from dataclasses import asdict
+from functools import partial
 from typing import (
+    TYPE_CHECKING,
     Any,
     Literal,
     cast,
@@ -12,6 +20,7 @@ from uuid import UUID
 
 import langsmith as ls
 from langchain_core.runnables import RunnableConfig
+from langchain_core.runnables.config import get_executor_for_config
 from langchain_core.runnables.graph import (
     Edge as DrawableEdge,
 )
@@ -60,9 +69,13 @@ from langgraph.types import (
     Interrupt,
     PregelTask,
     StateSnapshot,
+    StateUpdate,
     StreamMode,
 )
 
+if TYPE_CHECKING:
+    import httpx
+
 logger = logging.getLogger(__name__)
 
 __all__ = ("RemoteGraph", "RemoteException")
@@ -76,6 +89,10 @@ _CONF_DROPLIST = frozenset(
     ),
 )
 
+# default number of concurrent requests of get_states() and update_states(),
+# under the keep-alive connections of the default SDK clients
+_MANY_CONCURRENCY = 10
+
 
 def _sanitize_config_value(v: Any) -> Any:
     """Recursively sanitize a config value to ensure it contains only primitives."""
@@ -132,6 +149,9 @@ class RemoteGraph(PregelProtocol):
         config: RunnableConfig | None = None,
         name: str | None = None,
         distributed_tracing: bool = False,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
+        coalesce_reads: bool = True,
     ):
         """Specify `url`, `api_key`, and/or `headers` to create default sync and async clients.
 
@@ -151,6 +171,14 @@ class RemoteGraph(PregelProtocol):
                 This is useful for adding `RemoteGraph` as a subgraph via `graph.add_node(remote_graph)`.
                 If not provided, defaults to the assistant ID.
             distributed_tracing: Whether to enable sending LangSmith distributed tracing headers.
+            limits: The connection pool limits of the default clients, see `get_client`.
+            http2: Whether the default clients use HTTP/2, see `get_client`.
+            coalesce_reads: Whether concurrent calls of `get_state` for the same
+                checkpoint share one request. Calls made after an update of the
+                thread through this `RemoteGraph` never share the request of a
+                call made before it. Copies made with `with_config` share their
+                requests with this `RemoteGraph`, as long as they use the same
+                clients.
         """
         self.assistant_id = assistant_id
         if name is None:
@@ -159,15 +187,27 @@ class RemoteGraph(PregelProtocol):
             self.name = name
         self.config = config
         self.distributed_tracing = distributed_tracing
+        self.coalesce_reads = coalesce_reads
 
         if client is None and url is not None:
-            client = get_client(url=url, api_key=api_key, headers=headers)
+            client = get_client(
+                url=url, api_key=api_key, headers=headers, limits=limits, http2=http2
+            )
         self.client = client
 
         if sync_client is None and url is not None:
-            sync_client = get_sync_client(url=url, api_key=api_key, headers=headers)
+            sync_client = get_sync_client(
+                url=url, api_key=api_key, headers=headers, limits=limits, http2=http2
+            )
         self.sync_client = sync_client
 
+        # get_state requests in flight, to share with identical calls
+        self._lock = threading.Lock()
+        self._inflight: dict[tuple, concurrent.futures.Future[ThreadState]] = {}
+        self._ainflight: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[tuple, asyncio.Task[ThreadState]]
+        ] = weakref.WeakKeyDictionary()
+
     def _validate_client(self) -> LangGraphClient:
         if self.client is None:
             raise ValueError(
@@ -183,8 +223,14 @@ class RemoteGraph(PregelProtocol):
         return self.sync_client
 
     def copy(self, update: dict[str, Any]) -> Self:
-        attrs = {**self.__dict__, **update}
-        return self.__class__(attrs.pop("assistant_id"), **attrs)
+        attrs = {k: v for k, v in {**self.__dict__, **update}.items() if k[0] != "_"}
+        copied = self.__class__(attrs.pop("assistant_id"), **attrs)
+        if copied.client is self.client and copied.sync_client is self.sync_client:
+            # reads of the same server are shared with the copy, eg. of with_config
+            copied._lock = self._lock
+            copied._inflight = self._inflight
+            copied._ainflight = self._ainflight
+        return copied
 
     def with_config(self, config: RunnableConfig | None = None, **kwargs: Any) -> Self:
         return self.copy(
@@ -400,6 +446,7 @@ class RemoteGraph(PregelProtocol):
         config: RunnableConfig,
         *,
         subgraphs: bool = False,
+        lazy: bool = False,
         headers: dict[str, str] | None = None,
         params: QueryParamTypes | None = None,
     ) -> StateSnapshot:
@@ -413,6 +460,7 @@ class RemoteGraph(PregelProtocol):
             config: A `RunnableConfig` that includes `thread_id` in the
                 `configurable` field.
             subgraphs: Include subgraphs in the state.
+            lazy: Has no effect, the state is always fetched in full.
             headers: Optional custom headers to include with the request.
             params: Optional query parameters to include with the request.
 
@@ -421,14 +469,21 @@ class RemoteGraph(PregelProtocol):
         """
         sync_client = self._validate_sync_client()
         merged_config = merge_configs(self.config, config)
+        thread_id = merged_config["configurable"]["thread_id"]
+        checkpoint = self._get_checkpoint(merged_config)
 
-        state = sync_client.threads.get_state(
-            thread_id=merged_config["configurable"]["thread_id"],
-            checkpoint=self._get_checkpoint(merged_config),
+        fetch = partial(
+            sync_client.threads.get_state,
+            thread_id=thread_id,
+            checkpoint=checkpoint,
             subgraphs=subgraphs,
             headers=headers,
             params=params,
         )
+        if self.coalesce_reads and headers is None and params is None:
+            state = self._coalesce(_read_key(thread_id, checkpoint, subgraphs), fetch)
+        else:
+            state = fetch()
         return self._create_state_snapshot(state)
 
     async def aget_state(
@@ -436,6 +491,7 @@ class RemoteGraph(PregelProtocol):
         config: RunnableConfig,
         *,
         subgraphs: bool = False,
+        lazy: bool = False,
         headers: dict[str, str] | None = None,
         params: QueryParamTypes | None = None,
     ) -> StateSnapshot:
@@ -449,6 +505,7 @@ class RemoteGraph(PregelProtocol):
             config: A `RunnableConfig` that includes `thread_id` in the
                 `configurable` field.
             subgraphs: Include subgraphs in the state.
+            lazy: Has no effect, the state is always fetched in full.
             headers: Optional custom headers to include with the request.
             params: Optional query parameters to include with the request.
 
@@ -457,16 +514,85 @@ class RemoteGraph(PregelProtocol):
         """
         client = self._validate_client()
         merged_config = merge_configs(self.config, config)
+        thread_id = merged_config["configurable"]["thread_id"]
+        checkpoint = self._get_checkpoint(merged_config)
 
-        state = await client.threads.get_state(
-            thread_id=merged_config["configurable"]["thread_id"],
-            checkpoint=self._get_checkpoint(merged_config),
+        fetch = partial(
+            client.threads.get_state,
+            thread_id=thread_id,
+            checkpoint=checkpoint,
             subgraphs=subgraphs,
             headers=headers,
             params=params,
         )
+        if self.coalesce_reads and headers is None and params is None:
+            state = await self._acoalesce(
+                _read_key(thread_id, checkpoint, subgraphs), fetch
+            )
+        else:
+            state = await fetch()
         return self._create_state_snapshot(state)
 
+    def get_states(
+        self,
+        configs: Sequence[RunnableConfig],
+        *,
+        subgraphs: bool = False,
+        max_concurrency: int | None = None,
+    ) -> list[StateSnapshot]:
+        """Get the states of many threads.
+
+        Calls `get_state` for each config, `max_concurrency` at a time, over the
+        connections of the sync client.
+
+        Args:
+            configs: A `RunnableConfig` for each thread, that includes `thread_id`
+                in the `configurable` field.
+            subgraphs: Include subgraphs in the states.
+            max_concurrency: The number of requests to make at a time, defaults to 10.
+
+        Returns:
+            The state of each thread, in the order of `configs`.
+        """
+        self._validate_sync_client()
+        # the threads run in copies of the context, eg. of the tracing run tree
+        with get_executor_for_config(
+            {"max_concurrency": max_concurrency or _MANY_CONCURRENCY}
+        ) as executor:
+            return list(
+                executor.map(partial(self.get_state, subgraphs=subgraphs), configs)
+            )
+
+    async def aget_states(
+        self,
+        configs: Sequence[RunnableConfig],
+        *,
+        subgraphs: bool = False,
+        max_concurrency: int | None = None,
+    ) -> list[StateSnapshot]:
+        """Get the states of many threads.
+
+        Calls `aget_state` for each config, `max_concurrency` at a time, over the
+        connections of the async client.
+
+        Args:
+            configs: A `RunnableConfig` for each thread, that includes `thread_id`
+                in the `configurable` field.
+            subgraphs: Include subgraphs in the states.
+            max_concurrency: The number of requests to make at a time, defaults to 10.
+
+        Returns:
+            The state of each thread, in the order of `configs`.
+        """
+        self._validate_client()
+        semaphore = asyncio.Semaphore(max_concurrency or _MANY_CONCURRENCY)
+
+        async def get_state(config: RunnableConfig) -> StateSnapshot:
+            async with semaphore:
+                return await self.aget_state(config, subgraphs=subgraphs)
+
+        return await asyncio.gather(*(get_state(config) for config in configs))
+
     def get_state_history(
         self,
         config: RunnableConfig,
@@ -474,6 +600,7 @@ class RemoteGraph(PregelProtocol):
         filter: dict[str, Any] | None = None,
         before: RunnableConfig | None = None,
         limit: int | None = None,
+        lazy: bool = False,
         headers: dict[str, str] | None = None,
         params: QueryParamTypes | None = None,
     ) -> Iterator[StateSnapshot]:
@@ -487,6 +614,7 @@ class RemoteGraph(PregelProtocol):
             filter: Metadata to filter on.
             before: A `RunnableConfig` that includes checkpoint metadata.
             limit: Max number of states to return.
+            lazy: Has no effect, the states are always fetched in full.
 
         Returns:
             States of the thread.
@@ -513,6 +641,7 @@ class RemoteGraph(PregelProtocol):
         filter: dict[str, Any] | None = None,
         before: RunnableConfig | None = None,
         limit: int | None = None,
+        lazy: bool = False,
         headers: dict[str, str] | None = None,
         params: QueryParamTypes | None = None,
     ) -> AsyncIterator[StateSnapshot]:
@@ -526,6 +655,7 @@ class RemoteGraph(PregelProtocol):
             filter: Metadata to filter on.
             before: A `RunnableConfig` that includes checkpoint metadata.
             limit: Max number of states to return.
+            lazy: Has no effect, the states are always fetched in full.
             headers: Optional custom headers to include with the request.
             params: Optional query parameters to include with the request.
 
@@ -550,16 +680,106 @@ class RemoteGraph(PregelProtocol):
     def bulk_update_state(
         self,
         config: RunnableConfig,
-        updates: list[tuple[dict[str, Any] | None, str | None]],
+        updates: Sequence[Sequence[StateUpdate]],
     ) -> RunnableConfig:
-        raise NotImplementedError
+        """Apply updates to the state of a thread, one checkpoint per superstep.
+
+        Calls `update_state` for each superstep, each on the checkpoint created by
+        the previous one. The API applies one update per call, so each superstep
+        must hold a single update, without a `task_id`.
+
+        Args:
+            config: A `RunnableConfig` that includes `thread_id` in the
+                `configurable` field.
+            updates: The updates to apply, as a list of supersteps.
+
+        Returns:
+            `RunnableConfig` for the updated thread.
+        """
+        for update in _single_updates(updates):
+            config = self.update_state(config, update.values, update.as_node)
+        return config
 
     async def abulk_update_state(
         self,
         config: RunnableConfig,
-        updates: list[tuple[dict[str, Any] | None, str | None]],
+        updates: Sequence[Sequence[StateUpdate]],
     ) -> RunnableConfig:
-        raise NotImplementedError
+        """Apply updates to the state of a thread, one checkpoint per superstep.
+
+        Calls `aupdate_state` for each superstep, each on the checkpoint created by
+        the previous one. The API applies one update per call, so each superstep
+        must hold a single update, without a `task_id`.
+
+        Args:
+            config: A `RunnableConfig` that includes `thread_id` in the
+                `configurable` field.
+            updates: The updates to apply, as a list of supersteps.
+
+        Returns:
+            `RunnableConfig` for the updated thread.
+        """
+        for update in _single_updates(updates):
+            config = await self.aupdate_state(config, update.values, update.as_node)
+        return config
+
+    def update_states(
+        self,
+        updates: Sequence[
+            tuple[RunnableConfig, dict[str, Any] | Any | None, str | None]
+        ],
+        *,
+        max_concurrency: int | None = None,
+    ) -> list[RunnableConfig]:
+        """Update the states of many threads.
+
+        Calls `update_state` for each update, `max_concurrency` at a time, over the
+        connections of the sync client.
+
+        Args:
+            updates: The `(config, values, as_node)` of each update.
+            max_concurrency: The number of requests to make at a time, defaults to 10.
+
+        Returns:
+            `RunnableConfig` for each updated thread, in the order of `updates`.
+        """
+        self._validate_sync_client()
+        # the threads run in copies of the context, eg. of the tracing run tree
+        with get_executor_for_config(
+            {"max_concurrency": max_concurrency or _MANY_CONCURRENCY}
+        ) as executor:
+            return list(executor.map(lambda u: self.update_state(*u), updates))
+
+    async def aupdate_states(
+        self,
+        updates: Sequence[
+            tuple[RunnableConfig, dict[str, Any] | Any | None, str | None]
+        ],
+        *,
+        max_concurrency: int | None = None,
+    ) -> list[RunnableConfig]:
+        """Update the states of many threads.
+
+        Calls `aupdate_state` for each update, `max_concurrency` at a time, over
+        the connections of the async client.
+
+        Args:
+            updates: The `(config, values, as_node)` of each update.
+            max_concurrency: The number of requests to make at a time, defaults to 10.
+
+        Returns:
+            `RunnableConfig` for each updated thread, in the order of `updates`.
+        """
+        self._validate_client()
+        semaphore = asyncio.Semaphore(max_concurrency or _MANY_CONCURRENCY)
+
+        async def update_state(
+            update: tuple[RunnableConfig, dict[str, Any] | Any | None, str | None],
+        ) -> RunnableConfig:
+            async with semaphore:
+                return await self.aupdate_state(*update)
+
+        return await asyncio.gather(*(update_state(update) for update in updates))
 
     def update_state(
         self,
@@ -586,14 +806,19 @@ class RemoteGraph(PregelProtocol):
         sync_client = self._validate_sync_client()
         merged_config = merge_configs(self.config, config)
 
-        response: dict = sync_client.threads.update_state(  # type: ignore
-            thread_id=merged_config["configurable"]["thread_id"],
-            values=values,
-            as_node=as_node,
-            checkpoint=self._get_checkpoint(merged_config),
-            headers=headers,
-            params=params,
-        )
+        thread_id = merged_config["configurable"]["thread_id"]
+
+        try:
+            response: dict = sync_client.threads.update_state(  # type: ignore
+                thread_id=thread_id,
+                values=values,
+                as_node=as_node,
+                checkpoint=self._get_checkpoint(merged_config),
+                headers=headers,
+                params=params,
+            )
+        finally:
+            self._forget_reads(thread_id)
         return self._get_config(response["checkpoint"])
 
     async def aupdate_state(
@@ -621,14 +846,19 @@ class RemoteGraph(PregelProtocol):
         client = self._validate_client()
         merged_config = merge_configs(self.config, config)
 
-        response: dict = await client.threads.update_state(  # type: ignore
-            thread_id=merged_config["configurable"]["thread_id"],
-            values=values,
-            as_node=as_node,
-            checkpoint=self._get_checkpoint(merged_config),
-            headers=headers,
-            params=params,
-        )
+        thread_id = merged_config["configurable"]["thread_id"]
+
+        try:
+            response: dict = await client.threads.update_state(  # type: ignore
+                thread_id=thread_id,
+                values=values,
+                as_node=as_node,
+                checkpoint=self._get_checkpoint(merged_config),
+                headers=headers,
+                params=params,
+            )
+        finally:
+            self._forget_reads(thread_id)
         return self._get_config(response["checkpoint"])
 
     def _get_stream_modes(
@@ -727,22 +957,27 @@ class RemoteGraph(PregelProtocol):
             command = None
         thread_id = sanitized_config.get("configurable", {}).pop("thread_id", None)
 
-        for chunk in sync_client.runs.stream(
-            thread_id=thread_id,
-            assistant_id=self.assistant_id,
-            input=input,
-            command=command,
-            config=sanitized_config,
-            stream_mode=stream_modes,
-            interrupt_before=interrupt_before,
-            interrupt_after=interrupt_after,
-            stream_subgraphs=subgraphs or stream is not None,
-            if_not_exists="create",
-            headers=(
-                _merge_tracing_headers(headers) if self.distributed_tracing else headers
+        for chunk in self._forget_reads_after(
+            thread_id,
+            sync_client.runs.stream(
+                thread_id=thread_id,
+                assistant_id=self.assistant_id,
+                input=input,
+                command=command,
+                config=sanitized_config,
+                stream_mode=stream_modes,
+                interrupt_before=interrupt_before,
+                interrupt_after=interrupt_after,
+                stream_subgraphs=subgraphs or stream is not None,
+                if_not_exists="create",
+                headers=(
+                    _merge_tracing_headers(headers)
+                    if self.distributed_tracing
+                    else headers
+                ),
+                params=params,
+                **kwargs,
             ),
-            params=params,
-            **kwargs,
         ):
             # split mode and ns
             if NS_SEP in chunk.event:
@@ -837,22 +1072,27 @@ class RemoteGraph(PregelProtocol):
             command = None
         thread_id = sanitized_config.get("configurable", {}).pop("thread_id", None)
 
-        async for chunk in client.runs.stream(
-            thread_id=thread_id,
-            assistant_id=self.assistant_id,
-            input=input,
-            command=command,
-            config=sanitized_config,
-            stream_mode=stream_modes,
-            interrupt_before=interrupt_before,
-            interrupt_after=interrupt_after,
-            stream_subgraphs=subgraphs or stream is not None,
-            if_not_exists="create",
-            headers=(
-                _merge_tracing_headers(headers) if self.distributed_tracing else headers
+        async for chunk in self._aforget_reads_after(
+            thread_id,
+            client.runs.stream(
+                thread_id=thread_id,
+                assistant_id=self.assistant_id,
+                input=input,
+                command=command,
+                config=sanitized_config,
+                stream_mode=stream_modes,
+                interrupt_before=interrupt_before,
+                interrupt_after=interrupt_after,
+                stream_subgraphs=subgraphs or stream is not None,
+                if_not_exists="create",
+                headers=(
+                    _merge_tracing_headers(headers)
+                    if self.distributed_tracing
+                    else headers
+                ),
+                params=params,
+                **kwargs,
             ),
-            params=params,
-            **kwargs,
         ):
             # split mode and ns
             if NS_SEP in chunk.event:
@@ -1000,6 +1240,99 @@ class RemoteGraph(PregelProtocol):
             logger.warning("No events received from remote graph")
             return None
 
+    def _coalesce(self, key: tuple, fetch: Callable[[], ThreadState]) -> ThreadState:
+        with self._lock:
+            future = self._inflight.get(key)
+            if leader := future is None:
+                future = self._inflight[key] = concurrent.futures.Future()
+        if not leader:
+            return copy.deepcopy(future.result())
+        try:
+            state = fetch()
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(state)
+            return state
+        finally:
+            with self._lock:
+                if self._inflight.get(key) is future:
+                    del self._inflight[key]
+
+    async def _acoalesce(
+        self, key: tuple, fetch: Callable[[], Awaitable[ThreadState]]
+    ) -> ThreadState:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            inflight = self._ainflight.setdefault(loop, {})
+            task = inflight.get(key)
+            if leader := task is None:
+                task = inflight[key] = loop.create_task(fetch())  # type: ignore[arg-type]
+                task.add_done_callback(partial(_forget_task, self._lock, inflight, key))
+        # cancelling a caller doesn't cancel the request of the others
+        state = await asyncio.shield(task)
+        return state if leader else copy.deepcopy(state)
+
+    def _forget_reads(self, thread_id: str | None) -> None:
+        """Stop sharing the get_state requests in flight for the thread."""
+        with self._lock:
+            for inflight in (self._inflight, *self._ainflight.values()):
+                for key in [key for key in inflight if key[0] == thread_id]:
+                    del inflight[key]
+
+    def _forget_reads_after(
+        self, thread_id: str | None, chunks: Iterator[Any]
+    ) -> Iterator[Any]:
+        try:
+            yield from chunks
+        finally:
+            self._forget_reads(thread_id)
+
+    async def _aforget_reads_after(
+        self, thread_id: str | None, chunks: AsyncIterator[Any]
+    ) -> AsyncIterator[Any]:
+        try:
+            async for chunk in chunks:
+                yield chunk
+        finally:
+            self._forget_reads(thread_id)
+
+
+def _read_key(thread_id: str, checkpoint: Checkpoint | None, subgraphs: bool) -> tuple:
+    return (thread_id, json.dumps(checkpoint, sort_keys=True, default=str), subgraphs)
+
+
+def _forget_task(
+    lock: threading.Lock,
+    inflight: dict[tuple, asyncio.Task],
+    key: tuple,
+    task: asyncio.Task,
+) -> None:
+    with lock:
+        if inflight.get(key) is task:
+            del inflight[key]
+    if not task.cancelled():
+        # retrieve the exception, in case all callers were cancelled
+        task.exception()
+
+
+def _single_updates(
+    supersteps: Sequence[Sequence[StateUpdate]],
+) -> Iterator[StateUpdate]:
+    if not supersteps:
+        raise ValueError("No supersteps provided")
+    for superstep in supersteps:
+        if len(superstep) != 1:
+            raise NotImplementedError(
+                "RemoteGraph applies one update per superstep, "
+                f"got {len(superstep)} updates"
+            )
+        update = StateUpdate(*superstep[0])
+        if update.task_id is not None:
+            raise NotImplementedError("RemoteGraph can't apply updates to a task")
+        yield update
+
 
 def _merge_tracing_headers(headers: dict[str, str] | None) -> dict[str, str] | None:
     if rt := ls.get_current_run_tree():
@@ -105,11 +105,12 @@ import asyncio
 import concurrent.futures as cf
 import functools
 import logging
+import math
 from collections import defaultdict
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
 from datetime import datetime, timezone
 from importlib import util
-from typing import Any
+from typing import TYPE_CHECKING, Any, Literal, TypedDict
 
 from langchain_core.embeddings import Embeddings
 
@@ -130,9 +131,48 @@ from langgraph.store.base import (
     tokenize_path,
 )
 
+if TYPE_CHECKING:
+    import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
+class ANNIndexConfig(TypedDict, total=False):
+    """Configuration for the in-process vector index of `InMemoryStore`.
+
+    Requires NumPy. Without it, searches fall back to a linear scan.
+    """
+
+    kind: Literal["flat", "ivfflat"]
+    """Type of index to use.
+
+    - 'flat': exact search over a contiguous matrix of normalized vectors (default)
+    - 'ivfflat': approximate search that only scores the vectors in the
+        `nprobe` clusters closest to the query
+    """
+    nlist: int
+    """Number of clusters for the 'ivfflat' index. Default is 100.
+
+    Clusters are trained once the store holds 16 vectors per cluster, and
+    retrained whenever the number of vectors doubles. Until then, searches are
+    exact. Searches under a namespace prefix only probe the clusters holding
+    vectors under that prefix.
+    """
+    nprobe: int
+    """Number of clusters scored per query for the 'ivfflat' index.
+
+    Higher is better for recall, lower is better for speed. Defaults to
+    `sqrt(nlist)`.
+    """
+
+
+class InMemoryIndexConfig(IndexConfig, total=False):
+    """Configuration for vector search in `InMemoryStore`."""
+
+    ann_index_config: ANNIndexConfig
+    """Configuration of the vector index used to rank search results."""
+
+
 class InMemoryStore(BaseStore):
     """In-memory dictionary-backed store with optional vector search.
 
@@ -171,16 +211,34 @@ class InMemoryStore(BaseStore):
         ```bash
         pip install numpy
         ```
+
+        With numpy installed, each searched namespace prefix keeps an index of its
+        normalized vectors that is updated on every put. For large collections,
+        an approximate IVF index only scores the clusters closest to the query:
+        ```python
+        store = InMemoryStore(
+            index={
+                "dims": 1536,
+                "embed": init_embeddings("openai:text-embedding-3-small"),
+                "ann_index_config": {"kind": "ivfflat", "nlist": 100},
+            }
+        )
+        ```
     """
 
     __slots__ = (
         "_data",
         "_vectors",
+        "_vector_index",
+        "_ann_params",
+        "_use_vector_index",
         "index_config",
         "embeddings",
     )
 
-    def __init__(self, *, index: IndexConfig | None = None) -> None:
+    def __init__(
+        self, *, index: IndexConfig | InMemoryIndexConfig | None = None
+    ) -> None:
         # Both _data and _vectors are wrapped in the In-memory API
         # Do not change their names
         self._data: dict[tuple[str, ...], dict[str, Item]] = defaultdict(dict)
@@ -188,6 +246,10 @@ class InMemoryStore(BaseStore):
         self._vectors: dict[tuple[str, ...], dict[str, dict[str, list[float]]]] = (
             defaultdict(lambda: defaultdict(dict))
         )
+        # index of every vector, built on the first search and kept up to
+        # date on put, searches under a prefix mask out the other rows
+        self._vector_index: _VectorIndex | None = None
+        self._ann_params: dict[str, int] = {}
         self.index_config = index
         if self.index_config:
             self.index_config = self.index_config.copy()
@@ -198,10 +260,15 @@ class InMemoryStore(BaseStore):
                 (p, tokenize_path(p)) if p != "$" else (p, p)
                 for p in (self.index_config.get("fields") or ["$"])
             ]
+            self._ann_params = _get_ann_params(
+                self.index_config.get("ann_index_config")
+            )
 
         else:
             self.index_config = None
             self.embeddings = None
+        # vector indexes need numpy, checked once as it warns when missing
+        self._use_vector_index = self.index_config is not None and _check_numpy()
 
     def batch(self, ops: Iterable[Op]) -> list[Result]:
         # The batch/abatch methods are treated as internal.
@@ -235,9 +302,12 @@ class InMemoryStore(BaseStore):
 
     # Helpers
 
-    def _filter_items(self, op: SearchOp) -> list[tuple[Item, list[list[float]]]]:
+    def _filter_items(
+        self, op: SearchOp, with_vectors: bool = True
+    ) -> list[tuple[Item, list[list[float]]]]:
         """Filter items by namespace and filter function, return items with their embeddings."""
         namespace_prefix = op.namespace_prefix
+        with_vectors = with_vectors and bool(op.query)
 
         def filter_func(item: Item) -> bool:
             if not op.filter:
@@ -259,7 +329,9 @@ class InMemoryStore(BaseStore):
 
             for key, item in self._data[namespace].items():
                 if filter_func(item):
-                    if op.query and (embeddings := self._vectors[namespace].get(key)):
+                    if with_vectors and (
+                        embeddings := self._vectors[namespace].get(key)
+                    ):
                         filtered.append((item, list(embeddings.values())))
                     else:
                         filtered.append((item, []))
@@ -306,49 +378,19 @@ class InMemoryStore(BaseStore):
         results: list[Result],
     ) -> None:
         """Perform batch similarity search for multiple queries."""
+        ranked: dict[int, tuple[np.ndarray, np.ndarray]] = {}
+        if queryinmem_store and self._use_vector_index:
+            ranked = self._score_vector_index(ops, queryinmem_store)
         for i, (op, candidates) in ops.items():
             if not candidates:
                 results[i] = []
                 continue
             if op.query and queryinmem_store:
                 query_embedding = queryinmem_store[op.query]
-                flat_items, flat_vectors = [], []
-                scoreless = []
-                for item, vectors in candidates:
-                    for vector in vectors:
-                        flat_items.append(item)
-                        flat_vectors.append(vector)
-                    if not vectors:
-                        scoreless.append(item)
-
-                scores = _cosine_similarity(query_embedding, flat_vectors)
-                sorted_results = sorted(
-                    zip(scores, flat_items, strict=False),
-                    key=lambda x: x[0],
-                    reverse=True,
-                )
-                # max pooling
-                seen: set[tuple[tuple[str, ...], str]] = set()
-                kept: list[tuple[float | None, Item]] = []
-                for score, item in sorted_results:
-                    key = (item.namespace, item.key)
-                    if key in seen:
-                        continue
-                    ix = len(seen)
-                    seen.add(key)
-                    if ix >= op.offset + op.limit:
-                        break
-                    if ix < op.offset:
-                        continue
-
-                    kept.append((score, item))
-                if scoreless and len(kept) < op.limit:
-                    # Corner case: if we request more items than what we have embedded,
-                    # fill the rest with non-scored items
-                    kept.extend(
-                        (None, item) for item in scoreless[: op.limit - len(kept)]
-                    )
-
+                if i in ranked:
+                    kept = self._search_vector_index(op, *ranked[i], candidates)
+                else:
+                    kept = self._search_linear(op, query_embedding, candidates)
                 results[i] = [
                     SearchItem(
                         namespace=item.namespace,
@@ -372,6 +414,124 @@ class InMemoryStore(BaseStore):
                     for (item, _) in candidates[op.offset : op.offset + op.limit]
                 ]
 
+    def _search_linear(
+        self,
+        op: SearchOp,
+        query_embedding: list[float],
+        candidates: list[tuple[Item, list[list[float]]]],
+    ) -> list[tuple[float | None, Item]]:
+        """Rank candidates by scoring every one of their embeddings."""
+        flat_items, flat_vectors = [], []
+        scoreless = []
+        for item, vectors in candidates:
+            for vector in vectors:
+                flat_items.append(item)
+                flat_vectors.append(vector)
+            if not vectors:
+                scoreless.append(item)
+
+        scores = _cosine_similarity(query_embedding, flat_vectors)
+        sorted_results = sorted(
+            zip(scores, flat_items, strict=False),
+            key=lambda x: x[0],
+            reverse=True,
+        )
+        # max pooling
+        seen: set[tuple[tuple[str, ...], str]] = set()
+        kept: list[tuple[float | None, Item]] = []
+        for score, item in sorted_results:
+            key = (item.namespace, item.key)
+            if key in seen:
+                continue
+            ix = len(seen)
+            seen.add(key)
+            if ix >= op.offset + op.limit:
+                break
+            if ix < op.offset:
+                continue
+
+            kept.append((score, item))
+        if scoreless and len(kept) < op.limit:
+            # Corner case: if we request more items than what we have embedded,
+            # fill the rest with non-scored items
+            kept.extend((None, item) for item in scoreless[: op.limit - len(kept)])
+        return kept
+
+    def _score_vector_index(
+        self,
+        ops: dict[int, tuple[SearchOp, list[tuple[Item, list[list[float]]]]]],
+        queryinmem_store: dict[str, list[float]],
+    ) -> dict[int, tuple[np.ndarray, np.ndarray]]:
+        """Score the queries of all search ops, one matrix product per namespace prefix.
+
+        Returns the candidate rows and their scores for each op, by op index.
+        """
+        index = self._get_vector_index()
+        groups: defaultdict[tuple[str, ...], dict[str, list[int]]] = defaultdict(
+            lambda: defaultdict(list)
+        )
+        for i, (op, candidates) in ops.items():
+            if op.query and candidates:
+                groups[op.namespace_prefix][op.query].append(i)
+        ranked: dict[int, tuple[np.ndarray, np.ndarray]] = {}
+        for namespace_prefix, by_query in groups.items():
+            scored = index.search(
+                [queryinmem_store[q] for q in by_query], namespace_prefix
+            )
+            for op_ixs, rows_and_scores in zip(by_query.values(), scored, strict=True):
+                for i in op_ixs:
+                    ranked[i] = rows_and_scores
+        return ranked
+
+    def _search_vector_index(
+        self,
+        op: SearchOp,
+        rows: np.ndarray,
+        scores: np.ndarray,
+        candidates: list[tuple[Item, list[list[float]]]],
+    ) -> list[tuple[float | None, Item]]:
+        """Rank candidates by their scores from the vector index."""
+        index = self._get_vector_index()
+        allowed = (
+            {(item.namespace, item.key) for item, _ in candidates}
+            if op.filter
+            else None
+        )
+        end = op.offset + op.limit
+        # max pooling over the top k rows, widening k until it yields enough
+        # distinct items or covers every row
+        k = end
+        while True:
+            seen: set[tuple[tuple[str, ...], str]] = set()
+            kept: list[tuple[float | None, Item]] = []
+            for row, score in _top_k(rows, scores, k):
+                owner = index.owners[row]
+                if owner is None or owner in seen:
+                    continue
+                if allowed is not None and owner not in allowed:
+                    continue
+                ix = len(seen)
+                seen.add(owner)
+                if ix >= end:
+                    break
+                if ix < op.offset:
+                    continue
+                if (item := self._data[owner[0]].get(owner[1])) is not None:
+                    kept.append((score, item))
+            if len(seen) > end or k >= len(rows):
+                break
+            k *= 2
+        if len(kept) < op.limit:
+            # Corner case: if we request more items than what we have embedded,
+            # fill the rest with non-scored items
+            kept.extend(
+                (None, item)
+                for item, _ in candidates
+                if (item.namespace, item.key) not in index.keys
+            )
+            del kept[op.limit :]
+        return kept
+
     def _prepare_ops(
         self, ops: Iterable[Op]
     ) -> tuple[
@@ -389,7 +549,10 @@ class InMemoryStore(BaseStore):
                 item = self._data[op.namespace].get(op.key)
                 results.append(item)
             elif isinstance(op, SearchOp):
-                search_ops[i] = (op, self._filter_items(op))
+                search_ops[i] = (
+                    op,
+                    self._filter_items(op, with_vectors=not self._use_vector_index),
+                )
                 results.append(None)
             elif isinstance(op, ListNamespacesOp):
                 results.append(self._handle_list_namespaces(op))
@@ -405,7 +568,8 @@ class InMemoryStore(BaseStore):
         for (namespace, key), op in put_ops.items():
             if op.value is None:
                 self._data[namespace].pop(key, None)
-                self._vectors[namespace].pop(key, None)
+                if self._vectors[namespace].pop(key, None):
+                    self._reindex(namespace, key)
             else:
                 self._data[namespace][key] = Item(
                     value=op.value,
@@ -456,6 +620,29 @@ class InMemoryStore(BaseStore):
             )
         for embedding, (ns, key, path) in zip(embeddings, indices, strict=False):
             self._vectors[ns][key][path] = embedding
+        if self._vector_index is not None:
+            for ns, key in dict.fromkeys((ns, key) for ns, key, _ in indices):
+                self._reindex(ns, key)
+
+    def _get_vector_index(self) -> _VectorIndex:
+        if (index := self._vector_index) is None:
+            owners: list[tuple[tuple[str, ...], str]] = []
+            vectors: list[list[float]] = []
+            for namespace, keys in self._vectors.items():
+                for key, paths in keys.items():
+                    owners.extend((namespace, key) for _ in paths)
+                    vectors.extend(paths.values())
+            index = self._vector_index = _VectorIndex(**self._ann_params)
+            index.add(owners, vectors)
+        return index
+
+    def _reindex(self, namespace: tuple[str, ...], key: str) -> None:
+        """Replace the rows of an item in the vector index, if it was built."""
+        if (index := self._vector_index) is None:
+            return
+        index.remove((namespace, key))
+        if paths := self._vectors[namespace].get(key):
+            index.add([(namespace, key)] * len(paths), list(paths.values()))
 
     def _handle_list_namespaces(self, op: ListNamespacesOp) -> list[tuple[str, ...]]:
         all_namespaces = list(
@@ -522,6 +709,252 @@ def _cosine_similarity(X: list[float], Y: list[list[float]]) -> list[float]:
     return similarities
 
 
+# Clusters are only trained once there are this many vectors per cluster
+_IVF_MIN_ROWS_PER_LIST = 16
+_IVF_TRAIN_ITERATIONS = 10
+
+
+def _get_ann_params(config: ANNIndexConfig | None) -> dict[str, int]:
+    config = config or {}
+    kind = config.get("kind", "flat")
+    if kind == "flat":
+        return {"nlist": 0, "nprobe": 0}
+    elif kind == "ivfflat":
+        nlist = config.get("nlist", 100)
+        nprobe = config.get("nprobe", max(1, round(math.sqrt(nlist))))
+        if nlist < 1 or nprobe < 1:
+            raise ValueError(
+                f"nlist and nprobe must be positive, got nlist={nlist} and nprobe={nprobe}"
+            )
+        return {"nlist": nlist, "nprobe": nprobe}
+    else:
+        raise ValueError(
+            f"Invalid index kind for InMemoryStore: {kind}. Expected 'flat' or 'ivfflat'."
+        )
+
+
+class _VectorIndex:
+    """Normalized embeddings of every item in the store.
+
+    Rows live in one contiguous matrix that grows geometrically, so a query is
+    scored with a single matrix-vector product. Removed rows are masked out and
+    compacted away once they make up half of the matrix. Each row also holds the
+    id of its namespace, so searches under a prefix mask out the other rows.
+    With `nlist`, rows are also assigned to the closest of `nlist` cluster
+    centroids, and a query only scores the rows of its `nprobe` closest clusters.
+    """
+
+    __slots__ = (
+        "matrix",
+        "alive",
+        "row_namespaces",
+        "namespaces",
+        "owners",
+        "keys",
+        "size",
+        "removed",
+        "nlist",
+        "nprobe",
+        "centroids",
+        "assignments",
+        "trained_size",
+    )
+
+    def __init__(self, nlist: int = 0, nprobe: int = 0) -> None:
+        self.matrix: np.ndarray | None = None
+        self.alive: np.ndarray | None = None
+        # [row] -> namespace id
+        self.row_namespaces: np.ndarray | None = None
+        # namespace -> namespace id
+        self.namespaces: dict[tuple[str, ...], int] = {}
+        # [row] -> (namespace, key), None for removed rows
+        self.owners: list[tuple[tuple[str, ...], str] | None] = []
+        # (namespace, key) -> rows
+        self.keys: dict[tuple[tuple[str, ...], str], list[int]] = {}
+        self.size = 0
+        self.removed = 0
+        self.nlist = nlist
+        self.nprobe = nprobe
+        self.centroids: np.ndarray | None = None
+        self.assignments: np.ndarray | None = None
+        self.trained_size = 0
+
+    def add(
+        self, owners: list[tuple[tuple[str, ...], str]], vectors: list[list[float]]
+    ) -> None:
+        import numpy as np
+
+        if not vectors:
+            return
+        rows = np.array(vectors, dtype=np.float64)
+        norms = np.linalg.norm(rows, axis=1, keepdims=True)
+        np.divide(rows, norms, out=rows, where=norms != 0)
+        start, end = self.size, self.size + len(rows)
+        if self.matrix is None or end > len(self.matrix):
+            self._resize(max(end, 2 * self.size, 16), rows.shape[1])
+        assert self.matrix is not None and self.alive is not None
+        assert self.row_namespaces is not None
+        self.matrix[start:end] = rows
+        self.alive[start:end] = True
+        self.row_namespaces[start:end] = [
+            self.namespaces.setdefault(namespace, len(self.namespaces))
+            for namespace, _ in owners
+        ]
+        self.owners.extend(owners)
+        for row, owner in enumerate(owners, start):
+            self.keys.setdefault(owner, []).append(row)
+        self.size = end
+        if self.centroids is not None:
+            assert self.assignments is not None
+            self.assignments[start:end] = np.argmax(rows @ self.centroids.T, axis=1)
+        if self.nlist and (
+            self.size - self.removed
+            >= max(2 * self.trained_size, self.nlist * _IVF_MIN_ROWS_PER_LIST)
+        ):
+            self._train()
+
+    def remove(self, owner: tuple[tuple[str, ...], str]) -> None:
+        if (rows := self.keys.pop(owner, None)) is None:
+            return
+        assert self.alive is not None
+        for row in rows:
+            self.owners[row] = None
+        self.alive[rows] = False
+        self.removed += len(rows)
+        if self.removed * 2 > self.size:
+            self._compact()
+
+    def search(
+        self, queries: list[list[float]], namespace_prefix: tuple[str, ...] = ()
+    ) -> list[tuple[np.ndarray, np.ndarray]]:
+        """Return the candidate rows for each query, and their cosine similarity.
+
+        Only rows under `namespace_prefix` are candidates. All queries are
+        scored with a single matrix product.
+        """
+        import numpy as np
+
+        if self.matrix is None or self.size == self.removed:
+            return [(np.empty(0, dtype=np.intp), np.empty(0)) for _ in queries]
+        assert self.alive is not None and self.row_namespaces is not None
+        q = np.array(queries, dtype=np.float64)
+        norms = np.linalg.norm(q, axis=1, keepdims=True)
+        np.divide(q, norms, out=q, where=norms != 0)
+        live = self.alive[: self.size]
+        masked = bool(self.removed)
+        if namespace_prefix:
+            ids = [
+                id_
+                for namespace, id_ in self.namespaces.items()
+                if namespace[: len(namespace_prefix)] == namespace_prefix
+            ]
+            if len(ids) < len(self.namespaces):
+                live = live & np.isin(self.row_namespaces[: self.size], ids)
+                masked = True
+        if self.centroids is not None:
+            assert self.assignments is not None
+            assignments = self.assignments[: self.size]
+            # only probe the clusters holding candidate rows
+            clusters = np.unique(assignments[live])
+            probes = [
+                clusters[_top_k_indices(scores, self.nprobe)]
+                for scores in q @ self.centroids[clusters].T
+            ]
+            # score the union of the probed clusters once, then keep each
+            # query's own clusters
+            rows = np.flatnonzero(np.isin(assignments, np.concatenate(probes)) & live)
+            scores = q @ self.matrix[rows].T
+            results = []
+            for query_probes, query_scores in zip(probes, scores, strict=True):
+                mask = np.isin(assignments[rows], query_probes)
+                results.append((rows[mask], query_scores[mask]))
+            return results
+        if masked:
+            rows = np.flatnonzero(live)
+            scores = q @ self.matrix[rows].T
+            return [(rows, query_scores) for query_scores in scores]
+        rows = np.arange(self.size)
+        scores = q @ self.matrix[: self.size].T
+        return [(rows, query_scores) for query_scores in scores]
+
+    def _resize(self, capacity: int, dims: int) -> None:
+        import numpy as np
+
+        matrix = np.empty((capacity, dims), dtype=np.float64)
+        alive = np.zeros(capacity, dtype=bool)
+        row_namespaces = np.zeros(capacity, dtype=np.intp)
+        if self.matrix is not None and self.alive is not None:
+            assert self.row_namespaces is not None
+            matrix[: self.size] = self.matrix[: self.size]
+            alive[: self.size] = self.alive[: self.size]
+            row_namespaces[: self.size] = self.row_namespaces[: self.size]
+        self.matrix, self.alive = matrix, alive
+        self.row_namespaces = row_namespaces
+        if self.assignments is not None:
+            assignments = np.zeros(capacity, dtype=np.intp)
+            assignments[: self.size] = self.assignments[: self.size]
+            self.assignments = assignments
+
+    def _compact(self) -> None:
+        import numpy as np
+
+        assert self.matrix is not None and self.alive is not None
+        assert self.row_namespaces is not None
+        rows = np.flatnonzero(self.alive[: self.size])
+        size = len(rows)
+        self.matrix[:size] = self.matrix[rows]
+        self.alive[:size] = True
+        self.alive[size:] = False
+        self.row_namespaces[:size] = self.row_namespaces[rows]
+        if self.assignments is not None:
+            self.assignments[:size] = self.assignments[rows]
+        self.owners = [self.owners[row] for row in rows.tolist()]
+        self.keys = {}
+        for row, owner in enumerate(self.owners):
+            self.keys.setdefault(owner, []).append(row)  # type: ignore[arg-type]
+        self.size = size
+        self.removed = 0
+
+    def _train(self) -> None:
+        """Fit the cluster centroids with spherical k-means over the live rows."""
+        import numpy as np
+
+        assert self.matrix is not None and self.alive is not None
+        if self.removed:
+            self._compact()
+        rows = self.matrix[: self.size]
+        rng = np.random.default_rng(0)
+        centroids = rows[rng.choice(self.size, self.nlist, replace=False)].copy()
+        for _ in range(_IVF_TRAIN_ITERATIONS):
+            assignments = np.argmax(rows @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assignments, rows)
+            norms = np.linalg.norm(sums, axis=1, keepdims=True)
+            # keep the previous centroid of clusters left empty
+            nonempty = norms[:, 0] != 0
+            centroids[nonempty] = sums[nonempty] / norms[nonempty]
+        self.centroids = centroids
+        self.assignments = np.zeros(len(self.matrix), dtype=np.intp)
+        self.assignments[: self.size] = np.argmax(rows @ centroids.T, axis=1)
+        self.trained_size = self.size
+
+
+def _top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k highest scores, highest first."""
+    import numpy as np
+
+    if k < len(scores):
+        top = np.argpartition(scores, -k)[-k:]
+        return top[np.argsort(-scores[top], kind="stable")]
+    return np.argsort(-scores, kind="stable")
+
+
+def _top_k(rows: np.ndarray, scores: np.ndarray, k: int) -> Iterator[tuple[int, float]]:
+    """Yield the k highest scoring rows and their score, highest first."""
+    top = _top_k_indices(scores, k)
+    yield from zip(rows[top].tolist(), scores[top].tolist(), strict=True)
+
+
 def _does_match(match_condition: MatchCondition, key: tuple[str, ...]) -> bool:
     """Whether a namespace key matches a match condition."""
     match_type = match_condition.match_type
@@ -46,6 +46,7 @@ __all__ = (
     "StreamWriter",
     "RetryPolicy",
     "CachePolicy",
+    "HedgePolicy",
     "Interrupt",
     "StateUpdate",
     "PregelTask",
@@ -93,7 +94,14 @@ def ensure_valid_checkpointer(checkpointer: Checkpointer) -> Checkpointer:
 
 
 StreamMode = Literal[
-    "values", "updates", "checkpoints", "tasks", "debug", "messages", "custom"
+    "values",
+    "updates",
+    "checkpoints",
+    "tasks",
+    "debug",
+    "messages",
+    "custom",
+    "profile",
 ]
 """How the stream method should emit outputs.
 
@@ -106,6 +114,15 @@ StreamMode = Literal[
 - `"checkpoints"`: Emit an event when a checkpoint is created, in the same format as returned by `get_state()`.
 - `"tasks"`: Emit events when tasks start and finish, including their results and errors.
 - `"debug"`: Emit `"checkpoints"` and `"tasks"` events for debugging purposes.
+- `"profile"`: Emit timings of each step, for profiling. After each step, emits a
+    `"task"` event for each task that ran, with its `queue_wait` and `duration` in
+    seconds, its number of `attempts`, the time slept between attempts by its retry
+    policy (`backoff`, not counted in `duration`) and the token `usage` of the models
+    it called, then a `"step"` event with the step's `duration`, the total
+    `queue_wait`, `task_time` and `backoff` of its tasks, the time spent applying writes (`apply_writes`) and
+    creating the checkpoint (`checkpoint`), and its total token `usage`. Emits a
+    `"checkpoint_put"` event with the `duration` of each checkpoint saved, including
+    serialization, once the checkpointer returns.
 """
 
 StreamWriter = Callable[[Any], None]
@@ -138,6 +155,36 @@ class RetryPolicy(NamedTuple):
     """List of exception classes that should trigger a retry, or a callable that returns `True` for exceptions that should trigger a retry."""
 
 
+class HedgePolicy(NamedTuple):
+    """Configuration for hedging slow runs of nodes.
+
+    A run of the node that takes longer than a percentile of the latencies of its
+    recent runs is raced against a second run, started then. The result of the
+    first run to finish is used, and the other run is cancelled. In sync runs, the
+    other run can't be interrupted, it finishes in a thread of the run's executor,
+    which the graph run waits for before returning, and its result is ignored.
+
+    Only the node itself is run twice, its writes are applied once. Runs of nodes
+    that call models or other services are safe to hedge as long as the calls can
+    be made twice.
+
+    Both runs are traced and stream their messages. The output of the stream
+    writer of runs that may be hedged is buffered, and only that of the run used
+    is streamed, once it finished.
+    """
+
+    percentile: float = 95.0
+    """Percentile of the latencies of recent runs after which a second run is started."""
+    window: int = 100
+    """Number of recent runs the percentile is computed over."""
+    min_samples: int = 20
+    """Number of runs to observe before hedging."""
+    min_delay: float = 0.0
+    """Minimum amount of time before a second run is started. In seconds."""
+    max_hedge_rate: float = 0.1
+    """Maximum fraction of the runs of the node that are hedged."""
+
+
 KeyFuncT = TypeVar("KeyFuncT", bound=Callable[..., str | bytes])
 
 
@@ -76,7 +76,7 @@ from langgraph_sdk.schema import (
     ThreadStreamMode,
     ThreadUpdateStateResponse,
 )
-from langgraph_sdk.sse import SSEDecoder, aiter_lines_raw, iter_lines_raw
+from langgraph_sdk.sse import aiter_sse, iter_sse
 
 logger = logging.getLogger(__name__)
 
@@ -181,6 +181,8 @@ def get_client(
     api_key: str | None = NOT_PROVIDED,
     headers: Mapping[str, str] | None = None,
     timeout: TimeoutTypes | None = None,
+    limits: httpx.Limits | None = None,
+    http2: bool = False,
 ) -> LangGraphClient:
     """Create and configure a LangGraphClient.
 
@@ -209,6 +211,15 @@ def get_client(
               - float (total seconds)
               - tuple `(connect, read, write, pool)` in seconds
             Defaults: connect=5, read=300, write=300, pool=5.
+        limits:
+            Connection pool limits of the client, an `httpx.Limits` instance with
+            the maximum number of connections, of idle connections kept alive, and
+            how long idle connections are kept alive. Defaults to the limits of
+            `httpx`: 100 connections, 20 kept alive for 5 seconds.
+        http2:
+            Whether to use HTTP/2 with servers that support it, so that concurrent
+            requests share connections. Requires the `h2` package, installed with
+            `pip install httpx[http2]`.
 
     Returns:
         LangGraphClient:
@@ -275,7 +286,10 @@ def get_client(
                 _registered_transports.append(transport)
 
     if transport is None:
-        transport = httpx.AsyncHTTPTransport(retries=5)
+        # without limits, the transport keeps the defaults of httpx
+        transport = httpx.AsyncHTTPTransport(
+            retries=5, http2=http2, **({} if limits is None else {"limits": limits})
+        )
     client = httpx.AsyncClient(
         base_url=url,
         transport=transport,
@@ -552,31 +566,21 @@ class HttpClient:
                     reconnect_path = reconnect_location
 
                 # parse SSE
-                decoder = SSEDecoder()
                 try:
-                    async for line in aiter_lines_raw(res):
-                        sse = decoder.decode(line=cast("bytes", line).rstrip(b"\n"))
-                        if sse is not None:
-                            if decoder.last_event_id is not None:
-                                last_event_id = decoder.last_event_id
-                            if sse.event or sse.data is not None:
-                                yield sse
+                    async for sse in aiter_sse(res):
+                        if sse.id is not None:
+                            last_event_id = sse.id
+                        # events without event or data, eg. only setting the id
+                        # or flushed at the end of the body, are skipped so the
+                        # stream doesn't emit blank items after reconnects.
+                        if sse.event or sse.data is not None:
+                            yield sse
                 except httpx.HTTPError:
                     # httpx.TransportError inherits from HTTPError, so transient
                     # disconnects during streaming land here.
                     if reconnect_path is None:
                         raise
                     retry = True
-                else:
-                    if sse := decoder.decode(b""):
-                        if decoder.last_event_id is not None:
-                            last_event_id = decoder.last_event_id
-                        if sse.event or sse.data is not None:
-                            # decoder.decode(b"") flushes the in-flight event and may
-                            # return an empty placeholder when there is no pending
-                            # message. Skip these no-op events so the stream doesn't
-                            # emit a trailing blank item after reconnects.
-                            yield sse
             if retry:
                 reconnect_attempts += 1
                 if reconnect_attempts > max_reconnect_attempts:
@@ -3674,6 +3678,8 @@ def get_sync_client(
     api_key: str | None = NOT_PROVIDED,
     headers: Mapping[str, str] | None = None,
     timeout: TimeoutTypes | None = None,
+    limits: httpx.Limits | None = None,
+    http2: bool = False,
 ) -> SyncLangGraphClient:
     """Get a synchronous LangGraphClient instance.
 
@@ -3691,6 +3697,11 @@ def get_sync_client(
             Accepts an httpx.Timeout instance, a float (seconds), or a tuple of timeouts.
             Tuple format is (connect, read, write, pool)
             If not provided, defaults to connect=5s, read=300s, write=300s, and pool=5s.
+        limits: Optional connection pool limits for the HTTP client, an
+            `httpx.Limits` instance. Defaults to the limits of `httpx`: 100
+            connections, 20 kept alive for 5 seconds.
+        http2: Whether to use HTTP/2 with servers that support it. Requires the
+            `h2` package, installed with `pip install httpx[http2]`.
     Returns:
         SyncLangGraphClient: The top-level synchronous client for accessing AssistantsClient,
         ThreadsClient, RunsClient, and CronClient.
@@ -3723,7 +3734,10 @@ def get_sync_client(
     if url is None:
         url = "http://localhost:8123"
 
-    transport = httpx.HTTPTransport(retries=5)
+    # without limits, the transport keeps the defaults of httpx
+    transport = httpx.HTTPTransport(
+        retries=5, http2=http2, **({} if limits is None else {"limits": limits})
+    )
     client = httpx.Client(
         base_url=url,
         transport=transport,
@@ -4005,29 +4019,20 @@ class SyncHttpClient:
                 if reconnect_location:
                     reconnect_path = reconnect_location
 
-                decoder = SSEDecoder()
                 try:
-                    for line in iter_lines_raw(res):
-                        sse = decoder.decode(cast(bytes, line).rstrip(b"\n"))
-                        if sse is not None:
-                            if decoder.last_event_id is not None:
-                                last_event_id = decoder.last_event_id
-                            if sse.event or sse.data is not None:
-                                yield sse
+                    for sse in iter_sse(res):
+                        if sse.id is not None:
+                            last_event_id = sse.id
+                        # See async stream implementation for rationale on
+                        # skipping events without event or data.
+                        if sse.event or sse.data is not None:
+                            yield sse
                 except httpx.HTTPError:
                     # httpx.TransportError inherits from HTTPError, so transient
                     # disconnects during streaming land here.
                     if reconnect_path is None:
                         raise
                     retry = True
-                else:
-                    if sse := decoder.decode(b""):
-                        if decoder.last_event_id is not None:
-                            last_event_id = decoder.last_event_id
-                        if sse.event or sse.data is not None:
-                            # See async stream implementation for rationale on
-                            # skipping empty flush events.
-                            yield sse
             if retry:
                 reconnect_attempts += 1
                 if reconnect_attempts > max_reconnect_attempts:
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import contextlib
+import re
 from collections.abc import AsyncIterator, Iterator
 from typing import cast
 
@@ -139,6 +140,178 @@ class SSEDecoder:
         return None
 
 
+class ChunkedSSEDecoder:
+    """Decodes server-sent events from the chunks of a response body.
+
+    Produces the same events as `BytesLineDecoder` and `SSEDecoder` together, but
+    decodes each chunk as a whole instead of line by line: events in the usual
+    layout of a LangGraph server are matched at once, other lines are found with
+    `bytearray.find`, and the JSON of `data` fields is parsed from slices of the
+    buffer. Only the incomplete line at the end of a chunk, and the data of an
+    event still being received, are kept until the next chunk.
+    """
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+        self._event = ""
+        # data of the current event received in previous chunks
+        self._data = bytearray()
+        self._last_event_id = ""
+        self._retry: int | None = None
+
+    @property
+    def last_event_id(self) -> str | None:
+        """Return the last event identifier that was seen."""
+
+        return self._last_event_id or None
+
+    def decode(self, chunk: bytes) -> list[StreamPart]:
+        """Decode a chunk, and return the events it completes."""
+        buffer = self._buffer
+        buffer += chunk
+        if b"\r" in buffer:
+            # rare, so normalize line ends to \n, keeping a trailing \r which may
+            # be followed by \n in the next chunk
+            trailing_cr = buffer.endswith(b"\r")
+            buffer[:] = buffer.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+            if trailing_cr:
+                buffer[-1:] = b"\r"
+        parts: list[StreamPart] = []
+        end = self._decode_lines(buffer, parts)
+        del buffer[:end]
+        return parts
+
+    def flush(self) -> list[StreamPart]:
+        """Decode the rest of the response body, once it was fully received."""
+        buffer = self._buffer
+        if buffer.endswith(b"\r"):
+            buffer[-1:] = b"\n"
+        elif buffer:
+            buffer += b"\n"
+        # the end of the body ends the current event
+        buffer += b"\n"
+        parts: list[StreamPart] = []
+        self._decode_lines(buffer, parts)
+        buffer.clear()
+        return parts
+
+    def _decode_lines(self, buffer: bytearray, parts: list[StreamPart]) -> int:
+        """Decode the complete lines of `buffer`, and return where they end."""
+        # spans of the data fields of the current event in `buffer`
+        spans: list[tuple[int, int]] = []
+        start = 0
+        while True:
+            if (
+                not spans
+                and not self._event
+                and not self._data
+                and self._retry is None
+                and (match := _EVENT.match(buffer, start)) is not None
+            ):
+                # a whole event in the usual layout, matched at once
+                id_before, event, data, id_after = match.groups()
+                if (id := id_after if id_after is not None else id_before) is not None:
+                    self._last_event_id = id.decode()
+                # like _dispatch, an event of empty fields is only sent after an id
+                if event or data or self._last_event_id:
+                    parts.append(
+                        StreamPart(
+                            event.decode() if event else "",
+                            orjson.loads(data) if data else None,
+                            self.last_event_id,
+                        )
+                    )
+                start = match.end()
+                continue
+            if (end := buffer.find(b"\n", start)) == -1:
+                break
+            if start == end:
+                # an empty line ends the event
+                if part := self._dispatch(buffer, spans):
+                    parts.append(part)
+                spans.clear()
+            elif buffer[start] != _COLON:
+                self._field(buffer, start, end, spans)
+            start = end + 1
+        # keep the data of the current event, before the buffer changes
+        for a, b in spans:
+            self._data += buffer[a:b]
+        return start
+
+    def _field(
+        self, buffer: bytearray, start: int, end: int, spans: list[tuple[int, int]]
+    ) -> None:
+        if (colon := buffer.find(b":", start, end)) == -1:
+            colon = value = end
+        else:
+            value = colon + 1
+            if value < end and buffer[value] == _SPACE:
+                value += 1
+        name = buffer[start:colon]
+        if name == b"data":
+            spans.append((value, end))
+        elif name == b"event":
+            self._event = buffer[value:end].decode()
+        elif name == b"id":
+            if buffer.find(b"\0", value, end) == -1:
+                self._last_event_id = buffer[value:end].decode()
+        elif name == b"retry":
+            with contextlib.suppress(TypeError, ValueError):
+                self._retry = int(buffer[value:end])
+
+    def _dispatch(
+        self, buffer: bytearray, spans: list[tuple[int, int]]
+    ) -> StreamPart | None:
+        for a, b in spans:
+            self._data += buffer[a:b]
+        # empty data fields don't make an event, as in SSEDecoder
+        if (
+            not self._event
+            and not self._data
+            and not self._last_event_id
+            and self._retry is None
+        ):
+            return None
+        part = StreamPart(
+            event=self._event,
+            data=orjson.loads(self._data) if self._data else None,  # type: ignore[invalid-argument-type]
+            id=self.last_event_id,
+        )
+        # NOTE: as per the SSE spec, do not reset last_event_id.
+        self._event = ""
+        self._data = bytearray()
+        self._retry = None
+        return part
+
+
+_COLON = ord(":")
+_SPACE = ord(" ")
+# an event of an optional id, an optional event name, a single data field and an
+# optional id, the layout used by LangGraph servers
+_EVENT = re.compile(
+    rb"(?:id: ?([^\n\0]*)\n)?(?:event: ?([^\n]*)\n)?"
+    rb"data: ?([^\n]*)\n(?:id: ?([^\n\0]*)\n)?\n"
+)
+
+
+async def aiter_sse(response: httpx.Response) -> AsyncIterator[StreamPart]:
+    decoder = ChunkedSSEDecoder()
+    async for chunk in response.aiter_bytes():
+        for part in decoder.decode(chunk):
+            yield part
+    for part in decoder.flush():
+        yield part
+
+
+def iter_sse(response: httpx.Response) -> Iterator[StreamPart]:
+    decoder = ChunkedSSEDecoder()
+    for chunk in response.iter_bytes():
+        for part in decoder.decode(chunk):
+            yield part
+    for part in decoder.flush():
+        yield part
+
+
 async def aiter_lines_raw(response: httpx.Response) -> AsyncIterator[BytesLike]:
     decoder = BytesLineDecoder()
     async for chunk in response.aiter_bytes():
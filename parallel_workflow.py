@@ -2,6 +2,7 @@ from langgraph.graph import StateGraph, START, END
 from langchain_openai import ChatOpenAI 
 from typing import TypedDict
 from dotenv import load_dotenv
+import asyncio
 import os
 
 load_dotenv()
@@ -21,36 +22,36 @@ class LearningState(TypedDict,total=False):
     summary : str
 
 
-def supervised(state: LearningState) -> LearningState:
+async def supervised(state: LearningState) -> LearningState:
     supervised = state['supervised']
     prompt = f"Identify this type of learning : {supervised}"
-    answer = model.invoke(prompt).content
+    answer = (await model.ainvoke(prompt)).content
     #state['answer'] = answer
     return {'supervised':answer} 
     # partial state update in parallel execution, only updating the 'supervised' key
 
-def unsupervised(state: LearningState) -> LearningState:
+async def unsupervised(state: LearningState) -> LearningState:
     unsupervised = state['unsupervised']
     prompt = f"Identify this type of learning : {unsupervised}"
-    answer = model.invoke(prompt).content
+    answer = (await model.ainvoke(prompt)).content
     #state['answer'] = answer
     return {'unsupervised':answer}
 
-def mixed(state: LearningState) -> LearningState:
+async def mixed(state: LearningState) -> LearningState:
     mixed = state['mixed']
     prompt = f"Identify this type of learning : {mixed}"
-    answer = model.invoke(prompt).content
+    answer = (await model.ainvoke(prompt)).content
     #state['answer'] = answer
     return {'mixed':answer}
 
-def summary(state: LearningState) -> LearningState:
+async def summary(state: LearningState) -> LearningState:
     combined = f"""
 {state['supervised']}
 {state['unsupervised']}
 {state['mixed']}
 """
     prompt = f"Summarize the following content:\n{combined}"
-    answer = model.invoke(prompt).content
+    answer = (await model.ainvoke(prompt)).content
     return {"summary": answer}
 
 graph = StateGraph(LearningState)
@@ -70,7 +71,9 @@ graph.add_edge('mixed', 'summary')
 
 graph.add_edge('summary', END)
 
-workflow = graph.compile()
+# supervised, unsupervised and mixed are async, so they await the model side by
+# side on the event loop. max_concurrency is applied to each run separately.
+workflow = graph.compile().with_config(max_concurrency=8)
 
 initial_state = {
     'supervised': 'A bank uses supervised learning to detect credit card fraud. The model is trained on past transactions labeled as “fraud” or “not fraud.” By learning patterns from labeled data, it predicts whether new transactions are suspicious. Humans verify flagged cases, and their feedback improves future accuracy, making fraud detection faster and more reliable in real time.',
@@ -78,7 +81,6 @@ initial_state = {
     'mixed': 'A medical imaging system uses mixed learning to diagnose diseases from scans. A small set of images is labeled by doctors, while thousands remain unlabeled. The model learns from both datasets, using labeled examples as guidance and unlabeled data to refine patterns. This reduces expert workload and improves diagnostic accuracy when labeled medical data is limited.',
 }
 
-final_state = workflow.invoke(initial_state)
-
 if __name__ == "__main__":
+    final_state = asyncio.run(workflow.ainvoke(initial_state))
     print(final_state['summary'])
\ No newline at end of file
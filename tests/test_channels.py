@@ -0,0 +1,58 @@
+from collections.abc import Sequence
+from typing import Annotated, Any
+
+from typing_extensions import TypedDict
+
+from langgraph.channels import BinaryOperatorAggregate, LastValue
+from langgraph.graph import START, StateGraph
+
+
+class CountSteps(BinaryOperatorAggregate):
+    """Counts the steps of the run, written to or not."""
+
+    def update(self, values: Sequence[Any]) -> bool:
+        super().update(values)
+        self.value += 1
+        return True
+
+
+class Finished(LastValue):
+    """Set to "finished" when the run finishes."""
+
+    def finish(self) -> bool:
+        self.value = "finished"
+        return True
+
+
+class Quiet(BinaryOperatorAggregate):
+    reacts_to_empty_step = False
+
+    def update(self, values: Sequence[Any]) -> bool:
+        return super().update(values)
+
+
+def test_overridden_methods_reset_the_flags() -> None:
+    assert not BinaryOperatorAggregate.reacts_to_empty_step
+    assert CountSteps.reacts_to_empty_step
+    assert not CountSteps.reacts_to_finish
+    assert not LastValue.reacts_to_finish
+    assert Finished.reacts_to_finish
+    assert not Finished.reacts_to_empty_step
+    # unless the subclass sets them itself
+    assert not Quiet.reacts_to_empty_step
+
+
+def test_subclass_channels_are_notified() -> None:
+    class State(TypedDict, total=False):
+        value: int
+        steps: Annotated[int, CountSteps(int, lambda a, b: a + b)]
+        status: Annotated[str, Finished(str)]
+
+    builder = StateGraph(State)
+    builder.add_node("one", lambda state: {"value": 1})
+    builder.add_node("two", lambda state: {"value": 2})
+    builder.add_edge(START, "one")
+    builder.add_edge("one", "two")
+    result = builder.compile().invoke({"value": 0})
+    # the input step and the steps of both nodes
+    assert result == {"value": 2, "steps": 3, "status": "finished"}
@@ -0,0 +1,204 @@
+import os
+import threading
+from pathlib import Path
+from typing import Any
+
+import pytest
+from typing_extensions import TypedDict
+
+import langgraph.checkpoint.file as file_module
+from langgraph.checkpoint.file import FileSaver
+from langgraph.graph import START, StateGraph
+
+
+class State(TypedDict):
+    value: str
+
+
+def build(saver: FileSaver) -> Any:
+    builder = StateGraph(State)
+    builder.add_node("node", lambda state: {"value": state["value"] + "!"})
+    builder.add_edge(START, "node")
+    return builder.compile(checkpointer=saver)
+
+
+def config(thread_id: str) -> Any:
+    return {"configurable": {"thread_id": thread_id}}
+
+
+def run(saver: FileSaver, thread_id: str, value: str = "x" * 1000) -> None:
+    build(saver).invoke({"value": value}, config(thread_id))
+
+
+def values(saver: FileSaver, thread_id: str) -> Any:
+    return build(saver).get_state(config(thread_id)).values
+
+
+def test_checkpoints_survive_reopen(tmp_path: Path) -> None:
+    path = tmp_path / "log"
+    with FileSaver(path) as saver:
+        run(saver, "1", "a")
+        run(saver, "2", "b")
+    with FileSaver(path) as saver:
+        assert values(saver, "1") == {"value": "a!"}
+        assert values(saver, "2") == {"value": "b!"}
+        assert len(list(saver.list(config("1")))) == 3
+
+
+@pytest.mark.parametrize("cut", [1, 7, 100])
+def test_torn_record_is_discarded(tmp_path: Path, cut: int) -> None:
+    path = tmp_path / "log"
+    with FileSaver(path) as saver:
+        run(saver, "1", "a")
+        end = saver._end
+        run(saver, "2", "b")
+    # a crash in the middle of writing the second run's records
+    with open(path, "r+b") as f:
+        f.truncate(end + cut)
+    with FileSaver(path) as saver:
+        assert values(saver, "1") == {"value": "a!"}
+        assert values(saver, "2") == {}
+        assert saver._end == end
+        # later records are appended after the last valid one
+        run(saver, "3", "c")
+    with FileSaver(path) as saver:
+        assert values(saver, "1") == {"value": "a!"}
+        assert values(saver, "3") == {"value": "c!"}
+
+
+def test_corrupt_record_is_discarded_with_later_records(tmp_path: Path) -> None:
+    path = tmp_path / "log"
+    with FileSaver(path) as saver:
+        run(saver, "1", "a")
+        end = saver._end
+        run(saver, "2", "b")
+        run(saver, "3", "c")
+    with open(path, "r+b") as f:
+        f.seek(end + 20)
+        byte = f.read(1)
+        f.seek(end + 20)
+        f.write(bytes([byte[0] ^ 0xFF]))
+    with FileSaver(path) as saver:
+        assert values(saver, "1") == {"value": "a!"}
+        assert values(saver, "2") == {}
+        assert values(saver, "3") == {}
+
+
+def test_failed_append_rolls_back_index(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    path = tmp_path / "log"
+    write_all = file_module._write_all
+
+    def full_disk(fd: int, data: bytes, offset: int | None = None) -> None:
+        write_all(fd, data[: len(data) // 2], offset)
+        raise OSError(28, "No space left on device")
+
+    with FileSaver(path) as saver:
+        run(saver, "1", "a")
+        monkeypatch.setattr(file_module, "_write_all", full_disk)
+        with pytest.raises(OSError):
+            run(saver, "2", "b")
+        # the checkpoint applied in memory before the append was dropped
+        assert values(saver, "2") == {}
+        monkeypatch.setattr(file_module, "_write_all", write_all)
+        run(saver, "3", "c")
+        assert values(saver, "1") == {"value": "a!"}
+    with FileSaver(path) as saver:
+        assert values(saver, "1") == {"value": "a!"}
+        assert values(saver, "2") == {}
+        assert values(saver, "3") == {"value": "c!"}
+
+
+def test_compact_drops_deleted_records(tmp_path: Path) -> None:
+    path = tmp_path / "log"
+    with FileSaver(path, compaction_min_bytes=1 << 30) as saver:
+        for i in range(10):
+            run(saver, str(i))
+        for i in range(8):
+            saver.delete_thread(str(i))
+        size = saver._end
+        assert saver._garbage > size / 2
+        saver.compact()
+        assert saver._garbage == 0
+        assert saver._end < size / 3
+        assert os.path.getsize(path) == saver._end
+        assert values(saver, "9") == {"value": "x" * 1000 + "!"}
+        run(saver, "10", "a")
+    with FileSaver(path) as saver:
+        assert values(saver, "0") == {}
+        assert values(saver, "9") == {"value": "x" * 1000 + "!"}
+        assert values(saver, "10") == {"value": "a!"}
+
+
+def test_background_compaction_does_not_block_writes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    path = tmp_path / "log"
+    writing = threading.Event()
+    release = threading.Event()
+    write_records = file_module._write_records
+
+    def slow_write_records(fd: int, records: Any) -> int:
+        writing.set()
+        assert release.wait(10)
+        return write_records(fd, records)
+
+    monkeypatch.setattr(file_module, "_write_records", slow_write_records)
+    with FileSaver(path, compaction_min_bytes=1, compaction_ratio=0.5) as saver:
+        for i in range(4):
+            run(saver, str(i))
+        for i in range(3):
+            saver.delete_thread(str(i))
+        assert writing.wait(10)
+        # writes go on while the live records are written out
+        done = threading.Event()
+
+        def write() -> None:
+            run(saver, "4", "a")
+            saver.delete_thread("3")
+            done.set()
+
+        threading.Thread(target=write, daemon=True).start()
+        assert done.wait(10), "writes blocked by compaction"
+        release.set()
+        saver._compactor.join()
+        assert saver._generation == 1
+        assert os.path.getsize(path) == saver._end
+        # the records written meanwhile were copied to the new log
+        assert values(saver, "3") == {}
+        assert values(saver, "4") == {"value": "a!"}
+        run(saver, "5", "b")
+    with FileSaver(path) as saver:
+        assert values(saver, "0") == values(saver, "3") == {}
+        assert values(saver, "4") == {"value": "a!"}
+        assert values(saver, "5") == {"value": "b!"}
+
+
+def test_background_compaction_is_dropped_after_foreground_one(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    path = tmp_path / "log"
+    writing = threading.Event()
+    release = threading.Event()
+    write_records = file_module._write_records
+
+    def slow_write_records(fd: int, records: Any) -> int:
+        if threading.current_thread() is not threading.main_thread():
+            writing.set()
+            assert release.wait(10)
+        return write_records(fd, records)
+
+    monkeypatch.setattr(file_module, "_write_records", slow_write_records)
+    with FileSaver(path, compaction_min_bytes=1, compaction_ratio=0.5) as saver:
+        for i in range(4):
+            run(saver, str(i))
+        for i in range(3):
+            saver.delete_thread(str(i))
+        assert writing.wait(10)
+        saver.compact()
+        release.set()
+        saver._compactor.join()
+        assert saver._generation == 1
+        assert not os.path.exists(str(path) + ".compact-background")
+        assert values(saver, "3") == {"value": "x" * 1000 + "!"}
@@ -0,0 +1,104 @@
+import asyncio
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+import pytest
+
+from langgraph.checkpoint.groupcommit import GroupCommitSaver
+from langgraph.checkpoint.memory import InMemorySaver
+
+
+class Recording(InMemorySaver):
+    """Records the calls of each batch, taking `delay` seconds per call."""
+
+    def __init__(self, delay: float = 0.0) -> None:
+        super().__init__()
+        self.delay = delay
+        self.batches: list[list[str]] = []
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        self.batches.append([])
+        yield
+
+    def delete_thread(self, thread_id: str) -> None:
+        if thread_id == "fail":
+            raise ValueError("failed")
+        time.sleep(self.delay)
+        self.batches[-1].append(thread_id)
+
+
+def test_lone_call_is_not_delayed() -> None:
+    saver = Recording()
+    with GroupCommitSaver(saver, max_delay=1.0) as checkpointer:
+        for i in range(3):
+            started = time.perf_counter()
+            checkpointer.delete_thread(str(i))
+            assert time.perf_counter() - started < 0.5
+    assert saver.batches == [["0"], ["1"], ["2"]]
+
+
+def test_calls_queued_during_a_write_are_batched() -> None:
+    saver = Recording(delay=0.05)
+    with GroupCommitSaver(saver, max_delay=0.05) as checkpointer:
+        threads = [
+            threading.Thread(target=checkpointer.delete_thread, args=(str(i),))
+            for i in range(20)
+        ]
+        for thread in threads:
+            thread.start()
+            time.sleep(0.005)
+        for thread in threads:
+            thread.join()
+    assert sorted(sum(saver.batches, []), key=int) == [str(i) for i in range(20)]
+    assert len(saver.batches) < 10
+
+
+def test_batches_are_capped() -> None:
+    saver = Recording(delay=0.01)
+    with GroupCommitSaver(saver, max_batch_size=3) as checkpointer:
+        futures = [checkpointer._submit(saver.delete_thread, str(i)) for i in range(10)]
+        for future in futures:
+            future.result()
+    assert max(len(batch) for batch in saver.batches) == 3
+    # calls are applied in the order they were queued
+    assert sum(saver.batches, []) == [str(i) for i in range(10)]
+
+
+def test_failed_call_only_fails_its_caller() -> None:
+    saver = Recording(delay=0.01)
+    with GroupCommitSaver(saver) as checkpointer:
+        futures = [
+            checkpointer._submit(saver.delete_thread, thread_id)
+            for thread_id in ["a", "fail", "b"]
+        ]
+        assert futures[0].result() is None
+        with pytest.raises(ValueError):
+            futures[1].result()
+        assert futures[2].result() is None
+
+
+def test_async_calls() -> None:
+    saver = Recording()
+
+    async def run() -> None:
+        with GroupCommitSaver(saver, max_delay=1.0) as checkpointer:
+            started = time.perf_counter()
+            await checkpointer.adelete_thread("a")
+            assert time.perf_counter() - started < 0.5
+            await asyncio.gather(
+                *(checkpointer.adelete_thread(str(i)) for i in range(5))
+            )
+
+    asyncio.run(run())
+    assert sorted(sum(saver.batches, [])) == ["0", "1", "2", "3", "4", "a"]
+
+
+def test_closed_saver_rejects_calls() -> None:
+    checkpointer = GroupCommitSaver(Recording())
+    checkpointer.delete_thread("a")
+    checkpointer.close()
+    with pytest.raises(RuntimeError):
+        checkpointer.delete_thread("b")
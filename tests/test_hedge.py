@@ -0,0 +1,175 @@
+import asyncio
+import threading
+import time
+from typing import Any
+
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage
+from typing_extensions import TypedDict
+
+from langgraph.checkpoint.memory import InMemorySaver
+from langgraph.config import get_stream_writer
+from langgraph.graph import START, StateGraph
+from langgraph.types import Command, HedgePolicy, interrupt
+
+# hedge every run after the first one, 50ms in
+POLICY = HedgePolicy(min_samples=1, percentile=0, min_delay=0.05, max_hedge_rate=1.0)
+
+
+class State(TypedDict):
+    value: Any
+
+
+class Calls:
+    """Numbers the calls of a node, sleeping for some of them."""
+
+    def __init__(self, sleeps: dict[int, float]) -> None:
+        self.sleeps = sleeps
+        self.count = 0
+        self.lock = threading.Lock()
+
+    def __call__(self) -> int:
+        with self.lock:
+            self.count += 1
+            call = self.count
+        time.sleep(self.sleeps.get(call, 0))
+        return call
+
+
+def build(calls: Calls, **kwargs: Any) -> Any:
+    def node(state: State) -> State:
+        call = calls()
+        get_stream_writer()(call)
+        return {"value": call}
+
+    builder = StateGraph(State)
+    builder.add_node("node", node, hedge_policy=POLICY)
+    builder.add_edge(START, "node")
+    return builder.compile(**kwargs)
+
+
+def run(graph: Any) -> tuple[Any, list[Any]]:
+    values, custom = None, []
+    for mode, chunk in graph.stream({"value": 0}, stream_mode=["values", "custom"]):
+        if mode == "values":
+            values = chunk
+        else:
+            custom.append(chunk)
+    return values, custom
+
+
+def test_second_attempt_wins() -> None:
+    graph = build(Calls({2: 0.5}))
+    assert run(graph) == ({"value": 1}, [1])
+    # the first attempt is call 2, the hedge is call 3
+    assert run(graph) == ({"value": 3}, [3])
+    node = graph.hedged_nodes["node"]
+    assert node.stats()["hedged"] == 1
+    assert node.stats()["wins"] == 1
+    # the latency of the losing attempt isn't recorded
+    assert max(node.latencies) < 0.5
+
+
+def test_first_attempt_wins() -> None:
+    graph = build(Calls({2: 0.2, 3: 1.0}))
+    assert run(graph) == ({"value": 1}, [1])
+    assert run(graph) == ({"value": 2}, [2])
+    stats = graph.hedged_nodes["node"].stats()
+    assert stats["hedged"] == 1
+    assert stats["wins"] == 0
+
+
+def test_second_attempt_wins_async() -> None:
+    graph = build(Calls({2: 0.5}))
+
+    async def arun() -> tuple[Any, list[Any]]:
+        values, custom = None, []
+        async for mode, chunk in graph.astream(
+            {"value": 0}, stream_mode=["values", "custom"]
+        ):
+            if mode == "values":
+                values = chunk
+            else:
+                custom.append(chunk)
+        return values, custom
+
+    assert asyncio.run(arun()) == ({"value": 1}, [1])
+    assert asyncio.run(arun()) == ({"value": 3}, [3])
+    assert graph.hedged_nodes["node"].stats()["wins"] == 1
+
+
+def test_interrupt_of_winner_is_replayed() -> None:
+    # calls 3 and 5 are the slow first attempts of the second thread
+    calls = Calls({3: 0.5, 5: 0.5})
+
+    def node(state: State) -> State:
+        calls()
+        return {"value": interrupt("question")}
+
+    builder = StateGraph(State)
+    builder.add_node("node", node, hedge_policy=POLICY)
+    builder.add_edge(START, "node")
+    graph = builder.compile(checkpointer=InMemorySaver())
+
+    for thread_id in ("1", "2"):
+        config = {"configurable": {"thread_id": thread_id}}
+        result = graph.invoke({"value": 0}, config)
+        assert [i.value for i in result["__interrupt__"]] == ["question"]
+        assert graph.invoke(Command(resume=thread_id), config) == {"value": thread_id}
+        assert graph.get_state(config).values == {"value": thread_id}
+    assert calls.count == 6
+    stats = graph.hedged_nodes["node"].stats()
+    assert stats["hedged"] == stats["wins"] == 2
+
+
+def test_hedged_runs_keep_callbacks() -> None:
+    model = GenericFakeChatModel(
+        messages=iter([AIMessage(content=f"answer {i}") for i in range(2)])
+    )
+
+    def node(state: State) -> State:
+        return {"value": model.invoke("question").content}
+
+    builder = StateGraph(State)
+    builder.add_node(
+        "node",
+        node,
+        hedge_policy=HedgePolicy(min_samples=1, min_delay=10, max_hedge_rate=1.0),
+    )
+    builder.add_edge(START, "node")
+    graph = builder.compile()
+
+    for i in range(2):
+        chunks = [
+            chunk.content
+            for chunk, _ in graph.stream({"value": 0}, stream_mode="messages")
+        ]
+        assert "".join(chunks) == f"answer {i}"
+    assert graph.hedged_nodes["node"].stats()["delay"] == 10
+
+
+def test_busy_executor_runs_attempt_in_calling_thread() -> None:
+    # with a single thread, the first attempt of a task can't start while the
+    # other task is queued, so it's run by the task itself
+    calls = Calls({})
+
+    class Pair(TypedDict):
+        a: int
+        b: int
+
+    builder = StateGraph(Pair)
+    builder.add_node("a", lambda state: {"a": calls()}, hedge_policy=POLICY)
+    builder.add_node("b", lambda state: {"b": calls()}, hedge_policy=POLICY)
+    builder.add_edge(START, "a")
+    builder.add_edge(START, "b")
+    graph = builder.compile()
+    graph.invoke({"a": 0, "b": 0})
+
+    done = threading.Event()
+
+    def invoke() -> None:
+        graph.invoke({"a": 0, "b": 0}, {"max_concurrency": 1})
+        done.set()
+
+    threading.Thread(target=invoke, daemon=True).start()
+    assert done.wait(10), "run deadlocked"
@@ -0,0 +1,60 @@
+import asyncio
+import time
+from typing import Any
+
+import pytest
+from typing_extensions import TypedDict
+
+from langgraph.graph import START, StateGraph
+from langgraph.types import RetryPolicy
+
+RETRY = RetryPolicy(initial_interval=0.2, jitter=False, retry_on=ValueError)
+
+
+class State(TypedDict):
+    value: str
+
+
+def build(fail: int) -> Any:
+    """A graph whose node fails `fail` times, then takes 50ms."""
+    calls = 0
+
+    def node(state: State) -> State:
+        nonlocal calls
+        calls += 1
+        if calls <= fail:
+            raise ValueError("flaky")
+        time.sleep(0.05)
+        return {"value": state["value"] + "!"}
+
+    builder = StateGraph(State)
+    builder.add_node("node", node, retry_policy=RETRY)
+    builder.add_edge(START, "node")
+    return builder.compile()
+
+
+def events(chunks: list) -> tuple[dict, dict]:
+    task, step = [c for c in chunks if c["type"] in ("task", "step")][-2:]
+    return task, step
+
+
+@pytest.mark.parametrize("fail", [0, 1])
+def test_backoff_is_reported_apart_from_duration(fail: int) -> None:
+    task, step = events(list(build(fail).stream({"value": "a"}, stream_mode="profile")))
+    assert task["name"] == "node"
+    assert task["attempts"] == fail + 1
+    assert task["backoff"] == pytest.approx(0.2 * fail)
+    assert 0.05 <= task["duration"] < 0.15
+    assert step["backoff"] == task["backoff"]
+    assert step["task_time"] == task["duration"]
+
+
+def test_async_backoff_is_reported_apart_from_duration() -> None:
+    async def run() -> list:
+        graph = build(1)
+        return [c async for c in graph.astream({"value": "a"}, stream_mode="profile")]
+
+    task, step = events(asyncio.run(run()))
+    assert task["attempts"] == 2
+    assert task["backoff"] == pytest.approx(0.2)
+    assert 0.05 <= task["duration"] < 0.15
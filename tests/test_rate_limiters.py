@@ -0,0 +1,256 @@
+import asyncio
+import json
+import os
+import threading
+import time
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+import pytest
+from langchain_core import rate_limiters
+from langchain_core.rate_limiters import SharedMemoryRateLimiter, TokenRateLimiter
+
+
+def in_child(fn) -> int:
+    """Runs a function in a forked process, and returns its exit code."""
+    pid = os.fork()
+    if pid == 0:
+        try:
+            code = fn()
+        except BaseException:
+            code = 99
+        os._exit(code)
+    _, status = os.waitpid(pid, 0)
+    return os.waitstatus_to_exitcode(status)
+
+
+@pytest.mark.parametrize(
+    "kwargs", [{"requests_per_second": 0}, {"max_bucket_size": 0.5}]
+)
+def test_shared_memory_invalid_arguments(tmp_path: Path, kwargs: dict) -> None:
+    with pytest.raises(ValueError):
+        SharedMemoryRateLimiter(tmp_path / "bucket", **kwargs)
+
+
+def test_shared_memory_budget_is_shared(tmp_path: Path) -> None:
+    limiter = SharedMemoryRateLimiter(
+        tmp_path / "bucket", requests_per_second=10, max_bucket_size=2
+    )
+    time.sleep(0.25)
+    # the child takes both tokens of the bucket
+    assert in_child(lambda: 0 if limiter.acquire(blocking=False) else 1) == 0
+    assert in_child(lambda: 0 if limiter.acquire(blocking=False) else 1) == 0
+    assert not limiter.acquire(blocking=False)
+    other = SharedMemoryRateLimiter(
+        tmp_path / "bucket", requests_per_second=10, max_bucket_size=2
+    )
+    assert not other.acquire(blocking=False)
+    started = time.monotonic()
+    assert other.acquire()
+    assert 0.05 < time.monotonic() - started < 0.5
+
+
+def test_shared_memory_forked_child_reopens_file(tmp_path: Path) -> None:
+    limiter = SharedMemoryRateLimiter(tmp_path / "bucket", requests_per_second=100)
+    inherited = limiter._fd
+
+    def child() -> int:
+        limiter.acquire()
+        try:
+            os.fstat(inherited)
+        except OSError:
+            # the inherited file was closed once the child opened its own
+            return 0 if limiter._fd != inherited else 2
+        return 1
+
+    # the lock is held when forking, as if by another thread
+    with limiter._lock:
+        assert in_child(child) == 0
+    # the parent's file is still open
+    os.fstat(limiter._fd)
+    assert limiter.acquire()
+
+
+class FakeOpenAI(ThreadingHTTPServer):
+    """Serves chat completions like the OpenAI API, from a script of replies."""
+
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), FakeOpenAIHandler)
+        self.replies: list[dict[str, Any]] = []
+        # the content of the last message of each request, in arrival order
+        self.received: list[str] = []
+        self.lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/v1"
+
+
+class FakeOpenAIHandler(BaseHTTPRequestHandler):
+    server: FakeOpenAI
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+    def do_POST(self) -> None:
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        with self.server.lock:
+            self.server.received.append(body["messages"][-1]["content"])
+            reply = self.server.replies.pop(0) if self.server.replies else {}
+        time.sleep(reply.get("delay", 0))
+        status = reply.get("status", 200)
+        if status == 200:
+            data: dict[str, Any] = {
+                "id": "chatcmpl-1",
+                "object": "chat.completion",
+                "created": 0,
+                "model": "fake",
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {"role": "assistant", "content": "ok"},
+                        "finish_reason": "stop",
+                    }
+                ],
+                "usage": {
+                    "prompt_tokens": reply.get("tokens", 10) - 1,
+                    "completion_tokens": 1,
+                    "total_tokens": reply.get("tokens", 10),
+                },
+            }
+        else:
+            data = {"error": {"message": "slow down", "type": "rate_limit"}}
+        payload = json.dumps(data).encode()
+        try:
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            for name, value in reply.get("headers", {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(payload)
+        except OSError:
+            # the client went away, e.g. a cancelled call
+            pass
+
+
+@pytest.fixture
+def openai_server() -> Iterator[FakeOpenAI]:
+    server = FakeOpenAI()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def limited_model(server: FakeOpenAI, limiter: TokenRateLimiter) -> Any:
+    langchain_openai = pytest.importorskip("langchain_openai")
+    return langchain_openai.ChatOpenAI(
+        model="fake",
+        base_url=server.url,
+        api_key="fake",
+        max_retries=0,
+        rate_limiter=limiter,
+        callbacks=[limiter],
+        include_response_headers=True,
+    )
+
+
+def token_limiter(**kwargs: Any) -> TokenRateLimiter:
+    kwargs = {"requests_per_minute": 600, "tokens_per_minute": 6000, **kwargs}
+    # every prompt is estimated at 100 tokens
+    return TokenRateLimiter(estimate_tokens=lambda messages: 100, **kwargs)
+
+
+def test_token_estimate_is_corrected_by_usage(openai_server: FakeOpenAI) -> None:
+    limiter = token_limiter()
+    model = limited_model(openai_server, limiter)
+    openai_server.replies.append({"tokens": 30})
+    model.invoke("hello")
+    # 100 tokens were charged, and 70 refunded
+    assert limiter.available_tokens == pytest.approx(5970, abs=5)
+    assert limiter.available_requests == pytest.approx(599, abs=0.5)
+    openai_server.replies.append({"tokens": 250})
+    model.invoke("hello")
+    assert limiter.available_tokens == pytest.approx(5720, abs=5)
+    assert limiter._charged == {}
+
+
+def test_token_limiter_follows_rate_limit_headers(openai_server: FakeOpenAI) -> None:
+    limiter = token_limiter()
+    model = limited_model(openai_server, limiter)
+    openai_server.replies.append(
+        {
+            "headers": {
+                "x-ratelimit-remaining-requests": "0",
+                "x-ratelimit-reset-requests": "300ms",
+                "x-ratelimit-remaining-tokens": "2000",
+                "x-ratelimit-reset-tokens": "20s",
+            }
+        }
+    )
+    model.invoke("hello")
+    assert limiter.available_tokens == pytest.approx(2000, abs=5)
+    assert limiter.available_requests < 1
+    started = time.monotonic()
+    model.invoke("hello")
+    assert 0.25 < time.monotonic() - started < 1
+
+
+def test_token_limiter_pauses_after_429(openai_server: FakeOpenAI) -> None:
+    openai = pytest.importorskip("openai")
+    limiter = token_limiter()
+    model = limited_model(openai_server, limiter)
+    openai_server.replies.append({"status": 429, "headers": {"retry-after": "0.3"}})
+    with pytest.raises(openai.RateLimitError):
+        model.invoke("hello")
+    # the rejected request's tokens are refunded
+    assert limiter.available_tokens == pytest.approx(6000, abs=5)
+    started = time.monotonic()
+    model.invoke("hello")
+    assert 0.25 < time.monotonic() - started < 1
+
+
+def test_token_limiter_wakes_waiters_in_order(openai_server: FakeOpenAI) -> None:
+    # one request every 50ms, once the bucket is empty
+    limiter = token_limiter(requests_per_minute=1200)
+    model = limited_model(openai_server, limiter)
+    started = time.monotonic()
+    with limiter._lock:
+        limiter._refill(started)
+        limiter.available_requests = 0
+    threads = [threading.Thread(target=model.invoke, args=(str(i),)) for i in range(5)]
+    for thread in threads:
+        thread.start()
+        time.sleep(0.01)
+    for thread in threads:
+        thread.join()
+    assert openai_server.received == [str(i) for i in range(5)]
+    assert 0.2 < time.monotonic() - started < 1
+
+
+def test_token_limiter_forgets_cancelled_calls(
+    openai_server: FakeOpenAI, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    limiter = token_limiter()
+    model = limited_model(openai_server, limiter)
+    openai_server.replies.append({"delay": 1})
+
+    async def cancel() -> None:
+        task = asyncio.ensure_future(model.ainvoke("slow"))
+        await asyncio.sleep(0.2)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(cancel())
+    # the call ended without reporting its usage
+    assert len(limiter._charged) == 1
+    monkeypatch.setattr(rate_limiters, "_MAX_CHARGE_AGE", 0.1)
+    time.sleep(0.2)
+    model.invoke("hello")
+    assert limiter._charged == {}
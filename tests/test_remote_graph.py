@@ -0,0 +1,270 @@
+import asyncio
+import contextvars
+import json
+import re
+import threading
+import time
+from collections import Counter
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+import pytest
+
+from langgraph.pregel.remote import RemoteGraph
+from langgraph.types import StateUpdate
+
+READ = re.compile(r"^/threads/([^/]+)/state(/checkpoint)?$")
+STREAM = re.compile(r"^/threads/([^/]+)/runs/stream$")
+
+
+class StandIn(ThreadingHTTPServer):
+    """Serves the thread state endpoints of the API, from memory."""
+
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), Handler)
+        self.lock = threading.Lock()
+        self.values: dict[str, dict[str, Any]] = {}
+        self.versions: Counter = Counter()
+        self.reads: Counter = Counter()
+        # how long reads take, after reading the state
+        self.delay = 0.0
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def state(self, thread_id: str) -> dict[str, Any]:
+        with self.lock:
+            self.reads[thread_id] += 1
+            return {
+                "values": dict(self.values.get(thread_id, {})),
+                "next": [],
+                "checkpoint": self.checkpoint(thread_id),
+                "metadata": {},
+                "created_at": None,
+                "parent_checkpoint": None,
+                "tasks": [],
+                "interrupts": [],
+            }
+
+    def write(self, thread_id: str, values: dict[str, Any]) -> dict[str, Any]:
+        with self.lock:
+            self.values.setdefault(thread_id, {}).update(values)
+            self.versions[thread_id] += 1
+            return self.checkpoint(thread_id)
+
+    def checkpoint(self, thread_id: str) -> dict[str, Any]:
+        return {
+            "thread_id": thread_id,
+            "checkpoint_ns": "",
+            "checkpoint_id": str(self.versions[thread_id]),
+        }
+
+
+class Handler(BaseHTTPRequestHandler):
+    server: StandIn
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        if match := READ.match(self.path.split("?")[0]):
+            self.read(match.group(1))
+        else:
+            self.send_error(404)
+
+    def do_POST(self) -> None:
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        path = self.path.split("?")[0]
+        if (match := READ.match(path)) and match.group(2):
+            self.read(match.group(1))
+        elif match := READ.match(path):
+            checkpoint = self.server.write(match.group(1), body["values"])
+            self.reply({"checkpoint": checkpoint})
+        elif match := STREAM.match(path):
+            self.server.write(match.group(1), body["input"])
+            state = self.server.state(match.group(1))
+            events = (
+                b"event: metadata\ndata: {}\n\n"
+                + b"event: values\ndata: "
+                + json.dumps(state["values"]).encode()
+                + b"\n\n"
+            )
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Content-Length", str(len(events)))
+            self.end_headers()
+            self.wfile.write(events)
+        else:
+            self.send_error(404)
+
+    def read(self, thread_id: str) -> None:
+        state = self.server.state(thread_id)
+        time.sleep(self.server.delay)
+        self.reply(state)
+
+    def reply(self, body: Any) -> None:
+        data = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+@pytest.fixture
+def server() -> Iterator[StandIn]:
+    server = StandIn()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def config(thread_id: str) -> dict[str, Any]:
+    return {"configurable": {"thread_id": thread_id}}
+
+
+def read_together(graphs: list[RemoteGraph], thread_id: str) -> list[Any]:
+    with ThreadPoolExecutor(len(graphs)) as executor:
+        return list(executor.map(lambda g: g.get_state(config(thread_id)), graphs))
+
+
+def test_concurrent_reads_share_a_request(server: StandIn) -> None:
+    server.write("t", {"a": 1})
+    server.delay = 0.2
+    graph = RemoteGraph("agent", url=server.url)
+    states = read_together([graph] * 8, "t")
+    assert server.reads["t"] == 1
+    assert all(state.values == {"a": 1} for state in states)
+    # each caller gets its own copy
+    states[0].values["a"] = 2
+    assert states[1].values == {"a": 1}
+
+
+def test_concurrent_reads_share_a_request_async(server: StandIn) -> None:
+    server.write("t", {"a": 1})
+    server.delay = 0.2
+    graph = RemoteGraph("agent", url=server.url)
+
+    async def read() -> list[Any]:
+        return await asyncio.gather(*(graph.aget_state(config("t")) for _ in range(8)))
+
+    states = asyncio.run(read())
+    assert server.reads["t"] == 1
+    assert all(state.values == {"a": 1} for state in states)
+
+
+def test_reads_without_coalescing(server: StandIn) -> None:
+    server.delay = 0.1
+    graph = RemoteGraph("agent", url=server.url, coalesce_reads=False)
+    read_together([graph] * 4, "t")
+    assert server.reads["t"] == 4
+
+
+def test_update_drops_shared_reads(server: StandIn) -> None:
+    server.write("t", {"a": 1})
+    server.delay = 0.3
+    graph = RemoteGraph("agent", url=server.url)
+    with ThreadPoolExecutor(1) as executor:
+        before = executor.submit(graph.get_state, config("t"))
+        time.sleep(0.1)
+        graph.update_state(config("t"), {"a": 2})
+        # a read made after the update doesn't join the one made before it
+        after = graph.get_state(config("t"))
+    assert before.result().values == {"a": 1}
+    assert after.values == {"a": 2}
+    assert server.reads["t"] == 2
+
+
+def test_stream_drops_shared_reads(server: StandIn) -> None:
+    server.write("t", {"a": 1})
+    server.delay = 0.3
+    graph = RemoteGraph("agent", url=server.url)
+    with ThreadPoolExecutor(1) as executor:
+        before = executor.submit(graph.get_state, config("t"))
+        time.sleep(0.1)
+        assert list(graph.stream({"a": 3}, config("t"), stream_mode="values")) == [
+            {"a": 3}
+        ]
+        after = graph.get_state(config("t"))
+    assert before.result().values == {"a": 1}
+    assert after.values == {"a": 3}
+
+
+def test_copies_share_reads(server: StandIn) -> None:
+    server.delay = 0.2
+    graph = RemoteGraph("agent", url=server.url)
+    copy = graph.with_config({"configurable": {"user": "1"}})
+    read_together([graph, copy, graph, copy], "t")
+    assert server.reads["t"] == 1
+
+
+def test_copies_with_other_clients_do_not_share_reads(server: StandIn) -> None:
+    server.delay = 0.2
+    graph = RemoteGraph("agent", url=server.url)
+    other = graph.copy(
+        {"sync_client": RemoteGraph("agent", url=server.url).sync_client}
+    )
+    read_together([graph, other], "t")
+    assert server.reads["t"] == 2
+
+
+def test_many_threads(server: StandIn) -> None:
+    graph = RemoteGraph("agent", url=server.url)
+    configs = graph.update_states(
+        [(config(str(i)), {"i": i}, None) for i in range(20)], max_concurrency=4
+    )
+    assert [c["configurable"]["thread_id"] for c in configs] == [
+        str(i) for i in range(20)
+    ]
+    states = graph.get_states([config(str(i)) for i in range(20)])
+    assert [state.values for state in states] == [{"i": i} for i in range(20)]
+
+
+def test_many_threads_keep_context(server: StandIn) -> None:
+    var: contextvars.ContextVar[str] = contextvars.ContextVar("var")
+    seen: list[str] = []
+
+    class Recording(RemoteGraph):
+        def get_state(self, config: Any, **kwargs: Any) -> Any:
+            seen.append(var.get("unset"))
+            return super().get_state(config, **kwargs)
+
+    graph = Recording("agent", url=server.url)
+    var.set("set")
+    graph.get_states([config("a"), config("b")])
+    assert seen == ["set", "set"]
+
+
+def test_bulk_update_state(server: StandIn) -> None:
+    graph = RemoteGraph("agent", url=server.url)
+    updated = graph.bulk_update_state(
+        config("t"), [[StateUpdate({"a": 1})], [StateUpdate({"b": 2}, "node")]]
+    )
+    assert updated["configurable"]["checkpoint_id"] == "2"
+    assert graph.get_state(config("t")).values == {"a": 1, "b": 2}
+
+
+@pytest.mark.parametrize(
+    "updates, error",
+    [
+        ([], ValueError),
+        ([[StateUpdate({"a": 1}), StateUpdate({"b": 2})]], NotImplementedError),
+        ([[StateUpdate({"a": 1}, "node", "task")]], NotImplementedError),
+    ],
+)
+def test_bulk_update_state_unsupported(
+    server: StandIn, updates: Any, error: type[Exception]
+) -> None:
+    graph = RemoteGraph("agent", url=server.url)
+    with pytest.raises(error):
+        graph.bulk_update_state(config("t"), updates)
+    with pytest.raises(error):
+        asyncio.run(graph.abulk_update_state(config("t"), updates))
+    assert server.versions["t"] == 0
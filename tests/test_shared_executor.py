@@ -0,0 +1,33 @@
+import threading
+
+from langgraph.func import entrypoint, task
+from langgraph.pregel import SharedExecutor
+
+
+def test_task_calls_do_not_exhaust_shared_executor() -> None:
+    # each run blocks a thread of the pool on a child task, with more runs
+    # than threads the children must not be queued behind their parents
+    @task
+    def double(x: int) -> int:
+        return x * 2
+
+    @entrypoint()
+    def workflow(x: int) -> int:
+        return double(x).result() + double(x + 1).result()
+
+    results: dict[int, int] = {}
+    executor = SharedExecutor(max_workers=2)
+    config = {"configurable": {"__pregel_executor": executor}}
+
+    def run(i: int) -> None:
+        results[i] = workflow.invoke(i, config)
+
+    threads = [threading.Thread(target=run, args=(i,), daemon=True) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=10)
+    # don't wait for deadlocked threads
+    executor.shutdown(wait=False)
+    assert not any(thread.is_alive() for thread in threads), "runs deadlocked"
+    assert results == {i: 4 * i + 2 for i in range(4)}
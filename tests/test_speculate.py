@@ -0,0 +1,154 @@
+import asyncio
+import threading
+import time
+from collections import Counter
+from typing import Any
+
+from typing_extensions import TypedDict
+
+from langgraph.config import get_stream_writer
+from langgraph.graph import END, START, StateGraph
+
+
+class State(TypedDict, total=False):
+    review: str
+    sentiment: str
+    response: str
+
+
+def build(
+    calls: Counter, finished: list[str] | None = None, fail: set[str] = frozenset()
+) -> Any:
+    def classify(state: State) -> State:
+        time.sleep(0.1)
+        return {"sentiment": "negative" if "bad" in state["review"] else "positive"}
+
+    def respond(name: str, sleep: float) -> Any:
+        def node(state: State) -> State:
+            calls[name] += 1
+            if name in fail and calls[name] == 1:
+                raise ValueError("first run fails")
+            get_stream_writer()(name)
+            time.sleep(sleep)
+            if finished is not None:
+                finished.append(name)
+            return {"response": f"{name}: {state['review']}"}
+
+        return node
+
+    builder = StateGraph(State)
+    builder.add_node("classify", classify)
+    builder.add_node("positive", respond("positive", 0.05))
+    builder.add_node("negative", respond("negative", 0.3))
+    builder.add_edge(START, "classify")
+    builder.add_conditional_edges(
+        "classify",
+        lambda state: state["sentiment"],
+        {"positive": "positive", "negative": "negative"},
+        speculate=["positive", "negative"],
+    )
+    builder.add_edge("positive", END)
+    builder.add_edge("negative", END)
+    return builder.compile()
+
+
+def run(graph: Any, review: str) -> tuple[Any, list[Any]]:
+    values, custom = None, []
+    for mode, chunk in graph.stream(
+        {"review": review}, stream_mode=["values", "custom"]
+    ):
+        if mode == "values":
+            values = chunk
+        else:
+            custom.append(chunk)
+    return values, custom
+
+
+def test_picked_target_uses_speculative_run() -> None:
+    calls: Counter = Counter()
+    values, custom = run(build(calls), "good")
+    assert values["response"] == "positive: good"
+    # only the output of the run whose result is used is streamed
+    assert custom == ["positive"]
+    assert calls == {"positive": 1, "negative": 1}
+
+
+def test_run_waits_for_started_targets_that_were_not_picked() -> None:
+    calls: Counter = Counter()
+    finished: list[str] = []
+    values, _ = run(build(calls, finished), "good")
+    assert values["response"] == "positive: good"
+    assert sorted(finished) == ["negative", "positive"]
+
+
+def test_failed_speculative_run_is_run_again() -> None:
+    calls: Counter = Counter()
+    values, custom = run(build(calls, fail={"negative"}), "bad")
+    assert values["response"] == "negative: bad"
+    assert custom == ["negative"]
+    assert calls["negative"] == 2
+
+
+def test_changed_state_runs_target_again() -> None:
+    calls: Counter = Counter()
+
+    def classify(state: State) -> State:
+        time.sleep(0.1)
+        return {"sentiment": "positive"}
+
+    def rewrite(state: State) -> State:
+        return {"review": state["review"].upper()}
+
+    def positive(state: State) -> State:
+        calls["positive"] += 1
+        return {"response": state["review"]}
+
+    builder = StateGraph(State)
+    builder.add_node("classify", classify)
+    builder.add_node("rewrite", rewrite)
+    builder.add_node("positive", positive)
+    builder.add_edge(START, "classify")
+    builder.add_edge(START, "rewrite")
+    builder.add_conditional_edges(
+        "classify", lambda state: "positive", ["positive"], speculate=["positive"]
+    )
+    graph = builder.compile()
+    # the speculative run read the review before it was rewritten
+    assert graph.invoke({"review": "good"})["response"] == "GOOD"
+    assert calls["positive"] == 2
+
+
+def test_picked_target_uses_speculative_run_async() -> None:
+    calls: Counter = Counter()
+    graph = build(calls)
+
+    async def arun() -> tuple[Any, list[Any]]:
+        values, custom = None, []
+        async for mode, chunk in graph.astream(
+            {"review": "bad"}, stream_mode=["values", "custom"]
+        ):
+            if mode == "values":
+                values = chunk
+            else:
+                custom.append(chunk)
+        return values, custom
+
+    values, custom = asyncio.run(arun())
+    assert values["response"] == "negative: bad"
+    assert custom == ["negative"]
+    assert calls["negative"] == 1
+
+
+def test_busy_executor_runs_target_in_task() -> None:
+    calls: Counter = Counter()
+    graph = build(calls)
+    done = threading.Event()
+    result: dict[str, Any] = {}
+
+    def invoke() -> None:
+        result.update(graph.invoke({"review": "bad"}, {"max_concurrency": 1}))
+        done.set()
+
+    threading.Thread(target=invoke, daemon=True).start()
+    assert done.wait(10), "run deadlocked"
+    assert result["response"] == "negative: bad"
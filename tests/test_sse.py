@@ -0,0 +1,100 @@
+import random
+
+import pytest
+from langgraph_sdk.sse import BytesLineDecoder, ChunkedSSEDecoder, SSEDecoder
+
+FIELDS = [
+    b"event: values",
+    b"event:messages",
+    b"event:",
+    b"id: 7",
+    b"id:",
+    b"id: a\0b",
+    b"retry: 10",
+    b"retry: soon",
+    b": a comment",
+    b"other: field",
+    b"data",
+    b"event",
+]
+# data fields whose concatenation is valid JSON, or empty
+DIGITS = [b"data: 1", b"data:42", b"data:", b"data: "]
+VALUES = [
+    b'data: {"a": [1, "x: y"], "b": null}',
+    b'data:["messages", {"content": " word"}]',
+]
+NEWLINES = [b"\n", b"\r", b"\r\n"]
+
+
+def stream(rng: random.Random) -> bytes:
+    """A random stream of events, in and out of the usual layout."""
+    lines: list[bytes] = []
+    for _ in range(rng.randint(0, 12)):
+        fields = rng.sample(FIELDS, rng.randint(0, 3))
+        if rng.random() < 0.5:
+            fields.append(rng.choice(VALUES))
+        else:
+            fields.extend(rng.choices(DIGITS, k=rng.randint(0, 3)))
+        rng.shuffle(fields)
+        lines.extend(fields)
+        lines.extend([b""] * rng.randint(0, 2))
+    body = b"".join(line + rng.choice(NEWLINES) for line in lines)
+    # the body may be cut anywhere, e.g. by a dropped connection
+    if body and rng.random() < 0.5:
+        body = body[: rng.randint(0, len(body))]
+    return body
+
+
+def chunks(body: bytes, rng: random.Random) -> list[bytes]:
+    cuts = (
+        sorted(rng.sample(range(1, len(body)), min(len(body) - 1, 6))) if body else []
+    )
+    return [body[a:b] for a, b in zip([0, *cuts], [*cuts, len(body)])]
+
+
+def decode_lines(body: list[bytes]) -> list:
+    """The events decoded line by line, as the client used to."""
+    lines = BytesLineDecoder()
+    decoder = SSEDecoder()
+    parts = []
+    for chunk in body:
+        for line in lines.decode(chunk):
+            if (part := decoder.decode(bytes(line).rstrip(b"\n"))) is not None:
+                parts.append(part)
+    for line in lines.flush():
+        if (part := decoder.decode(bytes(line).rstrip(b"\n"))) is not None:
+            parts.append(part)
+    if (part := decoder.decode(b"")) is not None:
+        parts.append(part)
+    return parts
+
+
+def decode_chunks(body: list[bytes]) -> list:
+    decoder = ChunkedSSEDecoder()
+    parts = []
+    for chunk in body:
+        parts.extend(decoder.decode(chunk))
+    parts.extend(decoder.flush())
+    return parts
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_chunked_decoder_matches_line_decoder(seed: int) -> None:
+    rng = random.Random(seed)
+    for _ in range(200):
+        body = chunks(stream(rng), rng)
+        try:
+            expected = decode_lines(body)
+        except ValueError:
+            # data cut in the middle of a JSON value
+            with pytest.raises(ValueError):
+                decode_chunks(body)
+            continue
+        assert decode_chunks(body) == expected, body
+
+
+def test_trailing_empty_data_is_not_an_event() -> None:
+    # a body cut after an empty data field
+    body = [b'event: values\ndata: {"a": 1}\n\ndata:']
+    assert decode_lines(body) == decode_chunks(body)
+    assert [part.event for part in decode_chunks(body)] == ["values"]
@@ -0,0 +1,146 @@
+import zlib
+from typing import Any
+
+import numpy as np
+import pytest
+
+from langgraph.store.memory import InMemoryStore
+
+DIMS = 8
+
+
+def embed(texts: list[str]) -> list[list[float]]:
+    """Embeds each text as a random vector, seeded by the text."""
+    return [
+        np.random.default_rng(zlib.crc32(text.encode())).normal(size=DIMS).tolist()
+        for text in texts
+    ]
+
+
+def make_store(ann: dict[str, Any] | None = None) -> InMemoryStore:
+    index: dict[str, Any] = {"dims": DIMS, "embed": embed}
+    if ann is not None:
+        index["ann_index_config"] = ann
+    return InMemoryStore(index=index)
+
+
+def fill(store: InMemoryStore, namespace: tuple[str, ...], count: int) -> None:
+    for i in range(count):
+        store.put(namespace, str(i), {"text": f"{namespace} {i}"})
+
+
+def ranked(
+    store: InMemoryStore, prefix: tuple[str, ...], query: str, **kwargs: Any
+) -> list[tuple[tuple[str, ...], str, float]]:
+    return [
+        (item.namespace, item.key, round(item.score, 6))
+        for item in store.search(prefix, query=query, limit=500, **kwargs)
+    ]
+
+
+def linear(store: InMemoryStore) -> InMemoryStore:
+    """A store with the same items, searched without the vector index."""
+    copy = make_store()
+    copy._data, copy._vectors = store._data, store._vectors
+    copy._use_vector_index = False
+    return copy
+
+
+def test_ann_params_stay_out_of_index_config() -> None:
+    store = make_store({"kind": "ivfflat", "nlist": 4})
+    assert set(store.index_config) == {
+        "dims",
+        "embed",
+        "ann_index_config",
+        "__tokenized_fields",
+    }
+    assert store._ann_params == {"nlist": 4, "nprobe": 2}
+
+
+def test_flat_index_matches_linear_scan() -> None:
+    store = make_store()
+    fill(store, ("a",), 40)
+    fill(store, ("a", "x"), 40)
+    fill(store, ("b",), 40)
+    for prefix in [(), ("a",), ("a", "x"), ("b",), ("c",)]:
+        assert ranked(store, prefix, "query") == ranked(linear(store), prefix, "query")
+    assert ranked(store, ("a",), "query", offset=5) == ranked(
+        linear(store), ("a",), "query", offset=5
+    )
+
+
+def test_ivf_probing_every_cluster_is_exact() -> None:
+    store = make_store({"kind": "ivfflat", "nlist": 4, "nprobe": 4})
+    fill(store, ("a",), 60)
+    fill(store, ("b",), 60)
+    ranked(store, (), "query")
+    assert store._vector_index.centroids is not None
+    for prefix in [(), ("a",), ("b",)]:
+        assert ranked(store, prefix, "query") == ranked(linear(store), prefix, "query")
+
+
+def test_ivf_only_scores_probed_clusters() -> None:
+    store = make_store({"kind": "ivfflat", "nlist": 8, "nprobe": 1})
+    fill(store, ("a",), 200)
+    approx = ranked(store, ("a",), "query")
+    exact = ranked(linear(store), ("a",), "query")
+    assert 0 < len(approx) < len(exact)
+    # the rows of the probed clusters are scored exactly
+    assert set(approx) <= set(exact)
+    assert approx == sorted(approx, key=lambda r: -r[2])
+
+
+def test_ivf_prefix_search_probes_clusters_under_prefix() -> None:
+    store = make_store({"kind": "ivfflat", "nlist": 4, "nprobe": 1})
+    fill(store, ("a",), 100)
+    fill(store, ("b",), 2)
+    for query in ["one", "two", "three"]:
+        assert {ns for ns, _, _ in ranked(store, ("b",), query)} == {("b",)}
+
+
+def test_ivf_is_retrained_when_the_index_doubles() -> None:
+    store = make_store({"kind": "ivfflat", "nlist": 2})
+    fill(store, ("a",), 20)
+    ranked(store, (), "query")
+    index = store._vector_index
+    # clusters are trained at 16 vectors per cluster
+    assert index.centroids is None
+    fill(store, ("b",), 12)
+    assert index.trained_size == 32
+    centroids = index.centroids.copy()
+    fill(store, ("c",), 31)
+    assert index.trained_size == 32
+    fill(store, ("c",), 32)
+    assert index.trained_size == 64
+    assert not np.array_equal(centroids, index.centroids)
+
+
+@pytest.mark.parametrize("ann", [None, {"kind": "ivfflat", "nlist": 2, "nprobe": 2}])
+def test_removed_rows_are_compacted(ann: dict[str, Any] | None) -> None:
+    store = make_store(ann)
+    fill(store, ("a",), 40)
+    ranked(store, (), "query")
+    index = store._vector_index
+    for i in range(20):
+        store.delete(("a",), str(i))
+    assert (index.size, index.removed) == (40, 20)
+    store.delete(("a",), "20")
+    assert (index.size, index.removed) == (19, 0)
+    assert sorted(index.keys) == [(("a",), str(i)) for i in range(21, 40)]
+    # updated items replace their rows
+    store.put(("a",), "39", {"text": "changed"})
+    assert len(index.keys[(("a",), "39")]) == 1
+    assert ranked(store, (), "query") == ranked(linear(store), (), "query")
+
+
+def test_one_index_for_every_prefix() -> None:
+    store = make_store()
+    fill(store, ("a",), 10)
+    fill(store, ("b",), 10)
+    ranked(store, ("a",), "query")
+    index = store._vector_index
+    ranked(store, ("b",), "query")
+    fill(store, ("a", "x"), 10)
+    assert store._vector_index is index
+    assert index.size == 30
+    assert {ns for ns, _, _ in ranked(store, ("a",), "query")} == {("a",), ("a", "x")}